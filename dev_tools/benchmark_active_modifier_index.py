@@ -0,0 +1,57 @@
+"""Compares the previous ml_modifier_active_index getter (scan + find)
+to the current one (memoized, single pass) for stacks of different
+sizes.
+
+Run in Blender with the addon enabled (see benchmark_utils).
+"""
+
+import sys
+from pathlib import Path
+
+import bpy
+
+sys.path.append(str(Path(__file__).resolve().parent))
+
+from benchmark_utils import (
+    add_modifiers,
+    create_mesh_object,
+    print_result_table,
+    remove_object,
+    time_call
+)
+
+
+STACK_SIZES = (10, 100, 1000)
+
+
+def previous_modifier_active_index_get(object):
+    for mod in object.modifiers:
+        if mod.is_active:
+            return object.modifiers.find(mod.name)
+
+    return 0
+
+
+def main():
+    rows = []
+
+    for size in STACK_SIZES:
+        ob = create_mesh_object()
+        add_modifiers(ob, size)
+
+        for position_name, index in (("first", 0), ("middle", size // 2), ("last", size - 1)):
+            ob.ml_modifier_active_index = index
+            assert ob.ml_modifier_active_index == previous_modifier_active_index_get(ob)
+
+            previous = time_call(lambda: previous_modifier_active_index_get(ob), number=100)
+            current = time_call(lambda: ob.ml_modifier_active_index, number=100)
+            rows.append((size, position_name, previous, current, previous / current))
+
+        remove_object(ob)
+
+    print_result_table("ml_modifier_active_index getter (microseconds)",
+                       ("modifiers", "active", "previous", "current", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main()
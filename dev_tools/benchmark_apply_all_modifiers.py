@@ -0,0 +1,83 @@
+"""Compares applying all modifiers one by one with modifier_apply (the
+fallback of the Apply All Modifiers operator) to applying them with a
+single evaluation (the fast path) for stacks of different sizes.
+
+Run in Blender with the addon enabled (see benchmark_utils).
+"""
+
+import sys
+from pathlib import Path
+
+import bpy
+
+sys.path.append(str(Path(__file__).resolve().parent))
+
+from benchmark_utils import add_modifiers, print_result_table, remove_object, time_call
+from modifier_list.modules.operators.object_apply_all_modifiers import (
+    apply_all_modifiers_at_once,
+    can_apply_all_modifiers_at_once
+)
+
+
+STACK_SIZES = (5, 15, 30)
+
+# Cheap modifiers which don't grow the mesh, so the timings show the
+# per-modifier overhead rather than the cost of the modifiers.
+MODIFIER_TYPES = ('DISPLACE', 'SMOOTH', 'CAST', 'SIMPLE_DEFORM')
+
+
+def create_object(stack_size):
+    bpy.ops.mesh.primitive_uv_sphere_add(segments=64, ring_count=32)
+    ob = bpy.context.object
+    add_modifiers(ob, stack_size, modifier_types=MODIFIER_TYPES)
+    return ob
+
+
+def apply_modifiers_one_by_one(context, object):
+    override = context.copy()
+    override['object'] = object
+
+    for mod in object.modifiers:
+        bpy.ops.object.modifier_apply(override, modifier=mod.name)
+
+
+def time_apply(apply_func, stack_size):
+    context = bpy.context
+    obs = []
+
+    def setup_and_apply():
+        ob = create_object(stack_size)
+        obs.append(ob)
+        apply_func(context, ob)
+
+    # Measure the setup separately, so only the apply is compared
+    def setup_only():
+        obs.append(create_object(stack_size))
+
+    total = time_call(setup_and_apply, repeat=10)
+    setup = time_call(setup_only, repeat=10)
+
+    for ob in obs:
+        remove_object(ob)
+
+    return (total - setup) / 1000
+
+
+def main():
+    ob = create_object(STACK_SIZES[0])
+    assert can_apply_all_modifiers_at_once(ob)
+    remove_object(ob)
+
+    rows = []
+
+    for size in STACK_SIZES:
+        one_by_one = time_apply(apply_modifiers_one_by_one, size)
+        at_once = time_apply(apply_all_modifiers_at_once, size)
+        rows.append((size, one_by_one, at_once, one_by_one / at_once))
+
+    print_result_table("Apply all modifiers (milliseconds)",
+                       ("modifiers", "one by one", "at once", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Measures the per-row overhead removed by building the modifier draw
+context once per redraw instead of resolving the active object, the
+preferences and the icons for every list row.
+
+Also measures filtering and sorting the modifier list with NumPy in
+filter_items against Blender's UI_UL_list helpers, up to 1000
+modifiers.
+
+Run in Blender with the addon enabled (see benchmark_utils).
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import bpy
+
+sys.path.append(str(Path(__file__).resolve().parent))
+
+from benchmark_utils import (
+    DummyLayout,
+    add_modifiers,
+    create_mesh_object,
+    print_result_table,
+    remove_object,
+    time_call
+)
+from modifier_list.modules.ui import modifiers_ui
+from modifier_list.modules.ui.draw_context import build_draw_context
+
+
+STACK_SIZES = (10, 60, 200)
+FILTER_STACK_SIZES = (10, 200, 1000)
+
+
+def draw_rows_with_shared_context(object, layout):
+    draw_context = build_draw_context(object)
+    for mod in object.modifiers:
+        modifiers_ui._modifier_visibility_buttons(mod, layout, draw_context, use_in_list=True)
+
+
+def draw_rows_with_context_per_row(object, layout):
+    # Equivalent to the previous behaviour, where every row resolved
+    # everything on its own.
+    for mod in object.modifiers:
+        draw_context = build_draw_context()
+        modifiers_ui._modifier_visibility_buttons(mod, layout, draw_context, use_in_list=True)
+
+
+def filter_with_numpy(object):
+    ui_list = SimpleNamespace(
+        filter_name="bevel",
+        filter_type='ALL',
+        filter_category='GENERATE',
+        filter_visibility='VISIBLE',
+        filter_disabled_only=False,
+        sort_by='NAME',
+        bitflag_filter_item=bpy.types.UI_UL_list.bitflag_filter_item)
+    return modifiers_ui.OBJECT_UL_ml_modifier_list.filter_items(
+        ui_list, bpy.context, object, "modifiers")
+
+
+def filter_with_ui_list_helpers(object):
+    # Name filter and name sorting only, with the helpers Blender's own
+    # lists use
+    helper = bpy.types.UI_UL_list
+    mods = object.modifiers
+    flt_flags = helper.filter_items_by_name("*bevel*", helper.bitflag_filter_item, mods)
+    flt_neworder = helper.sort_items_by_name(mods)
+    return flt_flags, flt_neworder
+
+
+def benchmark_filter_items():
+    rows = []
+
+    for size in FILTER_STACK_SIZES:
+        ob = create_mesh_object()
+        add_modifiers(ob, size)
+
+        numpy_time = time_call(lambda: filter_with_numpy(ob))
+        helpers_time = time_call(lambda: filter_with_ui_list_helpers(ob))
+        rows.append((size, helpers_time, numpy_time))
+
+        remove_object(ob)
+
+    print_result_table("Modifier list filtering and sorting (microseconds)",
+                       ("modifiers", "UI_UL_list", "filter_items"), rows)
+
+
+def main():
+    layout = DummyLayout()
+    rows = []
+
+    for size in STACK_SIZES:
+        ob = create_mesh_object()
+        bpy.context.view_layer.objects.active = ob
+        add_modifiers(ob, size)
+
+        shared = time_call(lambda: draw_rows_with_shared_context(ob, layout))
+        per_row = time_call(lambda: draw_rows_with_context_per_row(ob, layout))
+        saved_per_row = (per_row - shared) / size
+        rows.append((size, per_row, shared, saved_per_row))
+
+        remove_object(ob)
+
+    print_result_table("Modifier list row drawing (microseconds)",
+                       ("modifiers", "per row ctx", "shared ctx", "saved per row"), rows)
+
+    benchmark_filter_items()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Compares removing all modifiers one by one with modifiers.remove()
+(the previous Remove All Modifiers loop) to removing them with
+remove_local_modifiers (modifiers.clear() for local objects) for
+different numbers of objects.
+
+Run in Blender with the addon enabled (see benchmark_utils).
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import bpy
+
+sys.path.append(str(Path(__file__).resolve().parent))
+
+from benchmark_utils import add_modifiers, create_mesh_object, print_result_table, remove_object
+from modifier_list.modules.operators.object_remove_all_modifiers import remove_local_modifiers
+
+
+OBJECT_COUNTS = (100, 1000, 10000)
+STACK_SIZE = 10
+
+
+def previous_remove_all_modifiers(object):
+    for mod in object.modifiers[:]:
+        object.modifiers.remove(mod)
+
+
+def time_remove(remove_func, object_count):
+    obs = [create_mesh_object() for _ in range(object_count)]
+    for ob in obs:
+        add_modifiers(ob, STACK_SIZE)
+
+    start = time.perf_counter()
+    for ob in obs:
+        remove_func(ob)
+    # Include the evaluation the removals trigger
+    bpy.context.evaluated_depsgraph_get()
+    duration = time.perf_counter() - start
+
+    for ob in obs:
+        remove_object(ob)
+
+    return duration * 1000
+
+
+def main():
+    rows = []
+
+    for count in OBJECT_COUNTS:
+        previous = time_remove(previous_remove_all_modifiers, count)
+        current = time_remove(remove_local_modifiers, count)
+        rows.append((count, previous, current, previous / current))
+
+    print_result_table(f"Remove all {STACK_SIZE} modifiers of objects (milliseconds)",
+                       ("objects", "one by one", "clear", "speedup"), rows)
+
+
+if __name__ == "__main__":
+    main()
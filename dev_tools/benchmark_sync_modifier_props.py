@@ -0,0 +1,108 @@
+"""Compares the previous get_editable_bpy_object_props and
+sync_bpy_object_props (walking bl_rna.properties on every call) to the
+current ones (using the cached RNA schema) by syncing a 20-modifier
+stack across 500 instances, like Synchronize All Modifiers does.
+
+Run in Blender with the addon enabled (see benchmark_utils).
+"""
+
+import sys
+from pathlib import Path
+
+import bpy
+
+sys.path.append(str(Path(__file__).resolve().parent))
+
+from benchmark_utils import add_modifiers, print_result_table, time_call
+from modifier_list.modules.utils import get_editable_bpy_object_props, sync_bpy_object_props
+
+
+STACK_SIZE = 20
+INSTANCE_COUNT = 500
+
+PROPS_TO_SYNC_SEPARATELY = {"name", "show_render"}
+
+
+def previous_get_editable_bpy_object_props(bpy_object, props_to_ignore={}):
+    props = [getattr(bpy_object, p.identifier) for p in bpy_object.bl_rna.properties
+             if not p.is_readonly and p.identifier not in props_to_ignore]
+    return [p[:] if type(p).__name__ == "bpy_prop_array" else p for p in props]
+
+
+def previous_sync_bpy_object_props(source, dest):
+    for p in source.bl_rna.properties:
+        if not p.is_readonly:
+            setattr(dest, p.identifier, getattr(source, p.identifier))
+
+
+def sync_all(source_ob, dest_obs, get_props, sync_props):
+    source_props_per_mod = [get_props(mod, PROPS_TO_SYNC_SEPARATELY)
+                            for mod in source_ob.modifiers]
+
+    for ob in dest_obs:
+        for source_mod, dest_mod, source_props in zip(source_ob.modifiers, ob.modifiers,
+                                                      source_props_per_mod):
+            if get_props(dest_mod, PROPS_TO_SYNC_SEPARATELY) != source_props:
+                sync_props(source_mod, dest_mod)
+
+
+def create_instances():
+    mesh = bpy.data.meshes.new("ml_benchmark")
+    obs = []
+
+    for i in range(INSTANCE_COUNT + 1):
+        ob = bpy.data.objects.new(f"ml_benchmark_{i}", mesh)
+        add_modifiers(ob, STACK_SIZE)
+        obs.append(ob)
+
+    return obs
+
+
+def desync(dest_obs):
+    # Change one modifier of every instance, so syncing writes
+    for ob in dest_obs:
+        ob.modifiers[0].width += 0.01
+
+
+def main():
+    source_ob, *dest_obs = create_instances()
+
+    def no_sync(source, dest):
+        pass
+
+    # Instances already in sync, so only the comparing is measured
+    compare_previous = time_call(
+        lambda: sync_all(source_ob, dest_obs, previous_get_editable_bpy_object_props,
+                         no_sync), repeat=5)
+    compare_current = time_call(
+        lambda: sync_all(source_ob, dest_obs, get_editable_bpy_object_props, no_sync),
+        repeat=5)
+
+    def previous_sync_run():
+        desync(dest_obs)
+        sync_all(source_ob, dest_obs, previous_get_editable_bpy_object_props,
+                 previous_sync_bpy_object_props)
+
+    def current_sync_run():
+        desync(dest_obs)
+        sync_all(source_ob, dest_obs, get_editable_bpy_object_props, sync_bpy_object_props)
+
+    sync_previous = time_call(previous_sync_run, repeat=5)
+    sync_current = time_call(current_sync_run, repeat=5)
+
+    rows = [
+        ("compare", compare_previous / 1000, compare_current / 1000,
+         compare_previous / compare_current),
+        ("sync", sync_previous / 1000, sync_current / 1000, sync_previous / sync_current),
+    ]
+    print_result_table(f"Sync {STACK_SIZE} modifiers across {INSTANCE_COUNT} instances "
+                       "(milliseconds)", ("", "previous", "current", "speedup"), rows)
+
+    mesh = source_ob.data
+    for ob in [source_ob, *dest_obs]:
+        bpy.data.objects.remove(ob)
+    bpy.data.meshes.remove(mesh)
+
+
+if __name__ == "__main__":
+    main()
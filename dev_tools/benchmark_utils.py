@@ -0,0 +1,80 @@
+"""Helpers shared by the benchmark scripts in this directory.
+
+The benchmarks need to be run in Blender with the addon enabled, eg:
+
+    blender --background --factory-startup --addons modifier_list
+            --python dev_tools/benchmark_<name>.py
+"""
+
+import statistics
+import time
+
+import bpy
+
+
+class DummyLayout:
+    """Stands in for a UILayout in background mode where no real layout
+    is available.
+
+    Every method call and every attribute assignment is accepted and
+    ignored, and every method returns another DummyLayout, so the draw
+    helpers of the addon can be run as-is.
+    """
+
+    def __getattr__(self, name):
+        return self._call
+
+    def __setattr__(self, name, value):
+        pass
+
+    def __getitem__(self, key):
+        return self
+
+    def _call(self, *args, **kwargs):
+        return DummyLayout()
+
+    def icon(self, data):
+        return 0
+
+
+def time_call(func, repeat=50, number=1):
+    """Calls func number times per run for repeat runs and returns the
+    median duration of a single call in microseconds.
+    """
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter_ns() - start) / number)
+
+    return statistics.median(timings) / 1000
+
+
+def create_mesh_object(name="ml_benchmark"):
+    mesh = bpy.data.meshes.new(name)
+    ob = bpy.data.objects.new(name, mesh)
+    bpy.context.scene.collection.objects.link(ob)
+    return ob
+
+
+def add_modifiers(object, count, modifier_types=('BEVEL', 'SUBSURF', 'DISPLACE', 'MIRROR')):
+    for i in range(count):
+        mod_type = modifier_types[i % len(modifier_types)]
+        object.modifiers.new(f"{mod_type}_{i}", mod_type)
+
+
+def remove_object(object):
+    data = object.data
+    bpy.data.objects.remove(object)
+    if data is not None and not data.users:
+        bpy.data.meshes.remove(data)
+
+
+def print_result_table(title, header, rows):
+    print()
+    print(title)
+    print(" | ".join(f"{h:>14}" for h in header))
+    for row in rows:
+        print(" | ".join(f"{c:>14.2f}" if isinstance(c, float) else f"{c:>14}" for c in row))
@@ -0,0 +1,311 @@
+"""Applying modifiers in background Blender processes.
+
+The objects are split into shards, which are written into temporary
+.blend files. Each shard is handled by a `blender --background` worker
+process. The worker appends the objects, applies their modifiers with
+the same logic as Apply All Modifiers and writes the resulting meshes
+into another .blend file together with a JSON file describing the
+result. The meshes are then appended back and replace the data of the
+original objects.
+
+The workers run with --factory-startup and import this module directly
+from the add-on directory, so nothing needs to be installed for them and
+no network access is needed.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+from collections import namedtuple
+from pathlib import Path
+
+import bpy
+
+from .operators.object_apply_all_modifiers import (
+    apply_all_modifiers_at_once,
+    can_apply_all_modifiers_at_once
+)
+
+
+WorkerJob = namedtuple(
+    "WorkerJob",
+    ("object_names", "process", "result_filepath", "result_info_filepath", "log_filepath")
+)
+
+
+def can_apply_in_background(object):
+    """Checks if the modifiers of the object can be applied in a worker,
+    i.e. if it's a local mesh object with modifiers whose data is local
+    and not used by other objects.
+    """
+    if object.type != 'MESH' or not object.modifiers:
+        return False
+
+    data = object.data
+
+    # Animation data and drivers of the mesh would be lost when its
+    # data is replaced.
+    return not (object.library or object.override_library or data.library
+                or data.users > 1 or data.animation_data)
+
+
+def split_into_shards(objects, shard_count):
+    """Splits the objects into at most shard_count shards with about the
+    same total number of vertices, by giving the heaviest remaining
+    object to the lightest shard.
+    """
+    shards = [[] for _ in range(min(shard_count, len(objects)))]
+    shard_weights = [0] * len(shards)
+
+    for ob in sorted(objects, key=lambda ob: len(ob.data.vertices), reverse=True):
+        lightest_index = shard_weights.index(min(shard_weights))
+        shards[lightest_index].append(ob)
+        shard_weights[lightest_index] += len(ob.data.vertices) + 1
+
+    return shards
+
+
+# Main session
+# ======================================================================
+
+def _worker_command(job_filepath):
+    module_path = Path(__file__).resolve()
+    addon_dir = module_path.parents[1]
+    module_name = f"{addon_dir.name}.{module_path.parent.name}.{module_path.stem}"
+    python_expr = (f"import sys; sys.path.insert(0, {str(addon_dir.parent)!r}); "
+                   f"from {module_name} import run_worker; run_worker({job_filepath!r})")
+
+    return [bpy.app.binary_path, "--background", "--factory-startup",
+            "--python-exit-code", "1", "--python-expr", python_expr]
+
+
+def start_workers(objects, worker_count, frame, skip_hidden_modifiers):
+    """Writes the objects into shards and starts a worker process for
+    each shard.
+
+    Returns the temporary directory, which needs to be removed with
+    cleanup() when done, and a list of WorkerJobs.
+    """
+    temp_dir = tempfile.mkdtemp(prefix="ml_background_apply_")
+    jobs = []
+
+    try:
+        for i, shard in enumerate(split_into_shards(objects, worker_count)):
+            filepath_base = os.path.join(temp_dir, f"shard_{i}")
+            shard_filepath = filepath_base + ".blend"
+            job_filepath = filepath_base + "_job.json"
+            result_filepath = filepath_base + "_result.blend"
+            result_info_filepath = filepath_base + "_result.json"
+            log_filepath = filepath_base + ".log"
+
+            # Absolute paths, so images etc. are found from the temporary
+            # directory.
+            bpy.data.libraries.write(shard_filepath, set(shard), path_remap='ABSOLUTE')
+
+            object_names = [ob.name for ob in shard]
+            job = {
+                "shard_filepath": shard_filepath,
+                "object_names": object_names,
+                "frame": frame,
+                "skip_hidden_modifiers": skip_hidden_modifiers,
+                "result_filepath": result_filepath,
+                "result_info_filepath": result_info_filepath,
+            }
+
+            with open(job_filepath, 'w', encoding='utf-8') as f:
+                json.dump(job, f)
+
+            with open(log_filepath, 'w', encoding='utf-8') as log:
+                process = subprocess.Popen(_worker_command(job_filepath), stdout=log,
+                                           stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL)
+
+            jobs.append(WorkerJob(object_names, process, result_filepath, result_info_filepath,
+                                  log_filepath))
+    except Exception:
+        stop_workers(jobs)
+        cleanup(temp_dir)
+        raise
+
+    return temp_dir, jobs
+
+
+def stop_workers(jobs):
+    for job in jobs:
+        if job.process.poll() is None:
+            job.process.terminate()
+
+    for job in jobs:
+        job.process.wait()
+
+
+def cleanup(temp_dir):
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _print_worker_log(job):
+    try:
+        with open(job.log_filepath, encoding='utf-8', errors='replace') as f:
+            log = f.read()
+    except OSError:
+        log = ""
+
+    print(f"Modifier List: a background apply worker failed with exit code "
+          f"{job.process.returncode}:\n{log}")
+
+
+def _remap_materials(new_mesh, old_mesh, material_names):
+    """The workers clear the materials of the result meshes, so that
+    appending them doesn't create copies. Assigns the materials of the
+    old mesh back by slot index. Slots added by modifiers (e.g. Boolean)
+    get existing materials by name, which the workers keep because they
+    start from an empty file.
+    """
+    old_materials = old_mesh.materials
+
+    for i, name in enumerate(material_names):
+        if i < len(old_materials):
+            new_mesh.materials[i] = old_materials[i]
+        elif name:
+            new_mesh.materials[i] = bpy.data.materials.get(name)
+
+
+def import_results(job):
+    """Appends the meshes written by a finished worker and assigns them
+    to the objects of its shard. The applied modifiers are removed.
+
+    Returns a (number of objects with applied modifiers, names of the
+    objects with modifiers that failed to apply) pair.
+    """
+    if job.process.returncode != 0 or not os.path.exists(job.result_info_filepath):
+        _print_worker_log(job)
+        return 0, list(job.object_names)
+
+    with open(job.result_info_filepath, encoding='utf-8') as f:
+        results = json.load(f)
+
+    mesh_names = [result["mesh"] for result in results if result["mesh"]]
+
+    with bpy.data.libraries.load(job.result_filepath, link=False) as (data_from, data_to):
+        data_to.meshes = mesh_names
+
+    new_mesh_per_name = dict(zip(mesh_names, data_to.meshes))
+    applied_count = 0
+    failed_object_names = []
+
+    for ob_name, result in zip(job.object_names, results):
+        ob = bpy.data.objects.get(ob_name)
+
+        if result["failed"]:
+            failed_object_names.append(ob_name)
+
+        if ob is None or not result["mesh"]:
+            continue
+
+        new_mesh = new_mesh_per_name[result["mesh"]]
+        old_mesh = ob.data
+        mesh_name = old_mesh.name
+
+        _remap_materials(new_mesh, old_mesh, result["materials"])
+        new_mesh.use_fake_user = old_mesh.use_fake_user
+        ob.data = new_mesh
+
+        # The fake user moved to the new mesh
+        if old_mesh.users == int(old_mesh.use_fake_user):
+            bpy.data.meshes.remove(old_mesh)
+
+        new_mesh.name = mesh_name
+
+        applied_mod_names = set(result["applied_modifiers"])
+
+        if len(applied_mod_names) == len(ob.modifiers):
+            ob.modifiers.clear()
+        else:
+            for mod in [mod for mod in ob.modifiers if mod.name in applied_mod_names]:
+                ob.modifiers.remove(mod)
+            ob.ml_modifier_active_index = len(ob.modifiers) - 1
+
+        applied_count += 1
+
+    return applied_count, failed_object_names
+
+
+# Worker
+# ======================================================================
+
+def _apply_modifiers(context, object, skip_hidden_modifiers):
+    """Applies the modifiers of the object like Apply All Modifiers does.
+    Returns a (names of the applied modifiers, some failed) pair.
+    """
+    mod_names = [mod.name for mod in object.modifiers]
+
+    if can_apply_all_modifiers_at_once(object):
+        if apply_all_modifiers_at_once(context, object):
+            return mod_names, False
+
+    override = context.copy()
+    override['object'] = object
+    applied_mod_names = []
+    some_failed = False
+
+    for name in mod_names:
+        if skip_hidden_modifiers and not object.modifiers[name].show_viewport:
+            continue
+
+        try:
+            bpy.ops.object.modifier_apply(override, modifier=name)
+            applied_mod_names.append(name)
+        except RuntimeError:
+            some_failed = True
+
+    return applied_mod_names, some_failed
+
+
+def run_worker(job_filepath):
+    """Entry point of the worker processes"""
+    with open(job_filepath, encoding='utf-8') as f:
+        job = json.load(f)
+
+    # Start from an empty file, so the names of the appended data-blocks
+    # (e.g. a material called "Material") don't clash with the ones of
+    # the startup file.
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+
+    with bpy.data.libraries.load(job["shard_filepath"], link=False) as (data_from, data_to):
+        data_to.objects = job["object_names"]
+
+    context = bpy.context
+    scene = context.scene
+
+    for ob in data_to.objects:
+        scene.collection.objects.link(ob)
+
+    scene.frame_set(job["frame"])
+
+    results = []
+    result_meshes = set()
+
+    for ob in data_to.objects:
+        applied_mod_names, some_failed = _apply_modifiers(context, ob,
+                                                          job["skip_hidden_modifiers"])
+
+        if not applied_mod_names:
+            results.append({"mesh": None, "applied_modifiers": [], "materials": [],
+                            "failed": some_failed})
+            continue
+
+        mesh = ob.data
+        material_names = [mat.name if mat else "" for mat in mesh.materials]
+
+        for i in range(len(mesh.materials)):
+            mesh.materials[i] = None
+
+        result_meshes.add(mesh)
+        results.append({"mesh": mesh.name, "applied_modifiers": applied_mod_names,
+                        "materials": material_names, "failed": some_failed})
+
+    bpy.data.libraries.write(job["result_filepath"], result_meshes)
+
+    with open(job["result_info_filepath"], 'w', encoding='utf-8') as f:
+        json.dump(results, f)
@@ -0,0 +1,247 @@
+"""Live synchronization of modifier edits between instances.
+
+When enabled, the properties of the modifiers of the active (or
+pinned) object are subscribed to with bpy.msgbus. A change only marks
+the property as edited, and the edits are pushed to the other objects
+using the same data by a timer, so e.g. dragging a slider causes one
+propagation per tick instead of one per step. Only the edited properties
+are synced, so other differences between the instances are kept.
+
+Modifiers are matched like in Synchronize Active Modifier Between
+Instances, by name and type.
+"""
+
+import bpy
+from bpy.app.handlers import persistent
+
+from .utils import get_rna_schema, sync_changed_bpy_object_props
+
+
+# Seconds edits are collected for before pushing them to the instances
+SYNC_INTERVAL = 0.1
+
+_enabled = False
+
+# Owner of the msgbus subscriptions
+_msgbus_owner = object()
+
+# (object pointer, modifier names and ID property keys) of the subscribed
+# stack, used for finding out when the subscriptions need to be renewed
+_subscribed_stack_key = None
+
+# {modifier name: {edited property, ...}} of the source object. ID
+# properties (Geometry Nodes inputs) are stored as their ["key"] path.
+_edited_props_per_modifier = {}
+
+# (data pointer, data users, object count, [instance object, ...]) of
+# the source object's data
+_instances_cache = None
+
+
+def set_enabled(enabled):
+    global _enabled
+    _enabled = enabled
+
+    if enabled:
+        # The context may be restricted here (e.g. when the add-on is
+        # being registered), so subscribe from a timer.
+        if not bpy.app.timers.is_registered(_resubscribe):
+            bpy.app.timers.register(_resubscribe, first_interval=0)
+    else:
+        _clear()
+
+
+def is_enabled():
+    return _enabled
+
+
+def _clear():
+    global _subscribed_stack_key, _instances_cache
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    _subscribed_stack_key = None
+    _edited_props_per_modifier.clear()
+    _instances_cache = None
+
+    for timer in (_resubscribe, _push_edits):
+        if bpy.app.timers.is_registered(timer):
+            bpy.app.timers.unregister(timer)
+
+
+def _get_source_object():
+    context = bpy.context
+    pinned_ob = context.scene.modifier_list.pinned_object
+    return pinned_ob or context.view_layer.objects.active
+
+
+def _stack_key(object):
+    # Assigning a node group changes the ID properties of a Geometry
+    # Nodes modifier.
+    return (object.as_pointer(),
+            tuple((mod.name, tuple(mod.keys())) for mod in object.modifiers))
+
+
+def _get_instances(object):
+    """Returns the other objects using the data of the object. The user
+    map is cached until the number of users of the data or the number of
+    objects changes.
+    """
+    global _instances_cache
+    data = object.data
+
+    if data is None or data.users < 2:
+        return []
+
+    cache_key = (data.as_pointer(), data.users, len(bpy.data.objects))
+
+    if _instances_cache is None or _instances_cache[:3] != cache_key:
+        users = bpy.data.user_map(subset=[data], value_types={'OBJECT'})[data]
+        _instances_cache = (*cache_key, list(users))
+
+    return [ob for ob in _instances_cache[3] if ob != object]
+
+
+# Subscribing and pushing edits
+# ======================================================================
+
+def _on_property_changed(modifier_name, property):
+    _edited_props_per_modifier.setdefault(modifier_name, set()).add(property)
+
+    if not bpy.app.timers.is_registered(_push_edits):
+        bpy.app.timers.register(_push_edits, first_interval=SYNC_INTERVAL)
+
+
+def _subscribe(object):
+    global _subscribed_stack_key
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    _subscribed_stack_key = None
+
+    bpy.msgbus.subscribe_rna(
+        key=(bpy.types.LayerObjects, "active"),
+        owner=_msgbus_owner,
+        args=(),
+        notify=_resubscribe)
+
+    if object is None:
+        return
+
+    for mod in object.modifiers:
+        # Renaming changes the stack key, so it's handled by
+        # resubscribing.
+        props = [p for p in get_rna_schema(mod).identifiers if p != "name"]
+        props.extend(f'["{key}"]' for key in mod.keys())
+
+        for p in props:
+            # ID properties that can't be subscribed to are skipped
+            try:
+                bpy.msgbus.subscribe_rna(
+                    key=mod.path_resolve(p, False),
+                    owner=_msgbus_owner,
+                    args=(mod.name, p),
+                    notify=_on_property_changed)
+            except (TypeError, ValueError):
+                pass
+
+    _subscribed_stack_key = _stack_key(object)
+
+
+def _resubscribe():
+    if _enabled:
+        _subscribe(_get_source_object())
+
+
+def _push_edits():
+    """Pushes the edited properties of the source object's modifiers to
+    its instances. Runs as a timer.
+    """
+    if not _enabled or not _edited_props_per_modifier:
+        return None
+
+    source_ob = _get_source_object()
+    edited_props_per_mod = dict(_edited_props_per_modifier)
+    _edited_props_per_modifier.clear()
+
+    if source_ob is None:
+        return None
+
+    changed = False
+
+    for name, edited_props in edited_props_per_mod.items():
+        source_mod = source_ob.modifiers.get(name)
+
+        if source_mod is None:
+            continue
+
+        props_to_ignore = _unedited_props(source_mod, edited_props)
+
+        for dest_ob in _get_instances(source_ob):
+            if dest_ob.library and not dest_ob.override_library:
+                continue
+
+            dest_mod = dest_ob.modifiers.get(name)
+
+            if dest_mod and source_mod.type == dest_mod.type:
+                changed |= bool(sync_changed_bpy_object_props(
+                    source_mod, dest_mod, object=dest_ob, props_to_ignore=props_to_ignore))
+
+    # The timer runs outside of the undo step of the source edit, so
+    # without a step of its own the instance writes would be lost on
+    # redo.
+    if changed and bpy.ops.ed.undo_push.poll():
+        bpy.ops.ed.undo_push(message="Live Instance Sync")
+
+    return None
+
+
+def _unedited_props(modifier, edited_props):
+    """Returns the RNA properties and ID property keys of the modifier
+    which aren't in edited_props, for use as props_to_ignore.
+    """
+    props = {p for p in get_rna_schema(modifier).identifiers if p not in edited_props}
+    props.update(key for key in modifier.keys() if f'["{key}"]' not in edited_props)
+    return props
+
+
+# Handlers
+# ======================================================================
+
+@persistent
+def on_depsgraph_update_post(scene, depsgraph):
+    """Renews the subscriptions when the source object or its modifier
+    stack changes.
+    """
+    if not _enabled:
+        return
+
+    source_ob = _get_source_object()
+    stack_key = _stack_key(source_ob) if source_ob else None
+
+    if stack_key != _subscribed_stack_key:
+        _subscribe(source_ob)
+
+
+@persistent
+def on_undo_redo_or_file_load(dummy):
+    # Subscriptions are lost when loading a file and pointers aren't
+    # stable across undo.
+    global _instances_cache
+    _instances_cache = None
+    _edited_props_per_modifier.clear()
+    _resubscribe()
+
+
+def register():
+    handlers = bpy.app.handlers
+    handlers.depsgraph_update_post.append(on_depsgraph_update_post)
+    handlers.undo_post.append(on_undo_redo_or_file_load)
+    handlers.redo_post.append(on_undo_redo_or_file_load)
+    handlers.load_post.append(on_undo_redo_or_file_load)
+
+
+def unregister():
+    handlers = bpy.app.handlers
+    handlers.depsgraph_update_post.remove(on_depsgraph_update_post)
+    handlers.undo_post.remove(on_undo_redo_or_file_load)
+    handlers.redo_post.remove(on_undo_redo_or_file_load)
+    handlers.load_post.remove(on_undo_redo_or_file_load)
+
+    _clear()
@@ -1,3 +1,6 @@
+from collections import namedtuple
+from types import MappingProxyType
+
 import bpy
 
 
@@ -13,13 +16,16 @@ ALL_MODIFIERS_NAMES_ICONS_TYPES = [(mod.name, mod.icon, mod.identifier) for mod
 # === All modifier by categories ===
 _mods = ALL_MODIFIERS_NAMES_ICONS_TYPES
 
-_modify_end = next(_mods.index(mod) + 1 for mod in _mods if mod[0] == "Vertex Weight Proximity")
-_gen_start = next(_mods.index(mod) for mod in _mods if mod[0] == "Array")
-_gen_end = next(_mods.index(mod) + 1 for mod in _mods if mod[0] == "Wireframe")
-_def_start = next(_mods.index(mod) for mod in _mods if mod[0] == "Armature")
-_def_end = next(_mods.index(mod) + 1 for mod in _mods if mod[0] == "Wave")
-_sim_start = next(_mods.index(mod) for mod in _mods if mod[0] == "Cloth")
-_sim_end = next(_mods.index(mod) + 1 for mod in _mods if mod[0] == "Soft Body")
+# Index the names once instead of searching the list for every boundary
+_index_per_name = {mod[0]: i for i, mod in enumerate(_mods)}
+
+_modify_end = _index_per_name["Vertex Weight Proximity"] + 1
+_gen_start = _index_per_name["Array"]
+_gen_end = _index_per_name["Wireframe"] + 1
+_def_start = _index_per_name["Armature"]
+_def_end = _index_per_name["Wave"] + 1
+_sim_start = _index_per_name["Cloth"]
+_sim_end = _index_per_name["Soft Body"] + 1
 
 ALL_MODIFY_NAMES_ICONS_TYPES = [mod for mod in _mods[0:_modify_end]]
 ALL_GENERATE_NAMES_ICONS_TYPES = [mod for mod in _mods[_gen_start:_gen_end]]
@@ -268,3 +274,133 @@ HAVE_GIZMO_PROPERTY = {
     'SIMPLE_DEFORM': "origin",
     'WAVE': "start_position_object"
 }
+
+
+# === Registry ===
+# Frozen indexes of the lists above, built once at import, so modifier
+# metadata can be looked up in O(1) instead of scanning the lists.
+
+ModifierInfo = namedtuple("ModifierInfo", ("name", "icon", "type", "category"))
+
+ModifierRegistry = namedtuple(
+    "ModifierRegistry",
+    (
+        # {type: ModifierInfo}
+        "info_per_type",
+        # {name: ModifierInfo}
+        "info_per_name",
+        # {category: (ModifierInfo, ...)}
+        "infos_per_category",
+        # {category: frozenset of types}
+        "types_per_category",
+        # {object type: (ModifierInfo, ...)}, categories as shown for
+        # that object type
+        "infos_per_object_type",
+        # {object type: {category: frozenset of types}}
+        "types_per_object_type_and_category",
+        # (name, icon, type) tuples of all modifiers sorted by name
+        "all_search_items",
+        # {object type: (name, icon, type) tuples sorted by name}
+        "search_items_per_object_type",
+    )
+)
+
+MODIFIER_CATEGORIES = ('MODIFY', 'GENERATE', 'DEFORM', 'PHYSICS')
+
+_names_icons_types_per_category = {
+    'MODIFY': ALL_MODIFY_NAMES_ICONS_TYPES,
+    'GENERATE': ALL_GENERATE_NAMES_ICONS_TYPES,
+    'DEFORM': ALL_DEFORM_NAMES_ICONS_TYPES,
+    'PHYSICS': ALL_SIMULATE_NAMES_ICONS_TYPES,
+}
+
+_curve_text_names_icons_types_per_category = {
+    'MODIFY': CURVE_SURFACE_TEXT_MODIFY_NAMES_ICONS_TYPES,
+    'GENERATE': CURVE_TEXT_GENERATE_NAMES_ICONS_TYPES,
+    'DEFORM': CURVE_SURFACE_TEXT_DEFORM_NAMES_ICONS_TYPES,
+    'PHYSICS': CURVE_SURFACE_TEXT_SIMULATE_NAMES_ICONS_TYPES,
+}
+
+_names_icons_types_per_object_type_and_category = {
+    'MESH': {
+        'MODIFY': MESH_MODIFY_NAMES_ICONS_TYPES,
+        'GENERATE': MESH_GENERATE_NAMES_ICONS_TYPES,
+        'DEFORM': MESH_DEFORM_NAMES_ICONS_TYPES,
+        'PHYSICS': MESH_SIMULATE_NAMES_ICONS_TYPES,
+    },
+    'CURVE': _curve_text_names_icons_types_per_category,
+    'FONT': _curve_text_names_icons_types_per_category,
+    'SURFACE': {
+        'MODIFY': CURVE_SURFACE_TEXT_MODIFY_NAMES_ICONS_TYPES,
+        'GENERATE': SURFACE_GENERATE_NAMES_ICONS_TYPES,
+        'DEFORM': CURVE_SURFACE_TEXT_DEFORM_NAMES_ICONS_TYPES,
+        'PHYSICS': CURVE_SURFACE_TEXT_SIMULATE_NAMES_ICONS_TYPES,
+    },
+    'CURVES': {
+        'GENERATE': CURVES_GENERATE_NAMES_ICONS_TYPES,
+    },
+    'LATTICE': {
+        'MODIFY': LATTICE_MODIFY_NAMES_ICONS_TYPES,
+        'DEFORM': LATTICE_DEFORM_NAMES_ICONS_TYPES,
+        'PHYSICS': LATTICE_SIMULATE_NAMES_ICONS_TYPES,
+    },
+    'POINTCLOUD': {
+        'GENERATE': POINTCLOUD_GENERATE_NAMES_ICONS_TYPES,
+    },
+    'VOLUME': {
+        'GENERATE': VOLUME_GENERATE_NAMES_ICONS_TYPES,
+        'DEFORM': VOLUME_DEFORM_NAMES_ICONS_TYPES,
+    },
+}
+
+
+def _sorted_by_name(names_icons_types):
+    return tuple(sorted(names_icons_types, key=lambda mod: mod[0]))
+
+
+def _build_registry():
+    category_per_type = {mod: category
+                         for category, names_icons_types in _names_icons_types_per_category.items()
+                         for _, _, mod in names_icons_types}
+
+    infos = [ModifierInfo(name, icon, mod, category_per_type.get(mod))
+             for name, icon, mod in ALL_MODIFIERS_NAMES_ICONS_TYPES]
+
+    infos_per_category = {
+        category: tuple(info for info in infos if info.category == category)
+        for category in MODIFIER_CATEGORIES
+    }
+
+    infos_per_object_type = {}
+    types_per_object_type_and_category = {}
+    search_items_per_object_type = {}
+
+    for ob_type, per_category in _names_icons_types_per_object_type_and_category.items():
+        infos_per_object_type[ob_type] = tuple(
+            ModifierInfo(name, icon, mod, category)
+            for category, names_icons_types in per_category.items()
+            for name, icon, mod in names_icons_types
+        )
+        types_per_object_type_and_category[ob_type] = MappingProxyType({
+            category: frozenset(mod for _, _, mod in names_icons_types)
+            for category, names_icons_types in per_category.items()
+        })
+        search_items_per_object_type[ob_type] = _sorted_by_name(
+            mod for names_icons_types in per_category.values() for mod in names_icons_types)
+
+    return ModifierRegistry(
+        info_per_type=MappingProxyType({info.type: info for info in infos}),
+        info_per_name=MappingProxyType({info.name: info for info in infos}),
+        infos_per_category=MappingProxyType(infos_per_category),
+        types_per_category=MappingProxyType({
+            category: frozenset(info.type for info in category_infos)
+            for category, category_infos in infos_per_category.items()
+        }),
+        infos_per_object_type=MappingProxyType(infos_per_object_type),
+        types_per_object_type_and_category=MappingProxyType(types_per_object_type_and_category),
+        all_search_items=_sorted_by_name(ALL_MODIFIERS_NAMES_ICONS_TYPES),
+        search_items_per_object_type=MappingProxyType(search_items_per_object_type),
+    )
+
+
+MODIFIER_REGISTRY = _build_registry()
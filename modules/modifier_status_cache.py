@@ -0,0 +1,115 @@
+"""Cache for the "disabled" status of modifiers (i.e. whether the name
+of the modifier should be displayed with a red background).
+
+The status is computed lazily per (object pointer, modifier name) and
+kept until the object is updated in the depsgraph, so redraws don't need
+to evaluate is_modifier_disabled for every modifier again.
+"""
+
+import bpy
+from bpy.app.handlers import persistent
+
+from .utils import is_modifier_disabled
+
+
+# {object pointer: {modifier name: is disabled}}
+_status_per_object = {}
+
+# The status of some modifiers also depends on other objects, e.g.
+# Particle Instance depends on the modifiers of the object it uses.
+# {other object pointer: {(object pointer, modifier name), ...}}
+_dependent_keys_per_object = {}
+
+
+def is_modifier_disabled_cached(object, modifier):
+    """Cached version of is_modifier_disabled."""
+    ob_pointer = object.as_pointer()
+    status_per_mod = _status_per_object.setdefault(ob_pointer, {})
+
+    try:
+        return status_per_mod[modifier.name]
+    except KeyError:
+        pass
+
+    disabled = is_modifier_disabled(modifier)
+    status_per_mod[modifier.name] = disabled
+
+    if modifier.type == 'PARTICLE_INSTANCE' and modifier.object:
+        dependent_keys = _dependent_keys_per_object.setdefault(modifier.object.as_pointer(), set())
+        dependent_keys.add((ob_pointer, modifier.name))
+
+    return disabled
+
+
+def scan_disabled(objects):
+    """Returns a list of (object, modifier) tuples of all disabled
+    modifiers of the given objects.
+
+    All the objects are handled in one pass, which also fills the cache
+    for them.
+    """
+    return [(ob, mod) for ob in objects for mod in ob.modifiers
+            if is_modifier_disabled_cached(ob, mod)]
+
+
+def invalidate_object(object_pointer):
+    """Removes the cached statuses of the object with the given pointer
+    and of the modifiers depending on that object.
+    """
+    _status_per_object.pop(object_pointer, None)
+
+    for ob_pointer, mod_name in _dependent_keys_per_object.pop(object_pointer, ()):
+        status_per_mod = _status_per_object.get(ob_pointer)
+        if status_per_mod is not None:
+            status_per_mod.pop(mod_name, None)
+
+
+def clear():
+    _status_per_object.clear()
+    _dependent_keys_per_object.clear()
+
+
+# Handlers
+# ======================================================================
+
+@persistent
+def on_depsgraph_update_post(scene, depsgraph):
+    """Invalidates the objects whose data or modifiers were changed.
+    Transform-only updates don't affect the status, so they are skipped.
+    """
+    if not _status_per_object:
+        return
+
+    for update in depsgraph.updates:
+        if not isinstance(update.id, bpy.types.Object):
+            continue
+
+        if (update.is_updated_transform and not update.is_updated_geometry
+                and not update.is_updated_shading):
+            continue
+
+        invalidate_object(update.id.original.as_pointer())
+
+
+@persistent
+def on_undo_redo_or_file_load(dummy):
+    # Object pointers aren't stable across undo and file loading
+    clear()
+
+
+def register():
+    handlers = bpy.app.handlers
+    handlers.depsgraph_update_post.append(on_depsgraph_update_post)
+    handlers.undo_post.append(on_undo_redo_or_file_load)
+    handlers.redo_post.append(on_undo_redo_or_file_load)
+    handlers.load_post.append(on_undo_redo_or_file_load)
+
+
+def unregister():
+    handlers = bpy.app.handlers
+    handlers.depsgraph_update_post.remove(on_depsgraph_update_post)
+    handlers.undo_post.remove(on_undo_redo_or_file_load)
+    handlers.redo_post.remove(on_undo_redo_or_file_load)
+    handlers.load_post.remove(on_undo_redo_or_file_load)
+
+    clear()
@@ -10,7 +10,10 @@ class LinkedObjectDataChanger:
     Usage:
 
     Use make_active_instance_data_unique to create a copy of the
-    current data and to assing it to the active instance.
+    current data and to assing it to the active instance. The other
+    users of the data are found then with a user map and are available
+    in other_instances, e.g. for removing the applied modifier from
+    them.
 
     Use assign_new_data_to_other_instances to assign the new data to the
     other instances.
@@ -22,33 +25,112 @@ class LinkedObjectDataChanger:
 
     def __init__(self, object):
         self._object = object
-
-    def _get_correct_data_collection(self):
-        if self._object.type == 'MESH':
-            return bpy.data.meshes
-        elif self._object.type in {'CURVE', 'SURFACE', 'FONT'}:
-            return bpy.data.curves
-        elif self._object.type == 'LATTICE':
-            return bpy.data.lattices
+        self.other_instances = []
 
     def make_active_instance_data_unique(self):
-        new_data = self._object.data.copy()
-        self._old_data_name = self._object.data.name
-        self._new_data_name = new_data.name
-        self._object.data = new_data
+        self._old_data = self._object.data
+        users = bpy.data.user_map(subset=[self._old_data], value_types={'OBJECT'})
+        self.other_instances = [ob for ob in users[self._old_data] if ob != self._object]
+        self._object.data = self._old_data.copy()
 
     def assign_new_data_to_other_instances(self):
-        obs = bpy.data.objects
-        obs_with_same_data = [ob for ob in obs if ob.data and ob.data.name == self._old_data_name]
-        data_collection = self._get_correct_data_collection()
+        # The active instance's data is used instead of storing the copy
+        # because applying can replace the data of the active instance.
+        new_data = self._object.data
 
-        for ob in obs_with_same_data:
-            ob.data = data_collection[self._new_data_name]
+        for ob in self.other_instances:
+            ob.data = new_data
 
-        data_collection.remove(data_collection[self._old_data_name])
+        bpy.data.batch_remove([self._old_data])
 
     def reassign_old_data_to_active_instance(self):
-        data_collection = self._get_correct_data_collection()
-        self._object.data = data_collection[self._old_data_name]
+        new_data = self._object.data
+        self._object.data = self._old_data
+
+        bpy.data.batch_remove([new_data])
+
+
+class SharedDataApplyPlanner:
+
+    """
+    Helper class to be used when applying modifiers to many objects of
+    which some have multi-user data, so that the result is used by all
+    the instances.
+
+    For every multi-user datablock, one of the given objects is chosen
+    as the source: the active object if it uses that data, otherwise the
+    first given object using it. The users of all the datablocks are
+    found with a single user map.
+
+    Usage:
+
+    Use make_source_data_unique to give every source object its own
+    copy of the data (each datablock is copied once). Then apply the
+    modifiers of source_objects and of the objects with single-user data
+    (objects_to_apply contains both).
+
+    Use assign_new_data_to_other_instances to assign the data of every
+    source object to the other users of the old data and
+    remove_old_data to remove all the old datablocks in one go.
+
+    revert can be used to reassign the old data to the source objects
+    and to delete the copies (used when no modifier could be applied).
+    """
+
+    def __init__(self, objects, active_object=None):
+        # Put the active object first, so it becomes the source for its
+        # data.
+        if active_object in objects:
+            objects = [active_object] + [ob for ob in objects if ob != active_object]
+
+        self.objects_to_apply = []
+        # {old data: source object}
+        self._source_per_data = {}
+        # {source object: [other selected users of the same data, ...]}
+        self.other_given_users_per_source = {}
+
+        for ob in objects:
+            data = ob.data
+
+            if data.users == 1:
+                self.objects_to_apply.append(ob)
+            elif data not in self._source_per_data:
+                self._source_per_data[data] = ob
+                self.other_given_users_per_source[ob] = []
+                self.objects_to_apply.append(ob)
+            else:
+                self.other_given_users_per_source[self._source_per_data[data]].append(ob)
+
+        self._users_per_data = bpy.data.user_map(subset=set(self._source_per_data),
+                                                 value_types={'OBJECT'})
+
+    @property
+    def source_objects(self):
+        return list(self._source_per_data.values())
+
+    def make_source_data_unique(self):
+        for data, source_ob in self._source_per_data.items():
+            source_ob.data = data.copy()
+
+    def assign_new_data_to_other_instances(self):
+        for data, source_ob in self._source_per_data.items():
+            new_data = source_ob.data
+
+            for ob in self._users_per_data[data]:
+                if ob != source_ob:
+                    ob.data = new_data
+
+    def remove_old_data(self):
+        old_data = [data for data in self._source_per_data if not data.users]
+        bpy.data.batch_remove(old_data)
+        self._source_per_data.clear()
+
+    def revert(self):
+        copies = []
+
+        for data, source_ob in self._source_per_data.items():
+            copies.append(source_ob.data)
+            source_ob.data = data
 
-        data_collection.remove(data_collection[self._new_data_name])
+        bpy.data.batch_remove(copies)
+        self._source_per_data.clear()
@@ -0,0 +1,26 @@
+from bpy_extras.io_utils import ExportHelper
+from bpy.props import *
+from bpy.types import Operator
+
+from ..ui import draw_profiler
+
+
+class WM_OT_ml_draw_profiler_dump(Operator, ExportHelper):
+    bl_idname = "wm.ml_draw_profiler_dump"
+    bl_label = "Dump Draw Profiler Results"
+    bl_description = "Save the draw profiler results into a JSON file"
+    bl_options = {'INTERNAL'}
+
+    filename_ext = ".json"
+
+    filter_glob: StringProperty(default="*.json", options={'HIDDEN'})
+
+    @classmethod
+    def poll(cls, context):
+        return draw_profiler.is_enabled()
+
+    def execute(self, context):
+        draw_profiler.dump_results(self.filepath)
+        self.report({'INFO'}, f"Saved draw profiler results to {self.filepath}")
+
+        return {'FINISHED'}
@@ -0,0 +1,15 @@
+from bpy.types import Operator
+
+from ..ui import draw_profiler
+
+
+class WM_OT_ml_draw_profiler_reset(Operator):
+    bl_idname = "wm.ml_draw_profiler_reset"
+    bl_label = "Reset Draw Profiler"
+    bl_description = "Clear the collected draw times"
+    bl_options = {'INTERNAL'}
+
+    def execute(self, context):
+        draw_profiler.reset()
+
+        return {'FINISHED'}
@@ -5,7 +5,7 @@ from bpy.props import *
 from bpy.types import Operator
 
 from . import lattice_toggle_editmode, lattice_toggle_editmode_prop_editor
-from ..modifier_categories import CURVE_SURFACE_TEXT_DEFORM_NAMES_ICONS_TYPES
+from ..modifier_categories import MODIFIER_REGISTRY
 from ..multiuser_data_modifier_apply_utils import LinkedObjectDataChanger
 from ..utils import (
     delete_gizmo_object,
@@ -102,7 +102,6 @@ class ApplyModifier:
         prefs = bpy.context.preferences.addons["modifier_list"].preferences
         ob = context.active_object
         ml_active_ob = get_ml_active_object()
-        ml_active_ob_init_data_name = ml_active_ob.data.name
         active_mod_index = ml_active_ob.ml_modifier_active_index
         mod = ml_active_ob.modifiers[active_mod_index]
         mod_name = mod.name
@@ -142,7 +141,7 @@ class ApplyModifier:
 
         # Apply the modifier to all instances
         if self.multi_user_data_apply_method == 'APPLY_TO_ALL':
-            self.remove_modifier_from_instances(ml_active_ob_init_data_name, mod_name, mod_type)
+            self.remove_modifier_from_instances(mod_name, mod_type)
             self.linked_object_data_changer.assign_new_data_to_other_instances()
 
         # Report if the modifier was not first
@@ -218,17 +217,15 @@ class ApplyModifier:
 
             return False
 
-    def remove_modifier_from_instances(self, data_name, modifier_name, modifier_type):
-        obs_with_same_data = [ob for ob in bpy.data.objects
-                              if ob.data and ob.data.name == data_name]
-
-        for ob in obs_with_same_data:
+    def remove_modifier_from_instances(self, modifier_name, modifier_type):
+        for ob in self.linked_object_data_changer.other_instances:
             mod = ob.modifiers.get(modifier_name)
             if mod and mod.type == modifier_type:
                 ob.modifiers.remove(mod)
 
     def curve_modifier_apply_report(self, modifier_type):
-        curve_deform_mods = [mod[2] for mod in CURVE_SURFACE_TEXT_DEFORM_NAMES_ICONS_TYPES]
+        types_per_category = MODIFIER_REGISTRY.types_per_object_type_and_category['CURVE']
+        curve_deform_mods = types_per_category['DEFORM']
         if modifier_type in curve_deform_mods:
             self.report({'INFO'}, "Applied modifier only changed CV points, "
                         "not tessellated/bevel vertices")
@@ -0,0 +1,184 @@
+import bpy
+from bpy.props import *
+from bpy.types import Operator
+
+from .object_apply_all_modifiers import DONT_SUPPORT_APPLYING_AT_ONCE
+from ..multiuser_data_modifier_apply_utils import LinkedObjectDataChanger
+from ..utils import get_ml_active_object, is_modifier_disabled, replace_mesh_with_evaluated_mesh
+
+
+class OBJECT_OT_ml_modifier_apply_up_to_active(Operator):
+    bl_idname = "object.ml_modifier_apply_up_to_active"
+    bl_label = "Apply Up To Active"
+    bl_description = ("Apply the modifiers from the first one up to and including the active "
+                      "one and remove them from the stack")
+    bl_options = {'REGISTER', 'INTERNAL', 'UNDO'}
+
+    multi_user_data_apply_method_items = [
+        ('NONE', "None", ""),
+        ("APPLY_TO_SINGLE", "Apply To Single", ""),
+        ("APPLY_TO_ALL", "Apply To All", "")
+    ]
+    multi_user_data_apply_method: EnumProperty(
+        items=multi_user_data_apply_method_items,
+        default='NONE',
+        options={'HIDDEN', 'SKIP_SAVE'})
+
+    # Set in invoke, so when executing directly, hidden modifiers are
+    # applied too.
+    disallow_applying_hidden_modifiers = False
+
+    @classmethod
+    def poll(cls, context):
+        ob = get_ml_active_object()
+
+        if not ob or not ob.modifiers:
+            return False
+
+        data = ob.data
+        mods_to_apply = ob.modifiers[:ob.ml_modifier_active_index + 1]
+
+        if ob.library:
+            return False
+        elif ob.override_library and (data.library or data.override_library):
+            return False
+        elif ob.override_library:
+            return all(mod.is_property_overridable_library("name") for mod in mods_to_apply)
+
+        return True
+
+    def execute(self, context):
+        ob = get_ml_active_object()
+        active_mod_index = ob.ml_modifier_active_index
+        names_types = [(mod.name, mod.type) for mod in ob.modifiers[:active_mod_index + 1]]
+
+        is_editmode = context.mode.startswith("EDIT")
+
+        if is_editmode:
+            bpy.ops.object.editmode_toggle()
+            # Add an undo step to avoid problems with undo
+            bpy.ops.ed.undo_push(message="Toggle Editmode")
+
+        # Make applying modifiers possible when the object's data is
+        # used by other objects too.
+        if self.multi_user_data_apply_method != 'NONE':
+            self.linked_object_data_changer = LinkedObjectDataChanger(ob)
+            self.linked_object_data_changer.make_active_instance_data_unique()
+
+        if self.can_apply_at_once(ob, active_mod_index):
+            applied_count = self.apply_at_once(context, ob, active_mod_index)
+        else:
+            applied_count = self.apply_one_by_one(context, ob, names_types)
+
+        if not applied_count:
+            if self.multi_user_data_apply_method != 'NONE':
+                self.linked_object_data_changer.reassign_old_data_to_active_instance()
+            if is_editmode:
+                bpy.ops.object.editmode_toggle()
+            return {'CANCELLED'}
+
+        if is_editmode:
+            # Add an undo step to avoid problems with undo
+            bpy.ops.ed.undo_push(message="Apply Up To Active")
+            bpy.ops.object.editmode_toggle()
+
+        # Apply the modifiers to all instances
+        if self.multi_user_data_apply_method == 'APPLY_TO_ALL':
+            self.remove_modifiers_from_instances(names_types)
+            self.linked_object_data_changer.assign_new_data_to_other_instances()
+
+        ob.ml_modifier_active_index = 0
+
+        if applied_count < len(names_types):
+            self.report({'INFO'}, f"Applied {applied_count} of {len(names_types)} modifiers")
+
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        prefs = bpy.context.preferences.addons["modifier_list"].preferences
+        self.disallow_applying_hidden_modifiers = (
+            not prefs.disallow_applying_hidden_modifiers if event.alt
+            else prefs.disallow_applying_hidden_modifiers)
+
+        if self.multi_user_data_apply_method == 'NONE' and get_ml_active_object().data.users > 1:
+            bpy.ops.object.ml_modifier_apply_multi_user_data_dialog('INVOKE_DEFAULT',
+                                                                    op_name=self.bl_idname)
+            return {'CANCELLED'}
+
+        return self.execute(context)
+
+    def can_apply_at_once(self, object, active_modifier_index):
+        """Checks if the modifiers up to the active one can be applied
+        with a single evaluation with the same result as when applying
+        them one by one.
+        """
+        data = object.data
+
+        # Shape keys, animation data and drivers of the mesh would be
+        # lost
+        if object.type != 'MESH' or data.shape_keys or data.animation_data:
+            return False
+
+        # Hidden and disabled modifiers aren't included in the evaluated
+        # mesh, so they need to be handled one by one.
+        return all(mod.show_viewport and mod.type not in DONT_SUPPORT_APPLYING_AT_ONCE
+                   and not is_modifier_disabled(mod)
+                   for mod in object.modifiers[:active_modifier_index + 1])
+
+    def apply_at_once(self, context, object, active_modifier_index):
+        """Evaluates the object with the modifiers after the active one
+        hidden, writes the result into the object data and removes the
+        applied modifiers. Returns the number of applied modifiers.
+        """
+        mods = object.modifiers
+        later_mods = mods[active_modifier_index + 1:]
+        later_mods_show_viewport = [mod.show_viewport for mod in later_mods]
+
+        for mod in later_mods:
+            mod.show_viewport = False
+
+        try:
+            applied = replace_mesh_with_evaluated_mesh(context, (object,))
+        finally:
+            for mod, show_viewport in zip(later_mods, later_mods_show_viewport):
+                mod.show_viewport = show_viewport
+
+        if not applied:
+            self.report({'INFO'}, "Object is not evaluated, can't apply modifiers")
+            return 0
+
+        for mod in mods[:active_modifier_index + 1]:
+            mods.remove(mod)
+
+        return active_modifier_index + 1
+
+    def apply_one_by_one(self, context, object, names_types):
+        """Applies the modifiers with modifier_apply. Returns the number
+        of applied modifiers.
+        """
+        # Make applying modifiers possible when an object is pinned
+        override = context.copy()
+        override['object'] = object
+        applied_count = 0
+
+        for name, _ in names_types:
+            mod = object.modifiers[name]
+
+            if self.disallow_applying_hidden_modifiers and not mod.show_viewport:
+                continue
+
+            try:
+                bpy.ops.object.modifier_apply(override, modifier=name)
+                applied_count += 1
+            except RuntimeError as rte:
+                message = str(rte).replace("Error: ", "")
+                self.report(type={'WARNING'}, message=f"{name}: {message[:-1]}")
+
+        return applied_count
+
+    def remove_modifiers_from_instances(self, names_types):
+        for ob in self.linked_object_data_changer.other_instances:
+            for name, mod_type in names_types:
+                mod = ob.modifiers.get(name)
+                if mod and mod.type == mod_type:
+                    ob.modifiers.remove(mod)
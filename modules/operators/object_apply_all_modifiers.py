@@ -4,19 +4,179 @@ meta-androcto, saidenka and lijenstina.
 https://wiki.blender.org/wiki/Extensions:2.6/Py/Scripts/3D_interaction/modifier_tools
 """
 
+from time import perf_counter
+
 import numpy as np
 
 import bpy
 from bpy.props import *
 from bpy.types import Operator
 
-from ..multiuser_data_modifier_apply_utils import LinkedObjectDataChanger
-from ..utils import get_ml_active_object
+from ..multiuser_data_modifier_apply_utils import LinkedObjectDataChanger, SharedDataApplyPlanner
+from ..utils import (
+    get_editable_bpy_object_props,
+    get_id_props,
+    get_ml_active_object,
+    get_rna_schema,
+    is_modifier_disabled,
+    replace_mesh_with_evaluated_mesh
+)
 
 
 show_done_label_in_dialog = False
 
 
+# Fast path
+# ======================================================================
+
+# Modifiers whose result after modifier_apply differs from the evaluated
+# mesh.
+DONT_SUPPORT_APPLYING_AT_ONCE = {
+    'MULTIRES',
+    'PARTICLE_SYSTEM',
+}
+
+
+def can_apply_all_modifiers_at_once(object, allow_multi_user_data=False):
+    """Checks if all modifiers of the object can be applied by
+    evaluating the object once, i.e. if the result is the same as when
+    applying the modifiers one by one with modifier_apply.
+    """
+    data = object.data
+    mods = object.modifiers
+
+    if object.type != 'MESH' or not mods:
+        return False
+
+    if data.users > 1 and not allow_multi_user_data:
+        return False
+
+    # Non-local modifiers can't be applied and shape keys, animation
+    # data and drivers of the mesh would be lost
+    if object.override_library or data.shape_keys or data.animation_data:
+        return False
+
+    # Hidden and disabled modifiers are skipped by modifier_apply, which
+    # leaves them in the stack.
+    return all(mod.show_viewport and mod.type not in DONT_SUPPORT_APPLYING_AT_ONCE
+               and not is_modifier_disabled(mod)
+               for mod in mods)
+
+
+def apply_all_modifiers_of_group(context, objects):
+    """Applies all modifiers of the given objects, which need to share
+    their mesh and have identical modifier stacks, by evaluating only the
+    first object. The evaluated mesh is assigned to all the objects and
+    their modifiers are removed.
+
+    The old mesh is removed if no other object uses it.
+
+    Returns False if the first object isn't evaluated (e.g. it's hidden
+    in the viewport), in which case nothing is changed.
+    """
+    if not replace_mesh_with_evaluated_mesh(context, objects):
+        return False
+
+    for ob in objects:
+        ob.modifiers.clear()
+
+    return True
+
+
+def apply_all_modifiers_at_once(context, object):
+    """Replaces the mesh of the object with its evaluated mesh and
+    removes all its modifiers.
+
+    Returns False if the object isn't evaluated, in which case nothing
+    is changed.
+    """
+    return apply_all_modifiers_of_group(context, (object,))
+
+
+# Grouping
+# ======================================================================
+
+def has_multiple_objects_to_apply(context):
+    sel_obs = context.selected_objects
+    return len(sel_obs) > 1 or bool(sel_obs and get_ml_active_object() not in sel_obs)
+
+
+# Modifier properties which don't affect the result of applying
+_props_not_affecting_result = {
+    "name",
+    "show_expanded",
+    "show_in_editmode",
+    "show_on_cage",
+    "show_render",
+    "use_pin_to_last",
+}
+
+
+# Modifiers whose result always depends on the object's transform.
+# Geometry Nodes trees can use Self Object or a relative Object Info
+# node, which isn't worth finding out from (nested) node groups.
+_transform_dependent_modifier_types = {'NODES', 'UV_PROJECT'}
+
+# Texture coordinate properties, e.g. of Displace, Wave, Warp and Vertex
+# Weight modifiers, which depend on the transform when set to 'GLOBAL'
+_texture_coords_props = ("texture_coords", "mask_tex_mapping")
+
+
+def _depends_on_transform(modifier, id_props):
+    if modifier.type in _transform_dependent_modifier_types:
+        return True
+
+    if any(getattr(modifier, p, None) == 'GLOBAL' for p in _texture_coords_props):
+        return True
+
+    # Modifiers using other objects usually give different results for
+    # objects with different transforms.
+    values = [getattr(modifier, p) for p in get_rna_schema(modifier).pointer_identifiers]
+    values.extend(id_props.values())
+
+    return any(isinstance(value, (bpy.types.Object, bpy.types.Collection)) for value in values)
+
+
+def modifier_stack_signature(object):
+    """Returns a list describing the modifier stack of the object. Two
+    objects with the same data give the same result when applying their
+    modifiers if their signatures are equal.
+    """
+    # The inputs of Geometry Nodes modifiers are ID properties
+    id_props_per_mod = [get_id_props(mod) if mod.type == 'NODES' else {}
+                        for mod in object.modifiers]
+    signature = [(mod.type, get_editable_bpy_object_props(mod, _props_not_affecting_result),
+                  id_props)
+                 for mod, id_props in zip(object.modifiers, id_props_per_mod)]
+
+    if any(_depends_on_transform(mod, id_props)
+           for mod, id_props in zip(object.modifiers, id_props_per_mod)):
+        signature.append(tuple(tuple(row) for row in object.matrix_world))
+
+    return signature
+
+
+def group_objects_by_data_and_modifier_stack(objects):
+    """Groups the objects by their data and, inside those groups, by
+    their modifier stack signature. Returns a list of lists of objects.
+    """
+    # {data pointer: [(signature, [object, ...]), ...]}
+    groups_per_data = {}
+
+    for ob in objects:
+        groups = groups_per_data.setdefault(ob.data.as_pointer(), [])
+        signature = modifier_stack_signature(ob)
+
+        for group_signature, group_obs in groups:
+            if group_signature == signature:
+                group_obs.append(ob)
+                break
+        else:
+            groups.append((signature, [ob]))
+
+    return [group_obs for groups in groups_per_data.values() for _, group_obs in groups]
+
+
 class VIEW3D_OT_ml_apply_all_modifiers_multi_user_data_dialog(Operator):
     bl_idname = "view3d.ml_apply_all_modifiers_multi_user_data_dialog"
     bl_label = "Apply All Modifiers Dialog"
@@ -39,24 +199,35 @@ class VIEW3D_OT_ml_apply_all_modifiers_multi_user_data_dialog(Operator):
             layout.label(text="Done")
             return
 
-        layout.label(text="Active object's data is used by multiple objects. "
-                          "What would you like to do?")
+        apply_to_multiple_obs = has_multiple_objects_to_apply(context)
 
-        layout.separator()
+        if get_ml_active_object().data.users > 1:
+            layout.label(text="Active object's data is used by multiple objects. "
+                              "What would you like to do?")
 
-        op = layout.operator(self.op_name, text="Apply To Active Object Only (Break Link)")
-        op.multi_user_data_apply_method = 'APPLY_TO_SINGLE'
+            layout.separator()
 
-        op = layout.operator(self.op_name, text="Apply To All Objects")
-        op.multi_user_data_apply_method = 'APPLY_TO_ALL'
+            op = layout.operator(self.op_name, text="Apply To Active Object Only (Break Link)")
+            op.multi_user_data_apply_method = 'APPLY_TO_SINGLE'
+        else:
+            layout.label(text="Some selected objects share their data. "
+                              "What would you like to do?")
+
+            layout.separator()
 
-        layout.separator()
+        text = ("Apply To All Selected Objects And Their Instances" if apply_to_multiple_obs
+                else "Apply To All Objects")
+        op = layout.operator(self.op_name, text=text)
+        op.multi_user_data_apply_method = 'APPLY_TO_ALL'
 
-        sel_obs = context.selected_objects
+        if apply_to_multiple_obs:
+            layout.separator()
 
-        if (len(sel_obs) > 1 or (sel_obs and get_ml_active_object() not in sel_obs)):
-            layout.label(text="In order to apply all modifiers of all objects, first make their "
-                              "data unique.")
+            # Objects sharing their data and modifier stack get the same
+            # result, so each group only needs to be evaluated once.
+            op = layout.operator(self.op_name,
+                                 text="Apply To All Selected Objects (Share Identical Results)")
+            op.multi_user_data_apply_method = 'APPLY_TO_SELECTION'
 
 
 # It doesn't seem possible to access attributes in execute which are
@@ -65,23 +236,24 @@ class VIEW3D_OT_ml_apply_all_modifiers_multi_user_data_dialog(Operator):
 disallow_applying_hidden_modifiers = False
 
 
-class VIEW3D_OT_ml_apply_all_modifiers(Operator):
-    bl_idname = "view3d.ml_apply_all_modifiers"
-    bl_label = "Apply All Modifiers"
-    bl_description = "Apply all modifiers of the selected object(s)"
+class ApplyAllModifiers:
+    """Base operator for applying all modifiers"""
     bl_options = {'REGISTER', 'UNDO'}
 
     multi_user_data_apply_method_items = [
         ('NONE', "None", ""),
         ("APPLY_TO_SINGLE", "Apply To Single", ""),
-        ("APPLY_TO_ALL", "Apply To All", "")
+        ("APPLY_TO_ALL", "Apply To All", ""),
+        ("APPLY_TO_SELECTION", "Apply To Selection", "")
     ]
     multi_user_data_apply_method: EnumProperty(
         items=multi_user_data_apply_method_items,
         default='NONE',
         options={'HIDDEN', 'SKIP_SAVE'})
 
-    def __init__(self):
+    def init_state(self):
+        # Not done in __init__, which bpy_struct may define before this
+        # class in the MRO of the operators.
         self.objects_have_local_data = False
         self.objects_have_modifiers = False
         self.objects_have_local_modifiers = False
@@ -94,6 +266,8 @@ class VIEW3D_OT_ml_apply_all_modifiers(Operator):
         return get_ml_active_object() is not None or bool(context.selected_objects)
 
     def execute(self, context):
+        self.init_state()
+
         is_edit_mode = context.mode in {'EDIT_MESH', 'EDIT_CURVE', 'EDIT_SURFACE',
                                         'EDIT_TEXT', 'EDIT_LATTICE'}
 
@@ -101,28 +275,51 @@ class VIEW3D_OT_ml_apply_all_modifiers(Operator):
             bpy.ops.object.editmode_toggle()
             bpy.ops.ed.undo_push(message="Toggle Editmode")
 
-        if self.multi_user_data_apply_method != 'NONE':
+        method = self.multi_user_data_apply_method
+        obs = self.get_objects_with_local_data(context)
+
+        if method == 'APPLY_TO_SINGLE':
             self.linked_object_data_changer = LinkedObjectDataChanger(get_ml_active_object())
             self.linked_object_data_changer.make_active_instance_data_unique()
-
-        self.apply_modifiers(context)
+        elif method == 'APPLY_TO_ALL':
+            self.shared_data_planner = SharedDataApplyPlanner(
+                [ob for ob in obs if ob.modifiers], get_ml_active_object())
+            obs = self.shared_data_planner.objects_to_apply
+            identical_instances_per_source = self.get_identical_instances_per_source()
+            self.shared_data_planner.make_source_data_unique()
+
+        if method == 'APPLY_TO_SELECTION':
+            self.apply_modifiers_grouped(context, obs)
+        else:
+            self.apply_modifiers(context, obs)
 
         # Cancel if no modifiers were applied
 
         some_mods_were_applied = self.check_for_applied_modifiers_and_report()
 
         if not some_mods_were_applied:
-            if self.multi_user_data_apply_method != 'NONE':
+            if method == 'APPLY_TO_SINGLE':
                 self.linked_object_data_changer.reassign_old_data_to_active_instance()
+            elif method == 'APPLY_TO_ALL':
+                self.shared_data_planner.revert()
             return {'CANCELLED'}
 
         if is_edit_mode:
             bpy.ops.ed.undo_push(message="Apply All Modifiers")
             bpy.ops.object.editmode_toggle()
 
-        # Apply the modifier to all instances
-        if self.multi_user_data_apply_method == 'APPLY_TO_ALL':
-            self.linked_object_data_changer.assign_new_data_to_other_instances()
+        # Apply the modifiers to all instances
+        if method == 'APPLY_TO_ALL':
+            self.shared_data_planner.assign_new_data_to_other_instances()
+
+            # Selected instances whose stack was identical to the
+            # applied one now have their modifiers applied too.
+            for source_ob, identical_obs in identical_instances_per_source.items():
+                if not source_ob.modifiers:
+                    for ob in identical_obs:
+                        ob.modifiers.clear()
+
+            self.shared_data_planner.remove_old_data()
 
         prefs = bpy.context.preferences.addons["modifier_list"].preferences
 
@@ -144,7 +341,11 @@ class VIEW3D_OT_ml_apply_all_modifiers(Operator):
             not prefs.disallow_applying_hidden_modifiers if event.alt
             else prefs.disallow_applying_hidden_modifiers)
 
-        if self.multi_user_data_apply_method == 'NONE' and get_ml_active_object().data.users > 1:
+        if (self.multi_user_data_apply_method == 'NONE'
+                and (get_ml_active_object().data.users > 1
+                     or (has_multiple_objects_to_apply(context)
+                         and any(ob.data and ob.data.users > 1
+                                 for ob in context.selected_objects)))):
             global show_done_label_in_dialog
             show_done_label_in_dialog = False
             bpy.ops.view3d.ml_apply_all_modifiers_multi_user_data_dialog('INVOKE_DEFAULT',
@@ -155,24 +356,22 @@ class VIEW3D_OT_ml_apply_all_modifiers(Operator):
 
         return self.execute(context)
 
-    def apply_modifiers(self, context):
+    def get_objects_with_local_data(self, context):
         ml_act_ob = get_ml_active_object()
 
-        # When the active object has multi-user data, only its modifiers
-        # should be applied.
-        if self.multi_user_data_apply_method != 'NONE':
+        # When the active object's data is made single-user, only its
+        # modifiers should be applied.
+        if self.multi_user_data_apply_method == 'APPLY_TO_SINGLE':
             obs = [ml_act_ob]
         else:
             obs = context.selected_objects.copy()
             if ml_act_ob not in obs:
                 obs.append(ml_act_ob)
 
-        override = context.copy()
+        obs_with_local_data = []
 
         for ob in obs:
-            override['object'] = ob
             data = ob.data
-            mods = ob.modifiers
 
             # Skip linked objects with no library override and local
             # data.
@@ -181,29 +380,80 @@ class VIEW3D_OT_ml_apply_all_modifiers(Operator):
                 continue
 
             self.objects_have_local_data = True
+            obs_with_local_data.append(ob)
+
+        return obs_with_local_data
+
+    def get_identical_instances_per_source(self):
+        planner = self.shared_data_planner
+        identical_instances_per_source = {}
 
-            for mod in mods:
+        for source_ob, other_obs in planner.other_given_users_per_source.items():
+            source_signature = modifier_stack_signature(source_ob)
+            identical_instances_per_source[source_ob] = [
+                ob for ob in other_obs if modifier_stack_signature(ob) == source_signature]
+
+        return identical_instances_per_source
+
+    def apply_modifiers(self, context, obs):
+        override = context.copy()
+
+        for ob in obs:
+            if (can_apply_all_modifiers_at_once(ob)
+                    and apply_all_modifiers_at_once(context, ob)):
                 self.objects_have_modifiers = True
+                self.objects_have_local_modifiers = True
+                continue
 
-                if disallow_applying_hidden_modifiers and not mod.show_viewport:
-                    continue
-
-                # Only try to apply local modifiers
-                if not ob.override_library or mod.is_property_overridable_library("name"):
-                    try:
-                        bpy.ops.object.modifier_apply(override, modifier=mod.name)
-                    except:
-                        if ob.name not in self.ojects_with_modifiers_failed_to_apply:
-                            self.ojects_with_modifiers_failed_to_apply.append(ob.name)
-                    self.objects_have_local_modifiers = True
-                else:
-                    self.skipped_linked_modifiers = True
-
-            # Make sure some modifier is always active even if all
-            # modifiers can't be applied
-            mods_len = len(mods) - 1
-            new_index = np.clip(mods_len, 0, 99)
-            ob.ml_modifier_active_index = new_index
+            self.apply_modifiers_one_by_one(ob, override)
+
+    def apply_modifiers_grouped(self, context, obs):
+        """Applies the modifiers of the given objects so that objects
+        sharing their data and modifier stack are evaluated only once.
+        """
+        override = context.copy()
+        obs = [ob for ob in obs if ob.modifiers]
+
+        for group_obs in group_objects_by_data_and_modifier_stack(obs):
+            if (all(can_apply_all_modifiers_at_once(ob, allow_multi_user_data=True)
+                    for ob in group_obs)
+                    and apply_all_modifiers_of_group(context, group_obs)):
+                self.objects_have_modifiers = True
+                self.objects_have_local_modifiers = True
+                continue
+
+            # Applying one by one needs single-user data
+            for ob in group_obs:
+                if ob.data.users > 1:
+                    ob.data = ob.data.copy()
+                self.apply_modifiers_one_by_one(ob, override)
+
+    def apply_modifiers_one_by_one(self, ob, override):
+        override['object'] = ob
+        mods = ob.modifiers
+
+        for mod in mods:
+            self.objects_have_modifiers = True
+
+            if disallow_applying_hidden_modifiers and not mod.show_viewport:
+                continue
+
+            # Only try to apply local modifiers
+            if not ob.override_library or mod.is_property_overridable_library("name"):
+                try:
+                    bpy.ops.object.modifier_apply(override, modifier=mod.name)
+                except:
+                    if ob.name not in self.ojects_with_modifiers_failed_to_apply:
+                        self.ojects_with_modifiers_failed_to_apply.append(ob.name)
+                self.objects_have_local_modifiers = True
+            else:
+                self.skipped_linked_modifiers = True
+
+        # Make sure some modifier is always active even if all
+        # modifiers can't be applied
+        mods_len = len(mods) - 1
+        new_index = np.clip(mods_len, 0, 99)
+        ob.ml_modifier_active_index = new_index
 
     def check_for_applied_modifiers_and_report(self):
         if not self.objects_have_local_data:
@@ -239,3 +489,139 @@ class VIEW3D_OT_ml_apply_all_modifiers(Operator):
             message = ("Applied all local modifiers" if self.skipped_linked_modifiers
                        else "Applied all modifiers")
             self.report({'INFO'}, message + skipped_obs_with_non_local_data_message)
+
+
+class VIEW3D_OT_ml_apply_all_modifiers(Operator, ApplyAllModifiers):
+    bl_idname = "view3d.ml_apply_all_modifiers"
+    bl_label = "Apply All Modifiers"
+    bl_description = "Apply all modifiers of the selected object(s)"
+
+
+class VIEW3D_OT_ml_apply_all_modifiers_modal(Operator, ApplyAllModifiers):
+    bl_idname = "view3d.ml_apply_all_modifiers_modal"
+    bl_label = "Apply All Modifiers (Interruptible)"
+    bl_description = ("Apply all modifiers of the selected object(s) a few objects at a time, "
+                      "showing the progress. Press Esc to stop.\n"
+                      "Objects sharing their data and modifier stack are applied together")
+
+    # The number of groups applied before stopping with Esc, so redo
+    # applies only those. -1 means all groups.
+    applied_group_count: IntProperty(
+        default=-1,
+        options={'HIDDEN', 'SKIP_SAVE'})
+
+    # Seconds spent applying modifiers per timer event. Between those,
+    # the UI is redrawn and Esc is handled.
+    time_budget = 0.05
+
+    def invoke(self, context, event):
+        self.init_state()
+
+        prefs = bpy.context.preferences.addons["modifier_list"].preferences
+        global disallow_applying_hidden_modifiers
+        disallow_applying_hidden_modifiers = (
+            not prefs.disallow_applying_hidden_modifiers if event.alt
+            else prefs.disallow_applying_hidden_modifiers)
+
+        self.is_edit_mode = context.mode in {'EDIT_MESH', 'EDIT_CURVE', 'EDIT_SURFACE',
+                                             'EDIT_TEXT', 'EDIT_LATTICE'}
+
+        if self.is_edit_mode:
+            bpy.ops.object.editmode_toggle()
+            bpy.ops.ed.undo_push(message="Toggle Editmode")
+
+        obs = [ob for ob in self.get_objects_with_local_data(context) if ob.modifiers]
+        self.groups = group_objects_by_data_and_modifier_stack(obs)
+        self.group_index = 0
+        self.processed_object_count = 0
+        self.object_count = len(obs)
+
+        if not self.groups:
+            self.check_for_applied_modifiers_and_report()
+            return {'CANCELLED'}
+
+        wm = context.window_manager
+        wm.progress_begin(0, self.object_count)
+        self.timer = wm.event_timer_add(0.001, window=context.window)
+        wm.modal_handler_add(self)
+
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        # Redo and running from scripts apply everything (or the groups
+        # applied before stopping) at once
+        self.multi_user_data_apply_method = 'APPLY_TO_SELECTION'
+        return ApplyAllModifiers.execute(self, context)
+
+    def get_objects_with_local_data(self, context):
+        obs = ApplyAllModifiers.get_objects_with_local_data(self, context)
+
+        if self.applied_group_count < 0:
+            return obs
+
+        groups = group_objects_by_data_and_modifier_stack([ob for ob in obs if ob.modifiers])
+        return [ob for group_obs in groups[:self.applied_group_count] for ob in group_obs]
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            return self.finish(context, stopped=True)
+
+        # Block other events so the objects can't be changed while
+        # applying.
+        if event.type != 'TIMER':
+            return {'RUNNING_MODAL'}
+
+        start = perf_counter()
+
+        while self.group_index < len(self.groups) and perf_counter() - start < self.time_budget:
+            group_obs = self.groups[self.group_index]
+            self.apply_modifiers_grouped(context, group_obs)
+            self.group_index += 1
+            self.processed_object_count += len(group_obs)
+
+        context.window_manager.progress_update(self.processed_object_count)
+
+        if self.group_index == len(self.groups):
+            return self.finish(context)
+
+        return {'RUNNING_MODAL'}
+
+    def cancel(self, context):
+        # E.g. when a file is loaded while applying
+        self.end_progress(context)
+
+    def end_progress(self, context):
+        wm = context.window_manager
+        wm.event_timer_remove(self.timer)
+        wm.progress_end()
+
+    def finish(self, context, stopped=False):
+        self.end_progress(context)
+
+        if stopped and not self.processed_object_count:
+            self.report({'INFO'}, "Stopped before applying any modifiers")
+            return {'CANCELLED'}
+
+        if stopped:
+            self.applied_group_count = self.group_index
+
+        # Changes have been made at this point even when stopped, so
+        # the operator needs to finish to get an undo step.
+        if not self.check_for_applied_modifiers_and_report():
+            return {'CANCELLED'}
+
+        if self.is_edit_mode:
+            bpy.ops.ed.undo_push(message="Apply All Modifiers")
+            bpy.ops.object.editmode_toggle()
+
+        prefs = bpy.context.preferences.addons["modifier_list"].preferences
+
+        if stopped:
+            self.report({'INFO'}, f"Stopped after applying the modifiers of "
+                                  f"{self.processed_object_count} of {self.object_count} objects")
+        elif self.ojects_with_modifiers_failed_to_apply:
+            self.some_modifiers_could_not_be_applied_report()
+        elif 'APPLY' in prefs.batch_ops_reports:
+            self.apply_report()
+
+        return {'FINISHED'}
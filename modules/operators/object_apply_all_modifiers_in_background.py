@@ -0,0 +1,138 @@
+import bpy
+from bpy.types import Operator
+
+from ..background_apply_utils import (
+    can_apply_in_background,
+    cleanup,
+    import_results,
+    start_workers,
+    stop_workers
+)
+from ..utils import get_ml_active_object
+
+
+class VIEW3D_OT_ml_apply_all_modifiers_in_background(Operator):
+    bl_idname = "view3d.ml_apply_all_modifiers_in_background"
+    bl_label = "Apply All Modifiers In Background"
+    bl_description = ("Apply all modifiers of the selected mesh objects in background Blender "
+                      "processes, which run in parallel. The number of processes can be set "
+                      "in the preferences. Press Esc to cancel.\n"
+                      "Objects with multi-user or linked data are skipped")
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT' and (get_ml_active_object() is not None
+                                             or bool(context.selected_objects))
+
+    def invoke(self, context, event):
+        prefs = bpy.context.preferences.addons["modifier_list"].preferences
+        skip_hidden_modifiers = (
+            not prefs.disallow_applying_hidden_modifiers if event.alt
+            else prefs.disallow_applying_hidden_modifiers)
+
+        if not self.start(context, skip_hidden_modifiers):
+            return {'CANCELLED'}
+
+        wm = context.window_manager
+        wm.progress_begin(0, len(self.jobs))
+        self.timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
+
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        # Redo and running from scripts wait for the workers
+        prefs = bpy.context.preferences.addons["modifier_list"].preferences
+
+        if not self.start(context, prefs.disallow_applying_hidden_modifiers):
+            return {'CANCELLED'}
+
+        for job in self.jobs:
+            job.process.wait()
+
+        return self.finish(context)
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            stop_workers(self.jobs)
+            cleanup(self.temp_dir)
+            self.end_progress(context)
+            self.report({'INFO'}, "Cancelled applying modifiers in background")
+            return {'CANCELLED'}
+
+        # Block other events so the objects can't be changed while the
+        # workers are running.
+        if event.type != 'TIMER':
+            return {'RUNNING_MODAL'}
+
+        finished_count = sum(job.process.poll() is not None for job in self.jobs)
+        context.window_manager.progress_update(finished_count)
+
+        if finished_count < len(self.jobs):
+            return {'RUNNING_MODAL'}
+
+        self.end_progress(context)
+
+        return self.finish(context)
+
+    def cancel(self, context):
+        # E.g. when a file is loaded while the workers are running
+        stop_workers(self.jobs)
+        cleanup(self.temp_dir)
+        self.end_progress(context)
+
+    def start(self, context, skip_hidden_modifiers):
+        ml_act_ob = get_ml_active_object()
+        obs = set(context.selected_objects)
+        obs.add(ml_act_ob)
+        obs.discard(None)
+
+        obs_to_apply = [ob for ob in obs if can_apply_in_background(ob)]
+        self.skipped_count = len([ob for ob in obs if ob.modifiers]) - len(obs_to_apply)
+
+        if not obs_to_apply:
+            self.report({'INFO'}, "No mesh objects with modifiers and local single-user data")
+            return False
+
+        prefs = bpy.context.preferences.addons["modifier_list"].preferences
+        self.temp_dir, self.jobs = start_workers(obs_to_apply,
+                                                 prefs.background_apply_worker_count,
+                                                 context.scene.frame_current,
+                                                 skip_hidden_modifiers)
+        return True
+
+    def end_progress(self, context):
+        wm = context.window_manager
+        wm.event_timer_remove(self.timer)
+        wm.progress_end()
+
+    def finish(self, context):
+        applied_count = 0
+        failed_object_names = []
+
+        try:
+            for job in self.jobs:
+                job_applied_count, job_failed_object_names = import_results(job)
+                applied_count += job_applied_count
+                failed_object_names.extend(job_failed_object_names)
+        finally:
+            cleanup(self.temp_dir)
+
+        if not applied_count:
+            self.report({'WARNING'}, "No modifiers were applied. See the console for details")
+            return {'CANCELLED'}
+
+        skipped_message = (f", skipped {self.skipped_count} objects with multi-user or linked "
+                           "data" if self.skipped_count else "")
+
+        if failed_object_names:
+            self.report({'WARNING'}, "Some modifiers could not be applied on: "
+                        + ", ".join(sorted(failed_object_names)) + skipped_message)
+        else:
+            prefs = bpy.context.preferences.addons["modifier_list"].preferences
+            if 'APPLY' in prefs.batch_ops_reports:
+                self.report({'INFO'}, f"Applied all modifiers of {applied_count} objects"
+                            + skipped_message)
+
+        return {'FINISHED'}
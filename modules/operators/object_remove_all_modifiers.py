@@ -8,7 +8,50 @@ import bpy
 from bpy.props import *
 from bpy.types import Operator
 
-from ..utils import get_ml_active_object, is_modifier_local
+from ..utils import get_ml_active_object
+
+
+def remove_local_modifiers(object):
+    """Removes all local modifiers of the object.
+
+    Modifiers of objects without a library override are all local, so
+    they are removed with a single clear(). For override objects, the
+    modifiers are partitioned once into local and non-local ones and
+    only the local ones are removed. If the active modifier is kept, it
+    stays active.
+
+    Returns a (removed count, skipped non-local count) pair.
+    """
+    mods = object.modifiers
+
+    if not object.override_library:
+        removed_count = len(mods)
+        if removed_count:
+            mods.clear()
+        return removed_count, 0
+
+    if not mods:
+        return 0, 0
+
+    init_active_mod_name = mods[object.ml_modifier_active_index].name
+    local_mods = []
+    non_local_mod_names = []
+
+    for mod in mods:
+        if mod.is_property_overridable_library("name"):
+            local_mods.append(mod)
+        else:
+            non_local_mod_names.append(mod.name)
+
+    for mod in local_mods:
+        mods.remove(mod)
+
+    if non_local_mod_names:
+        object.ml_modifier_active_index = (
+            non_local_mod_names.index(init_active_mod_name)
+            if init_active_mod_name in non_local_mod_names else 0)
+
+    return len(local_mods), len(non_local_mod_names)
 
 
 class VIEW3D_OT_ml_remove_all_modifiers(Operator):
@@ -23,11 +66,9 @@ class VIEW3D_OT_ml_remove_all_modifiers(Operator):
 
     def execute(self, context):
         ml_act_ob = get_ml_active_object()
-        sel_obs = context.selected_objects
-        obs = sel_obs.copy()
-
-        if ml_act_ob not in obs:
-            obs.append(ml_act_ob)
+        obs = set(context.selected_objects)
+        obs.add(ml_act_ob)
+        obs.discard(None)
 
         obs_have_local_mods = False
         skipped_non_local_modifiers = False
@@ -40,24 +81,12 @@ class VIEW3D_OT_ml_remove_all_modifiers(Operator):
 
             all_obs_linked_without_override = False
 
-            # Store the name of the active modifier. In case it's
-            # non-local, it can be then kept active.
-            if ob.modifiers:
-                init_active_mod = ob.modifiers[ob.ml_modifier_active_index]
-                is_local = is_modifier_local(ob, init_active_mod)
-                init_active_non_local_mod_name = None if is_local else init_active_mod.name
-
-            for mod in ob.modifiers:
-                if is_modifier_local(ob, mod):
-                    ob.modifiers.remove(mod)
-                    obs_have_local_mods = True
-                else:
-                    skipped_non_local_modifiers = True
-
-            # Set active modifier index
-            if ob.modifiers:
-                ob.ml_modifier_active_index = (ob.modifiers.find(init_active_non_local_mod_name)
-                                               if init_active_non_local_mod_name else 0)
+            removed_count, skipped_count = remove_local_modifiers(ob)
+
+            if removed_count:
+                obs_have_local_mods = True
+            if skipped_count:
+                skipped_non_local_modifiers = True
 
         if not obs_have_local_mods:
             if all_obs_linked_without_override or skipped_non_local_modifiers:
@@ -0,0 +1,236 @@
+import numpy as np
+
+import bpy
+from bpy.props import *
+from bpy.types import Operator
+
+from ..modifier_categories import MODIFIER_REGISTRY, SUPPORT_APPLY_AS_SHAPE_KEY
+from ..utils import get_ml_active_object, is_modifier_disabled
+
+
+# The maximum length of a BoolVectorProperty
+MAX_MODIFIER_COUNT = 32
+
+
+def get_modifiers_to_save(object, modifier_names=None):
+    """Returns the modifiers of the object which can be saved as a shape
+    key, optionally only the ones with the given names.
+    """
+    if object.type != 'MESH' or object.library or object.data.library:
+        return []
+
+    return [mod for mod in object.modifiers
+            if (modifier_names is None or mod.name in modifier_names)
+            and mod.type in SUPPORT_APPLY_AS_SHAPE_KEY
+            and not is_modifier_disabled(mod)]
+
+
+def save_modifiers_as_shape_keys(context, modifiers_per_object):
+    """Saves each of the given modifiers as a new shape key of its
+    object. Each modifier is evaluated in isolation on the basis shape,
+    like modifier_apply_as_shapekey does.
+
+    All objects are evaluated together, so the number of depsgraph
+    evaluations is the largest number of modifiers of a single object
+    instead of the total number of modifiers.
+
+    modifiers_per_object: {object: [modifier, ...]}
+
+    Returns {object: [name of a saved modifier, ...]}. Modifiers that
+    change the vertex count are skipped, as are objects that aren't
+    evaluated.
+    """
+    modifiers_per_object = {ob: mods for ob, mods in modifiers_per_object.items() if mods}
+    saved_modifiers_per_object = {ob: [] for ob in modifiers_per_object}
+
+    if not modifiers_per_object:
+        return saved_modifiers_per_object
+
+    init_states = {
+        ob: ([mod.show_viewport for mod in ob.modifiers], ob.show_only_shape_key,
+             ob.active_shape_key_index)
+        for ob in modifiers_per_object
+    }
+    # One buffer per object, reused for all of its modifiers
+    coords_per_object = {ob: np.empty(len(ob.data.vertices) * 3, dtype=np.float32)
+                         for ob in modifiers_per_object}
+
+    try:
+        # Show only the basis shape and hide all modifiers, so only the
+        # modifier being saved affects the evaluated mesh.
+        for ob in modifiers_per_object:
+            ob.show_only_shape_key = True
+            ob.active_shape_key_index = 0
+            for mod in ob.modifiers:
+                mod.show_viewport = False
+
+        max_mod_count = max(len(mods) for mods in modifiers_per_object.values())
+
+        for i in range(max_mod_count):
+            obs_and_mods = [(ob, mods[i]) for ob, mods in modifiers_per_object.items()
+                            if i < len(mods)]
+
+            for ob, mod in obs_and_mods:
+                mod.show_viewport = True
+
+            depsgraph = context.evaluated_depsgraph_get()
+
+            for ob, mod in obs_and_mods:
+                coords = coords_per_object[ob]
+                if _read_evaluated_coords(ob, depsgraph, coords):
+                    _add_shape_key(ob, mod.name, coords)
+                    saved_modifiers_per_object[ob].append(mod.name)
+
+                mod.show_viewport = False
+    finally:
+        for ob, (show_viewport_states, show_only_shape_key, active_shape_key_index) \
+                in init_states.items():
+            for mod, show_viewport in zip(ob.modifiers, show_viewport_states):
+                mod.show_viewport = show_viewport
+            ob.show_only_shape_key = show_only_shape_key
+            ob.active_shape_key_index = active_shape_key_index
+
+    return saved_modifiers_per_object
+
+
+def _read_evaluated_coords(object, depsgraph, coords):
+    """Reads the vertex coordinates of the evaluated object into coords.
+    Returns False if the object isn't evaluated (e.g. it's hidden) or
+    the modifier changed the vertex count.
+    """
+    ob_eval = object.evaluated_get(depsgraph)
+
+    if not ob_eval.is_evaluated:
+        return False
+
+    mesh_eval = ob_eval.to_mesh()
+
+    try:
+        if len(mesh_eval.vertices) * 3 != len(coords):
+            return False
+        mesh_eval.vertices.foreach_get("co", coords)
+    finally:
+        ob_eval.to_mesh_clear()
+
+    return True
+
+
+def _add_shape_key(object, name, coords):
+    if not object.data.shape_keys:
+        object.shape_key_add(name="Basis", from_mix=False)
+
+    shape_key = object.shape_key_add(name=name, from_mix=False)
+    shape_key.data.foreach_set("co", coords)
+    object.data.update()
+
+
+class OBJECT_OT_ml_save_modifiers_as_shape_keys(Operator):
+    bl_idname = "object.ml_save_modifiers_as_shape_keys"
+    bl_label = "Save Modifiers As Shape Keys"
+    bl_description = ("Save the chosen deform modifiers as new shape keys, each evaluated on its "
+                      "own. Modifiers with the same names on the other selected objects are "
+                      "saved too")
+    bl_options = {'REGISTER', 'UNDO'}
+
+    # Which of the supported modifiers of the active object to save,
+    # in stack order. Set in invoke.
+    modifier_mask: BoolVectorProperty(
+        size=MAX_MODIFIER_COUNT,
+        options={'SKIP_SAVE'})
+    remove_modifiers: BoolProperty(
+        name="Remove Modifiers",
+        description="Remove the modifiers after saving them as shape keys")
+
+    @classmethod
+    def poll(cls, context):
+        ob = get_ml_active_object()
+        return ob is not None and ob.type == 'MESH' and ob.library is None
+
+    def execute(self, context):
+        ml_active_ob = get_ml_active_object()
+        mod_names = {mod.name for mod, use in zip(self.supported_modifiers(ml_active_ob),
+                                                  self.modifier_mask)
+                     if use}
+
+        if not mod_names:
+            self.report({'INFO'}, "No modifiers to save")
+            return {'CANCELLED'}
+
+        is_editmode = context.mode == 'EDIT_MESH'
+
+        if is_editmode:
+            bpy.ops.object.editmode_toggle()
+            # Add an undo step to avoid problems with undo
+            bpy.ops.ed.undo_push(message="Toggle Editmode")
+
+        mods_per_ob = {}
+        handled_data = set()
+
+        # Shape keys belong to the data, so save them only once per
+        # data when the objects share it.
+        for ob in (ml_active_ob, *context.selected_objects):
+            if ob.data not in handled_data:
+                handled_data.add(ob.data)
+                mods_per_ob[ob] = get_modifiers_to_save(ob, mod_names)
+
+        saved_mods_per_ob = save_modifiers_as_shape_keys(context, mods_per_ob)
+
+        saved_count = 0
+
+        for ob, saved_mod_names in saved_mods_per_ob.items():
+            saved_count += len(saved_mod_names)
+
+            if self.remove_modifiers:
+                for name in saved_mod_names:
+                    ob.modifiers.remove(ob.modifiers[name])
+
+        if is_editmode:
+            bpy.ops.object.editmode_toggle()
+
+        if not saved_count:
+            self.report({'INFO'}, "No modifiers were saved")
+            return {'CANCELLED'}
+
+        mod_count = sum(len(mods) for mods in mods_per_ob.values())
+        if saved_count < mod_count:
+            self.report({'WARNING'}, f"Saved {saved_count} of {mod_count} modifiers, the rest "
+                        "changed the vertex count or the object is not evaluated")
+        else:
+            self.report({'INFO'}, f"Saved {saved_count} modifiers as shape keys")
+
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        ml_active_ob = get_ml_active_object()
+        prefs = bpy.context.preferences.addons["modifier_list"].preferences
+        disallow_applying_hidden_modifiers = (
+            not prefs.disallow_applying_hidden_modifiers if event.alt
+            else prefs.disallow_applying_hidden_modifiers)
+
+        mods = self.supported_modifiers(ml_active_ob)
+
+        if not mods:
+            self.report({'INFO'}, "No modifiers that can be saved as shape keys")
+            return {'CANCELLED'}
+
+        self.modifier_mask = [
+            i < len(mods) and not (disallow_applying_hidden_modifiers
+                                   and not mods[i].show_viewport)
+            for i in range(MAX_MODIFIER_COUNT)
+        ]
+
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        layout = self.layout
+        mods = self.supported_modifiers(get_ml_active_object())
+
+        col = layout.column(align=True)
+        for i, mod in enumerate(mods):
+            icon = MODIFIER_REGISTRY.info_per_type[mod.type].icon
+            col.prop(self, "modifier_mask", index=i, text=mod.name, icon=icon)
+
+        layout.prop(self, "remove_modifiers")
+
+    def supported_modifiers(self, object):
+        return get_modifiers_to_save(object)[:MAX_MODIFIER_COUNT]
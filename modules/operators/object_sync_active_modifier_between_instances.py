@@ -1,7 +1,12 @@
 import bpy
+from bpy.props import *
 from bpy.types import Operator
 
-from ..utils import get_editable_bpy_object_props, get_ml_active_object, sync_bpy_object_props
+from ..utils import (
+    get_ml_active_object,
+    print_property_changes,
+    sync_changed_bpy_object_props
+)
 
 
 class OBJECT_OT_ml_sync_active_modifier_between_instances(Operator):
@@ -11,10 +16,16 @@ class OBJECT_OT_ml_sync_active_modifier_between_instances(Operator):
                       "object and the modifier name and type")
     bl_options = {'INTERNAL'}
 
+    dry_run: BoolProperty(
+        name="Dry Run",
+        description="Only report the properties that would be changed",
+        options={'SKIP_SAVE'})
+
     def __init__(self):
         self.obs_already_in_sync_count = 0
         self.obs_synced_count = 0
         self.obs_without_syncable_modifier_count = 0
+        self.changes = []
 
     @classmethod
     def poll(cls, context):
@@ -30,6 +41,12 @@ class OBJECT_OT_ml_sync_active_modifier_between_instances(Operator):
 
         self.sync_modifiers(source_mod, dest_obs)
 
+        if self.dry_run:
+            print_property_changes(self.changes)
+            self.report({'INFO'}, f"Would change {len(self.changes)} properties on "
+                        f"{self.obs_synced_count} instances (see the console)")
+            return {'CANCELLED'}
+
         synced_some_modifiers = self.check_if_modifiers_were_synced_and_report(dest_obs)
 
         if not synced_some_modifiers:
@@ -38,10 +55,6 @@ class OBJECT_OT_ml_sync_active_modifier_between_instances(Operator):
         return {'FINISHED'}
 
     def sync_modifiers(self, source_modifier, dest_objects):
-        props_to_sync_separately = {"show_render"}
-        source_mod_geom_updating_props = get_editable_bpy_object_props(source_modifier,
-                                                                       props_to_sync_separately)
-
         for dest_ob in dest_objects:
             dest_ob_mod_names = [mod.name for mod in dest_ob.modifiers]
 
@@ -55,21 +68,13 @@ class OBJECT_OT_ml_sync_active_modifier_between_instances(Operator):
                 self.obs_without_syncable_modifier_count += 1
                 continue
 
-            dest_mod_geom_updating_props = get_editable_bpy_object_props(
-                dest_mod, props_to_sync_separately)
-
-            synced = False
-
-            # Check name and show_render and other properties
-            # separately to avoid updating geometry unnecessarily.
-            if source_mod_geom_updating_props != dest_mod_geom_updating_props:
-                sync_bpy_object_props(source_modifier, dest_mod)
-                synced = True
-            if dest_mod.show_render is not source_modifier.show_render:
-                dest_mod.show_render = source_modifier.show_render
-                synced = True
+            # Write only the changed properties to avoid updating
+            # geometry unnecessarily.
+            changes = sync_changed_bpy_object_props(source_modifier, dest_mod, object=dest_ob,
+                                                    dry_run=self.dry_run)
+            self.changes.extend(changes)
 
-            if synced:
+            if changes:
                 self.obs_synced_count += 1
             else:
                 self.obs_already_in_sync_count += 1
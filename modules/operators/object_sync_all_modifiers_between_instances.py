@@ -1,7 +1,109 @@
 import bpy
+from bpy.props import *
 from bpy.types import Operator
 
-from ..utils import get_editable_bpy_object_props, get_ml_active_object, sync_bpy_object_props
+from ..utils import get_ml_active_object, print_property_changes, sync_changed_bpy_object_props
+
+
+def modifier_stack_edit_script(source_keys, dest_keys):
+    """Computes the edits needed to turn the dest stack into the source
+    stack, keeping the longest common subsequence of the keys (e.g.
+    (type, name) pairs) in place.
+
+    Returns a (matches, deletes, inserts) tuple: (source index, dest
+    index) pairs of the kept modifiers, the dest indices of the
+    modifiers to remove and the source indices of the modifiers to add.
+    """
+    source_len = len(source_keys)
+    dest_len = len(dest_keys)
+
+    # lcs_lengths[i][j] is the LCS length of source_keys[i:] and
+    # dest_keys[j:]
+    lcs_lengths = [[0] * (dest_len + 1) for _ in range(source_len + 1)]
+
+    for i in range(source_len - 1, -1, -1):
+        for j in range(dest_len - 1, -1, -1):
+            if source_keys[i] == dest_keys[j]:
+                lcs_lengths[i][j] = lcs_lengths[i + 1][j + 1] + 1
+            else:
+                lcs_lengths[i][j] = max(lcs_lengths[i + 1][j], lcs_lengths[i][j + 1])
+
+    matches = []
+    i = j = 0
+
+    while i < source_len and j < dest_len:
+        if source_keys[i] == dest_keys[j]:
+            matches.append((i, j))
+            i += 1
+            j += 1
+        elif lcs_lengths[i + 1][j] >= lcs_lengths[i][j + 1]:
+            i += 1
+        else:
+            j += 1
+
+    matched_source_indices = {i for i, _ in matches}
+    matched_dest_indices = {j for _, j in matches}
+    deletes = [j for j in range(dest_len) if j not in matched_dest_indices]
+    inserts = [i for i in range(source_len) if i not in matched_source_indices]
+
+    return matches, deletes, inserts
+
+
+def _move_modifier(object, from_index, to_index):
+    mods = object.modifiers
+
+    if hasattr(mods, "move"):
+        mods.move(from_index, to_index)
+    else:
+        override = bpy.context.copy()
+        override['object'] = object
+        bpy.ops.object.modifier_move_to_index(override, modifier=mods[from_index].name,
+                                              index=to_index)
+
+
+def sync_modifier_stack_structure(source_object, dest_object, dry_run=False):
+    """Makes the modifier stack of dest_object match the one of
+    source_object by type and name with the fewest removals and
+    additions (see modifier_stack_edit_script), so the kept modifiers
+    keep e.g. their bind data. The properties of the kept modifiers are
+    synced and the added modifiers get the properties of the source.
+
+    Returns a (property changes, removed count, added count) tuple.
+    With dry_run, nothing is changed.
+    """
+    source_mods = source_object.modifiers
+    dest_mods = dest_object.modifiers
+    matches, deletes, inserts = modifier_stack_edit_script(
+        [(mod.type, mod.name) for mod in source_mods],
+        [(mod.type, mod.name) for mod in dest_mods])
+
+    changes = []
+
+    for i, j in matches:
+        changes.extend(sync_changed_bpy_object_props(source_mods[i], dest_mods[j],
+                                                     object=dest_object, dry_run=dry_run))
+
+    if dry_run:
+        return changes, len(deletes), len(inserts)
+
+    # Remove first, so the names of the removed modifiers can be used
+    # by the added ones.
+    for j in reversed(deletes):
+        dest_mods.remove(dest_mods[j])
+
+    for i in inserts:
+        source_mod = source_mods[i]
+        new_mod = dest_mods.new(source_mod.name, source_mod.type)
+        sync_changed_bpy_object_props(source_mod, new_mod)
+
+    # The kept modifiers are already in the right order relative to each
+    # other, so only the added ones need to be moved.
+    for i, source_mod in enumerate(source_mods):
+        j = dest_mods.find(source_mod.name)
+        if j != i:
+            _move_modifier(dest_object, j, i)
+
+    return changes, len(deletes), len(inserts)
 
 
 class OBJECT_OT_ml_sync_all_modifiers_between_instances(Operator):
@@ -10,49 +112,54 @@ class OBJECT_OT_ml_sync_all_modifiers_between_instances(Operator):
     bl_description = "Synchronize all modifiers between instances based on the active object"
     bl_options = {'INTERNAL'}
 
+    dry_run: BoolProperty(
+        name="Dry Run",
+        description="Only report the properties that would be changed",
+        options={'SKIP_SAVE'})
+
     @classmethod
     def poll(cls, context):
         return get_ml_active_object().data.users > 1
 
     def execute(self, context):
-        props_to_sync_separately = {"name", "show_render"}
         source_ob = get_ml_active_object()
         source_mods = source_ob.modifiers
-        source_mod_names_types = [mod.type for mod in source_mods]
-        source_geom_updating_props_per_mod = [
-            get_editable_bpy_object_props(mod, props_to_sync_separately) for mod in source_mods]
+        source_mod_types = [mod.type for mod in source_mods]
 
         dest_obs = list(bpy.data.user_map(subset=[source_ob.data]).values()).pop()
         dest_obs.remove(source_ob)
-        
-        needed_syncing = False
+
+        changes = []
+        removed_count = 0
+        added_count = 0
 
         for ob in dest_obs:
-            dest_mod_names_types = [mod.type for mod in ob.modifiers]
-           
-            if source_mod_names_types == dest_mod_names_types:
-                for i, source_mod in enumerate(source_mods):
-                    dest_mod = ob.modifiers[i]
-                    dest_mod_geom_updating_props = get_editable_bpy_object_props(
-                        dest_mod, props_to_sync_separately)
-                    # Check name and show_render and other properties
-                    # separately to avoid updating geometry
-                    # unnecessarily.
-                    if source_geom_updating_props_per_mod[i] != dest_mod_geom_updating_props:
-                        sync_bpy_object_props(source_mod, dest_mod)
-                        needed_syncing = True
-                    for p in props_to_sync_separately:
-                        if getattr(dest_mod, p) != getattr(source_mod, p):
-                            setattr(dest_mod, p, getattr(source_mod, p))
-                            needed_syncing = True
+            dest_mod_types = [mod.type for mod in ob.modifiers]
+
+            if source_mod_types == dest_mod_types:
+                # Write only the changed properties to avoid updating
+                # geometry unnecessarily.
+                for source_mod, dest_mod in zip(source_mods, ob.modifiers):
+                    changes.extend(sync_changed_bpy_object_props(
+                        source_mod, dest_mod, object=ob, dry_run=self.dry_run))
             else:
-                ob.modifiers.clear()
-                for source_mod in source_mods:
-                    new_mod = ob.modifiers.new(source_mod.name, source_mod.type)
-                    sync_bpy_object_props(source_mod, new_mod)
-                needed_syncing = True
+                ob_changes, ob_removed_count, ob_added_count = sync_modifier_stack_structure(
+                    source_ob, ob, dry_run=self.dry_run)
+                changes.extend(ob_changes)
+                removed_count += ob_removed_count
+                added_count += ob_added_count
+
+                if self.dry_run:
+                    print(f"{ob.name}: would remove {ob_removed_count} and add "
+                          f"{ob_added_count} modifiers")
+
+        if self.dry_run:
+            print_property_changes(changes)
+            self.report({'INFO'}, f"Would change {len(changes)} properties, remove "
+                        f"{removed_count} and add {added_count} modifiers (see the console)")
+            return {'CANCELLED'}
 
-        if not needed_syncing:
+        if not changes and not removed_count and not added_count:
             self.report({'INFO'}, "Modifiers already in sync")
             return {'CANCELLED'}
 
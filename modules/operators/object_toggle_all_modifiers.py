@@ -4,13 +4,90 @@ meta-androcto, saidenka and lijenstina.
 https://wiki.blender.org/wiki/Extensions:2.6/Py/Scripts/3D_interaction/modifier_tools
 """
 
+import numpy as np
+
 import bpy
 from bpy.props import *
 from bpy.types import Operator
 
+from ..modifier_categories import DONT_SUPPORT_SHOW_IN_EDITMODE, SUPPORT_SHOW_ON_CAGE
 from ..utils import get_ml_active_object
 
 
+# Dont toggle the visibility of collision modifiers as that can
+# apparently cause problems in some scenes.
+DONT_TOGGLE = {'COLLISION'}
+
+
+def _can_toggle(modifier_type, visibility_property):
+    if modifier_type in DONT_TOGGLE:
+        return False
+    elif visibility_property == "show_in_editmode":
+        return modifier_type not in DONT_SUPPORT_SHOW_IN_EDITMODE
+    elif visibility_property == "show_on_cage":
+        return modifier_type in SUPPORT_SHOW_ON_CAGE
+
+    return True
+
+
+def get_toggle_mask(object, visibility_property, modifier_types=None):
+    """Returns a NumPy bool array telling which modifiers of the object
+    can be toggled, optionally only the ones of the given types.
+    """
+    return np.fromiter(
+        (_can_toggle(mod.type, visibility_property)
+         and (not modifier_types or mod.type in modifier_types)
+         for mod in object.modifiers),
+        dtype=bool, count=len(object.modifiers))
+
+
+def get_visibility_states(object, visibility_property):
+    """Returns the values of the given bool property of all modifiers of
+    the object as a NumPy bool array.
+    """
+    states = np.empty(len(object.modifiers), dtype=bool)
+    object.modifiers.foreach_get(visibility_property, states)
+    return states
+
+
+def set_modifiers_visibility(objects, visibility_property, show, modifier_types=None):
+    """Sets the given bool property (e.g. "show_viewport") of the
+    modifiers of the objects which support it, except for collision
+    modifiers, and optionally only for the modifiers of the given types.
+
+    The values are read and written with foreach_get/foreach_set, which
+    doesn't run the update callbacks of the property, so the changed
+    objects are tagged for an update here.
+
+    Returns the number of objects whose modifiers were changed.
+    """
+    changed_objects = []
+
+    for ob in objects:
+        if not ob.modifiers:
+            continue
+
+        mask = get_toggle_mask(ob, visibility_property, modifier_types)
+        states = get_visibility_states(ob, visibility_property)
+
+        if not (states[mask] != show).any():
+            continue
+
+        states[mask] = show
+        ob.modifiers.foreach_set(visibility_property, states)
+        ob.update_tag(refresh={'OBJECT', 'DATA'})
+        changed_objects.append(ob)
+
+    # Assign one value through RNA so the update callback of the
+    # property runs once, which also rebuilds the depsgraph relations
+    # and sends the notifiers for redrawing the UI.
+    if changed_objects:
+        last_mod = changed_objects[-1].modifiers[-1]
+        setattr(last_mod, visibility_property, getattr(last_mod, visibility_property))
+
+    return len(changed_objects)
+
+
 class VIEW3D_OT_ml_toggle_all_modifiers(Operator):
     bl_idname = "view3d.ml_toggle_all_modifiers"
     bl_label = "Toggle Visibility Of All Modifiers"
@@ -18,6 +95,21 @@ class VIEW3D_OT_ml_toggle_all_modifiers(Operator):
                       "The active object must have modifiers")
     bl_options = {'REGISTER', 'UNDO'}
 
+    visibility_property_items = [
+        ("show_viewport", "Viewport", "Toggle the visibility in the viewport"),
+        ("show_render", "Render", "Toggle the visibility in renders"),
+        ("show_in_editmode", "Edit Mode", "Toggle the visibility in Edit Mode"),
+        ("show_on_cage", "On Cage", "Toggle adjusting the edit cage to the modifier result"),
+    ]
+    visibility_property: EnumProperty(
+        items=visibility_property_items,
+        name="Visibility",
+        default='show_viewport')
+    modifier_types: StringProperty(
+        name="Modifier Types",
+        description="Comma-separated modifier types to toggle, e.g. \"SUBSURF, BEVEL\". "
+                    "When empty, all modifiers are toggled")
+
     @classmethod
     def poll(cls, context):
         ml_act_ob = get_ml_active_object()
@@ -25,15 +117,25 @@ class VIEW3D_OT_ml_toggle_all_modifiers(Operator):
 
     def execute(self, context):
         ml_act_ob = get_ml_active_object()
-        sel_obs = context.selected_objects
-        obs = sel_obs.copy()
+        obs = set(context.selected_objects)
+        obs.add(ml_act_ob)
 
-        if ml_act_ob not in obs:
-            obs.append(ml_act_ob)
+        mod_types = {mod_type.strip().upper() for mod_type in self.modifier_types.split(",")
+                     if mod_type.strip()}
+
+        # Toggle based on the modifiers of the active object, or on all
+        # objects if the active one has none of the given types.
+        prop = self.visibility_property
+        ml_act_ob_mask = get_toggle_mask(ml_act_ob, prop, mod_types)
+        if ml_act_ob_mask.any():
+            show_mods = not get_visibility_states(ml_act_ob, prop)[ml_act_ob_mask].any()
+        else:
+            show_mods = not any(
+                get_visibility_states(ob, prop)[get_toggle_mask(ob, prop, mod_types)].any()
+                for ob in obs if ob.modifiers)
 
-        ml_act_ob_all_mods_vis = [mod.show_viewport for mod in ml_act_ob.modifiers]
-        show_mods = not any(ml_act_ob_all_mods_vis)
         skipped_linked_obs = False
+        obs_to_toggle = []
 
         for ob in obs:
             # Skip linked objects if they don't have a library override
@@ -41,18 +143,25 @@ class VIEW3D_OT_ml_toggle_all_modifiers(Operator):
                 skipped_linked_obs = True
                 continue
 
-            for mod in ob.modifiers:
-                # Dont toggle the visibility of collision modifiers as that
-                # can apparently cause problems in some scenes.
-                if not mod.type == 'COLLISION':
-                    mod.show_viewport = show_mods
+            obs_to_toggle.append(ob)
+
+        set_modifiers_visibility(obs_to_toggle, prop, show_mods, mod_types)
 
         prefs = bpy.context.preferences.addons["modifier_list"].preferences
 
         if 'TOGGLE_VISIBILITY' in prefs.batch_ops_reports:
             skipped_linked_obs_message = (" (skipped linked objects with no override)"
                                           if skipped_linked_obs else "")
-            message = "Displaying all modifiers" if show_mods else "Hiding all modifiers"
+            mods_message = (f"all {', '.join(sorted(mod_types))} modifiers" if mod_types
+                            else "all modifiers")
+            if prop == 'show_viewport':
+                message = (f"Displaying {mods_message}" if show_mods
+                           else f"Hiding {mods_message}")
+            else:
+                label = next(item[1] for item in self.visibility_property_items
+                             if item[0] == prop)
+                message = (f"{'Enabled' if show_mods else 'Disabled'} {label} for "
+                           f"{mods_message}")
             self.report({'INFO'}, message + skipped_linked_obs_message)
 
         return {'FINISHED'}
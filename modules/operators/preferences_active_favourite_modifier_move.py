@@ -3,7 +3,7 @@ from bpy.props import *
 from bpy.types import Operator
 
 
-from ..utils import get_favourite_modifiers
+from ..utils import get_favourite_modifiers, invalidate_favourite_modifiers_grid
 
 
 class FavouriteModifierMoveBase:
@@ -21,6 +21,8 @@ class FavouriteModifierMoveBase:
         for i, mod in enumerate(fav_mods):
             setattr(prefs, fav_mod_attr_names[i], mod)
 
+        invalidate_favourite_modifiers_grid()
+
         ml_props.active_favourite_modifier_slot_index = new_index
 
         return {'FINISHED'}
@@ -1,6 +1,6 @@
 from bpy.types import Operator
 
-from ..utils import get_favourite_modifiers
+from ..utils import get_favourite_modifiers, invalidate_favourite_modifiers_grid
 
 
 class WM_OT_ml_active_favourite_modifier_remove(Operator):
@@ -24,6 +24,8 @@ class WM_OT_ml_active_favourite_modifier_remove(Operator):
         for i, mod in enumerate(fav_mods):
             setattr(prefs, fav_mod_attr_names[i], mod)
 
+        invalidate_favourite_modifiers_grid()
+
         ml_props.active_favourite_modifier_slot_index = active_index - 1 if active_index > 0 else 0
 
         return {'FINISHED'}
@@ -3,7 +3,7 @@ from bpy.props import *
 from bpy.types import Operator
 
 
-from ..utils import get_favourite_modifiers
+from ..utils import get_favourite_modifiers, invalidate_favourite_modifiers_grid
 
 
 class UI_OT_ml_favourite_modifier_toggle(Operator):
@@ -56,4 +56,6 @@ class UI_OT_ml_favourite_modifier_toggle(Operator):
         for i, mod in enumerate(mods):
             setattr(prefs, fav_mod_attr_names[i], mod)
 
+        invalidate_favourite_modifiers_grid()
+
         return {'FINISHED'}
@@ -1,6 +1,6 @@
 from bpy.types import Operator
 
-from ..utils import get_favourite_modifiers
+from ..utils import get_favourite_modifiers, invalidate_favourite_modifiers_grid
 
 
 class WM_OT_ml_sort_favourite_modifiers(Operator):
@@ -20,4 +20,6 @@ class WM_OT_ml_sort_favourite_modifiers(Operator):
         for i, mod in enumerate(mods):
             setattr(prefs, fav_mod_attr_names[i], mod)
 
+        invalidate_favourite_modifiers_grid()
+
         return {'FINISHED'}
@@ -8,11 +8,14 @@ from bpy.props import *
 from bpy.types import AddonPreferences, PropertyGroup
 from mathutils import Vector
 
+from . import live_instance_sync
 from .icons import load_icons
 from .modifier_categories import ALL_MODIFIERS_NAMES_ICONS_TYPES
 from .ui.properties_editor import register_DATA_PT_modifiers, reregister_DATA_PT_modifiers
+from .ui import draw_profiler
 from .ui.ui_common import box_with_header, favourite_modifiers_configuration_layout
 from .ui.sidebar import update_sidebar_category
+from .utils import invalidate_favourite_modifiers_grid
 
 
 # Property reading
@@ -141,6 +144,21 @@ def icon_color_callback(self, context):
     prefs_callback(self, context)
 
 
+def favourites_callback(self, context):
+    invalidate_favourite_modifiers_grid()
+    prefs_callback(self, context)
+
+
+def draw_profiler_callback(self, context):
+    draw_profiler.set_enabled(self.use_draw_profiler)
+    prefs_callback(self, context)
+
+
+def live_instance_sync_callback(self, context):
+    live_instance_sync.set_enabled(self.use_live_instance_sync)
+    prefs_callback(self, context)
+
+
 # Modifier default settings
 # ======================================================================
 
@@ -475,7 +493,7 @@ class Preferences(AddonPreferences):
         name="Favourites Per Row",
         description="The number of favourites per row",
         default="2",
-        update=prefs_callback)
+        update=favourites_callback)
 
     auto_sort_favourites_when_choosing_from_menu: BoolProperty(
         name="Auto Sort Favourites When Choosing From Menu",
@@ -483,24 +501,24 @@ class Preferences(AddonPreferences):
                     "Also removes empty slots between favourites",
         update=prefs_callback)
 
-    modifier_01: StringProperty(description="Add a favourite modifier", update=prefs_callback)
-    modifier_02: StringProperty(description="Add a favourite modifier", update=prefs_callback)
-    modifier_03: StringProperty(description="Add a favourite modifier", update=prefs_callback)
-    modifier_04: StringProperty(description="Add a favourite modifier", update=prefs_callback)
-    modifier_05: StringProperty(description="Add a favourite modifier", update=prefs_callback)
-    modifier_06: StringProperty(description="Add a favourite modifier", update=prefs_callback)
-    modifier_07: StringProperty(description="Add a favourite modifier", update=prefs_callback)
-    modifier_08: StringProperty(description="Add a favourite modifier", update=prefs_callback)
-    modifier_09: StringProperty(description="Add a favourite modifier", update=prefs_callback)
-    modifier_10: StringProperty(description="Add a favourite modifier", update=prefs_callback)
-    modifier_11: StringProperty(description="Add a favourite modifier", update=prefs_callback)
-    modifier_12: StringProperty(description="Add a favourite modifier", update=prefs_callback)
+    modifier_01: StringProperty(description="Add a favourite modifier", update=favourites_callback)
+    modifier_02: StringProperty(description="Add a favourite modifier", update=favourites_callback)
+    modifier_03: StringProperty(description="Add a favourite modifier", update=favourites_callback)
+    modifier_04: StringProperty(description="Add a favourite modifier", update=favourites_callback)
+    modifier_05: StringProperty(description="Add a favourite modifier", update=favourites_callback)
+    modifier_06: StringProperty(description="Add a favourite modifier", update=favourites_callback)
+    modifier_07: StringProperty(description="Add a favourite modifier", update=favourites_callback)
+    modifier_08: StringProperty(description="Add a favourite modifier", update=favourites_callback)
+    modifier_09: StringProperty(description="Add a favourite modifier", update=favourites_callback)
+    modifier_10: StringProperty(description="Add a favourite modifier", update=favourites_callback)
+    modifier_11: StringProperty(description="Add a favourite modifier", update=favourites_callback)
+    modifier_12: StringProperty(description="Add a favourite modifier", update=favourites_callback)
 
     use_icons_in_favourites: BoolProperty(
         name="Use Icons In Favourites",
         description="Use icons in favourite modifier buttons",
         default=True,
-        update=prefs_callback)
+        update=favourites_callback)
 
     insert_modifier_after_active: BoolProperty(
         name="Insert New Modifier After Active",
@@ -564,6 +582,29 @@ class Preferences(AddonPreferences):
         options={'ENUM_FLAG'},
         update=prefs_callback)
 
+    background_apply_worker_count: IntProperty(
+        name="Background Apply Workers",
+        description="The number of background Blender processes used by Apply All Modifiers "
+                    "In Background",
+        default=4,
+        min=1,
+        max=64,
+        update=prefs_callback)
+
+    use_live_instance_sync: BoolProperty(
+        name="Live Instance Sync",
+        description="Synchronize edits of the modifiers of the active object to the other "
+                    "objects using the same data while editing. Modifiers are matched by name "
+                    "and type",
+        update=live_instance_sync_callback)
+
+    use_draw_profiler: BoolProperty(
+        name="Profile Drawing",
+        description="Measure the draw times of the parts of the popup, sidebar and Properties "
+                    "Editor layouts and show them at the bottom of the layouts. "
+                    "For debugging slow drawing",
+        update=draw_profiler_callback)
+
     # === Popup settings ===
     popup_width: IntProperty(
         name="Width",
@@ -705,6 +746,10 @@ class Preferences(AddonPreferences):
             split.label(text="Show Info Messages For")
             split.row().prop(self, "batch_ops_reports", expand=True)
 
+            box.prop(self, "background_apply_worker_count")
+            box.prop(self, "use_live_instance_sync")
+            box.prop(self, "use_draw_profiler")
+
         # === Popup ===
         _, box = box_with_header(layout, "Popup", prefs_ui_props, "popup_expand")
 
@@ -9,10 +9,31 @@ from . import modifier_categories
 # Callbacks
 # ======================================================================
 
+# The last known active modifier index per object pointer
+_active_modifier_index_per_object = {}
+
+
 def modifier_active_index_get(self):
-    for mod in self.modifiers:
+    mods = self.modifiers
+    ob_pointer = self.as_pointer()
+    index = _active_modifier_index_per_object.get(ob_pointer)
+
+    # The memoized index is validated on every read, so it can't become
+    # stale when modifiers are added, removed, moved or activated from
+    # somewhere else. Checking it is O(1) in Python.
+    if index is not None:
+        try:
+            if mods[index].is_active:
+                return index
+        except IndexError:
+            pass
+
+    for i, mod in enumerate(mods):
         if mod.is_active:
-            return self.modifiers.find(mod.name)
+            _active_modifier_index_per_object[ob_pointer] = i
+            return i
+
+    _active_modifier_index_per_object.pop(ob_pointer, None)
 
     return 0
 
@@ -22,6 +43,7 @@ def modifier_active_index_set(self, value):
 
     if mods:
         mods[value].is_active = True
+        _active_modifier_index_per_object[self.as_pointer()] = value
 
 
 def pinned_object_ensure_users(scene):
@@ -55,8 +77,7 @@ def set_all_modifier_collection_items():
     to make modifiers available in search.
     """
     all_modifiers = bpy.context.window_manager.modifier_list.all_modifiers
-    sorted_names_icons_types = sorted(modifier_categories.ALL_MODIFIERS_NAMES_ICONS_TYPES,
-                                      key=lambda mod: mod[0])
+    sorted_names_icons_types = modifier_categories.MODIFIER_REGISTRY.all_search_items
 
     if not all_modifiers:
         for name, _, mod in sorted_names_icons_types:
@@ -70,8 +91,8 @@ def set_mesh_modifier_collection_items():
     to make modifiers available in search.
     """
     mesh_modifiers = bpy.context.window_manager.modifier_list.mesh_modifiers
-    sorted_names_icons_types = sorted(modifier_categories.MESH_ALL_NAMES_ICONS_TYPES,
-                                      key=lambda mod: mod[0])
+    sorted_names_icons_types = (
+        modifier_categories.MODIFIER_REGISTRY.search_items_per_object_type['MESH'])
 
     if not mesh_modifiers:
         for name, _, mod in sorted_names_icons_types:
@@ -85,8 +106,8 @@ def set_curve_text_modifier_collection_items():
     to make modifiers available in search.
     """
     curve_and_text_modifiers = bpy.context.window_manager.modifier_list.curve_text_modifiers
-    sorted_names_icons_types = sorted(modifier_categories.CURVE_TEXT_ALL_NAMES_ICONS_TYPES,
-                                      key=lambda mod: mod[0])
+    sorted_names_icons_types = (
+        modifier_categories.MODIFIER_REGISTRY.search_items_per_object_type['CURVE'])
 
     if not curve_and_text_modifiers:
         for name, _, mod in sorted_names_icons_types:
@@ -100,8 +121,8 @@ def set_curves_modifier_collection_items():
     to make modifiers available in search.
     """
     curves_modifiers = bpy.context.window_manager.modifier_list.curves_modifiers
-    sorted_names_icons_types = sorted(modifier_categories.CURVES_ALL_NAMES_ICONS_TYPES,
-                                      key=lambda mod: mod[0])
+    sorted_names_icons_types = (
+        modifier_categories.MODIFIER_REGISTRY.search_items_per_object_type['CURVES'])
 
     if not curves_modifiers:
         for name, _, mod in sorted_names_icons_types:
@@ -115,8 +136,8 @@ def set_lattice_modifier_collection_items():
     to make modifiers available in search.
     """
     lattice_modifiers = bpy.context.window_manager.modifier_list.lattice_modifiers
-    sorted_names_icons_types = sorted(modifier_categories.LATTICE_ALL_NAMES_ICONS_TYPES,
-                                      key=lambda mod: mod[0])
+    sorted_names_icons_types = (
+        modifier_categories.MODIFIER_REGISTRY.search_items_per_object_type['LATTICE'])
 
     if not lattice_modifiers:
         for name, _, mod in sorted_names_icons_types:
@@ -130,8 +151,8 @@ def set_pointcloud_modifier_collection_items():
     to make modifiers available in search.
     """
     pointcloud_modifiers = bpy.context.window_manager.modifier_list.pointcloud_modifiers
-    sorted_names_icons_types = sorted(modifier_categories.POINTCLOUD_ALL_NAMES_ICONS_TYPES,
-                                      key=lambda mod: mod[0])
+    sorted_names_icons_types = (
+        modifier_categories.MODIFIER_REGISTRY.search_items_per_object_type['POINTCLOUD'])
 
     if not pointcloud_modifiers:
         for name, _, mod in sorted_names_icons_types:
@@ -145,8 +166,8 @@ def set_surface_modifier_collection_items():
     to make modifiers available in search.
     """
     surface_modifiers = bpy.context.window_manager.modifier_list.surface_modifiers
-    sorted_names_icons_types = sorted(modifier_categories.SURFACE_ALL_NAMES_ICONS_TYPES,
-                                      key=lambda mod: mod[0])
+    sorted_names_icons_types = (
+        modifier_categories.MODIFIER_REGISTRY.search_items_per_object_type['SURFACE'])
 
     if not surface_modifiers:
         for name, _, mod in sorted_names_icons_types:
@@ -160,8 +181,8 @@ def set_volume_modifier_collection_items():
     to make modifiers available in search.
     """
     volume_modifiers = bpy.context.window_manager.modifier_list.volume_modifiers
-    sorted_names_icons_types = sorted(modifier_categories.VOLUME_ALL_NAMES_ICONS_TYPES,
-                                      key=lambda mod: mod[0])
+    sorted_names_icons_types = (
+        modifier_categories.MODIFIER_REGISTRY.search_items_per_object_type['VOLUME'])
 
     if not volume_modifiers:
         for name, _, mod in sorted_names_icons_types:
@@ -170,8 +191,15 @@ def set_volume_modifier_collection_items():
             item.value = mod
 
 
+@persistent
+def clear_active_modifier_index_memo(dummy):
+    """Object pointers aren't stable across undo and file loading."""
+    _active_modifier_index_per_object.clear()
+
+
 @persistent
 def on_file_load(dummy):
+    clear_active_modifier_index_memo(dummy)
     set_all_modifier_collection_items()
     set_mesh_modifier_collection_items()
     set_curve_text_modifier_collection_items()
@@ -324,6 +352,8 @@ def register():
     bpy.types.Scene.modifier_list = PointerProperty(type=ML_SceneProperties)
 
     bpy.app.handlers.load_post.append(on_file_load)
+    bpy.app.handlers.undo_post.append(clear_active_modifier_index_memo)
+    bpy.app.handlers.redo_post.append(clear_active_modifier_index_memo)
 
     set_all_modifier_collection_items()
     set_mesh_modifier_collection_items()
@@ -337,6 +367,9 @@ def register():
 
 def unregister():
     bpy.app.handlers.load_post.remove(on_file_load)
+    bpy.app.handlers.undo_post.remove(clear_active_modifier_index_memo)
+    bpy.app.handlers.redo_post.remove(clear_active_modifier_index_memo)
+    _active_modifier_index_per_object.clear()
 
     del bpy.types.Object.ml_modifier_active_index
     del bpy.types.WindowManager.modifier_list
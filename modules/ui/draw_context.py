@@ -0,0 +1,59 @@
+"""Per-redraw snapshot of the state needed by the modifier UI.
+
+The snapshot is built once per panel draw and passed down to the
+helpers, so the active object, the preferences and the icons don't need
+to be resolved again by every helper and for every list row.
+"""
+
+from collections import namedtuple
+
+import bpy
+
+from ..icons import get_icons
+from ..utils import get_ml_active_object, get_show_on_cage_states
+
+
+OBJECT_TYPES_SUPPORTING_GIZMOS = {'CURVE', 'FONT', 'LATTICE', 'MESH', 'SURFACE'}
+
+
+ModifierDrawContext = namedtuple(
+    "ModifierDrawContext",
+    (
+        "object",
+        "prefs",
+        "pcoll",
+        "active_modifier",
+        "active_modifier_index",
+        "is_mesh",
+        "is_lattice",
+        "supports_gizmos",
+        "show_on_cage_states",
+    )
+)
+
+
+def build_draw_context(object=None, analyze_stack=False):
+    """Returns a ModifierDrawContext for the given object or, if no
+    object is given, for the ML active object.
+
+    analyze_stack: also compute the show_on_cage states of the whole
+        stack (only for meshes). Needed when drawing the modifier list.
+    """
+    ob = object if object is not None else get_ml_active_object()
+    mods = ob.modifiers
+    active_mod_index = ob.ml_modifier_active_index
+    active_mod = mods[active_mod_index] if mods else None
+    is_mesh = ob.type == 'MESH'
+
+    return ModifierDrawContext(
+        object=ob,
+        prefs=bpy.context.preferences.addons["modifier_list"].preferences,
+        pcoll=get_icons(),
+        active_modifier=active_mod,
+        active_modifier_index=active_mod_index,
+        is_mesh=is_mesh,
+        is_lattice=ob.type == 'LATTICE',
+        supports_gizmos=ob.type in OBJECT_TYPES_SUPPORTING_GIZMOS,
+        show_on_cage_states=(get_show_on_cage_states(mods) if analyze_stack and is_mesh
+                             else None),
+    )
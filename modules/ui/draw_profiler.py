@@ -0,0 +1,162 @@
+"""Opt-in profiler for the draw code of the popup, the sidebar panel and
+the Properties Editor panel.
+
+A panel's draw is wrapped in panel() and the parts of it in section().
+The durations are kept in ring buffers per (panel, section), from which
+percentiles are computed when the results are shown or dumped.
+
+When the profiler is disabled, section() and panel() return a shared
+no-op context manager, so the cost is just a function call.
+"""
+
+import json
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from time import perf_counter_ns
+
+
+# The number of durations kept per section
+SAMPLE_COUNT = 240
+
+PERCENTILES = (50, 90, 99)
+
+_enabled = False
+
+_NO_OP = nullcontext()
+
+# The panel currently being drawn, set by panel()
+_current_panel = None
+
+# {panel: {section: deque of durations in nanoseconds}}
+_samples_per_panel = {}
+
+
+def set_enabled(enabled):
+    global _enabled
+    _enabled = enabled
+
+    if not enabled:
+        _samples_per_panel.clear()
+
+
+def is_enabled():
+    return _enabled
+
+
+def reset():
+    _samples_per_panel.clear()
+
+
+def _record(panel, section_name, duration):
+    samples_per_section = _samples_per_panel.setdefault(panel, {})
+    samples = samples_per_section.get(section_name)
+
+    if samples is None:
+        samples = samples_per_section[section_name] = deque(maxlen=SAMPLE_COUNT)
+
+    samples.append(duration)
+
+
+@contextmanager
+def _timed_panel(panel_name):
+    global _current_panel
+    previous_panel = _current_panel
+    _current_panel = panel_name
+    start = perf_counter_ns()
+
+    try:
+        yield
+    finally:
+        _record(panel_name, "TOTAL", perf_counter_ns() - start)
+        _current_panel = previous_panel
+
+
+@contextmanager
+def _timed_section(section_name):
+    start = perf_counter_ns()
+
+    try:
+        yield
+    finally:
+        _record(_current_panel, section_name, perf_counter_ns() - start)
+
+
+def panel(panel_name):
+    """Context manager timing the whole draw of a panel. Sections
+    timed inside it are recorded for that panel.
+    """
+    if not _enabled:
+        return _NO_OP
+    return _timed_panel(panel_name)
+
+
+def section(section_name):
+    """Context manager timing a part of the draw of the current panel."""
+    if not _enabled or _current_panel is None:
+        return _NO_OP
+    return _timed_section(section_name)
+
+
+# Results
+# ======================================================================
+
+def _percentile(sorted_samples, percent):
+    index = round(percent / 100 * (len(sorted_samples) - 1))
+    return sorted_samples[index]
+
+
+def get_results():
+    """Returns {panel: {section: {"samples": n, "p50": µs, ...}}}."""
+    results = {}
+
+    for panel_name, samples_per_section in _samples_per_panel.items():
+        panel_results = results[panel_name] = {}
+
+        for section_name, samples in samples_per_section.items():
+            sorted_samples = sorted(samples)
+            section_results = {"samples": len(sorted_samples)}
+
+            for percent in PERCENTILES:
+                section_results[f"p{percent}"] = (
+                    _percentile(sorted_samples, percent) / 1000)
+
+            panel_results[section_name] = section_results
+
+    return results
+
+
+def dump_results(filepath):
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(get_results(), f, indent=4)
+
+
+def draw_results(layout, panel_name):
+    """Draws a box with the percentiles of the sections of the given
+    panel. Does nothing if the profiler is disabled.
+    """
+    if not _enabled:
+        return
+
+    box = layout.box()
+    row = box.row()
+    row.label(text="Draw Profiler (µs)", icon='TIME')
+    row.operator("wm.ml_draw_profiler_reset", text="", icon='LOOP_BACK')
+    row.operator("wm.ml_draw_profiler_dump", text="", icon='EXPORT')
+
+    panel_results = get_results().get(panel_name)
+
+    if not panel_results:
+        box.label(text="No samples yet")
+        return
+
+    col = box.column(align=True)
+    row = col.row()
+    row.label(text="Section")
+    for percent in PERCENTILES:
+        row.label(text=f"p{percent}")
+
+    for section_name, section_results in panel_results.items():
+        row = col.row()
+        row.label(text=section_name.replace("_", " ").title())
+        for percent in PERCENTILES:
+            row.label(text=f"{section_results[f'p{percent}']:.0f}")
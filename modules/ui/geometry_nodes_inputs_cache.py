@@ -0,0 +1,126 @@
+"""Cache for the descriptors of the inputs of Geometry Nodes node groups,
+used for drawing the inputs of Geometry Nodes modifiers.
+
+Finding out the inputs needs a scan of the nodes of the node group and a
+look at the shapes of the sockets, so the result is kept per node group
+until the node group is updated in the depsgraph or its interface
+changes.
+"""
+
+from collections import namedtuple
+
+import bpy
+from bpy.app.handlers import persistent
+
+
+BLENDER_VERSION_MAJOR_POINT_MINOR = float(bpy.app.version_string[0:4].strip("."))
+
+
+GeometryNodesInputInfo = namedtuple(
+    "GeometryNodesInputInfo",
+    ("name", "type", "prop_id", "accepts_attribute", "hide_in_modifier")
+)
+
+
+# {node group pointer: (interface signature, (GeometryNodesInputInfo, ...))}
+_inputs_per_node_group = {}
+
+
+def _interface_signature(node_group):
+    """Cheap check for changes that could be missed by the depsgraph,
+    e.g. the node group being replaced at the same address.
+    """
+    return tuple((group_input.identifier, group_input.name, group_input.type)
+                 for group_input in node_group.inputs)
+
+
+def _build_input_infos(node_group):
+    # Find an input node because md.node_group.inputs contains
+    # NodeSocketInterfaces that don't have enough info. Currently,
+    # the only way to find out if an input accepts an attribute
+    # (i.e. is a field input) is to check the shape of a socket.
+    # Nodes have that info.
+    input_node = next((node for node in node_group.nodes if node.type == 'GROUP_INPUT'),
+                      None)
+
+    if not input_node:
+        return ()
+
+    if BLENDER_VERSION_MAJOR_POINT_MINOR >= 3.5:
+        hide_in_modifier_per_id = {group_input.identifier: group_input.hide_in_modifier
+                                   for group_input in node_group.inputs}
+    else:
+        hide_in_modifier_per_id = {}
+
+    # Skip the last output because it's a placeholder.
+    return tuple(
+        GeometryNodesInputInfo(
+            name=node_output.name,
+            type=node_output.type,
+            prop_id=node_output.identifier,
+            accepts_attribute=node_output.display_shape in {'DIAMOND', 'DIAMOND_DOT'},
+            hide_in_modifier=hide_in_modifier_per_id.get(node_output.identifier, False),
+        )
+        for node_output in input_node.outputs[:-1]
+        if node_output.type != 'GEOMETRY'
+    )
+
+
+def get_input_infos(node_group):
+    """Returns a tuple of GeometryNodesInputInfo for the non-geometry
+    inputs of the node group.
+    """
+    pointer = node_group.as_pointer()
+    signature = _interface_signature(node_group)
+    cached = _inputs_per_node_group.get(pointer)
+
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    input_infos = _build_input_infos(node_group)
+    _inputs_per_node_group[pointer] = (signature, input_infos)
+    return input_infos
+
+
+def clear():
+    _inputs_per_node_group.clear()
+
+
+# Handlers
+# ======================================================================
+
+@persistent
+def on_depsgraph_update_post(scene, depsgraph):
+    """Invalidates the node groups that were changed, e.g. because of
+    links being changed, which can change the shapes of the sockets.
+    """
+    if not _inputs_per_node_group:
+        return
+
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.NodeTree):
+            _inputs_per_node_group.pop(update.id.original.as_pointer(), None)
+
+
+@persistent
+def on_undo_redo_or_file_load(dummy):
+    # Node group pointers aren't stable across undo and file loading
+    clear()
+
+
+def register():
+    handlers = bpy.app.handlers
+    handlers.depsgraph_update_post.append(on_depsgraph_update_post)
+    handlers.undo_post.append(on_undo_redo_or_file_load)
+    handlers.redo_post.append(on_undo_redo_or_file_load)
+    handlers.load_post.append(on_undo_redo_or_file_load)
+
+
+def unregister():
+    handlers = bpy.app.handlers
+    handlers.depsgraph_update_post.remove(on_depsgraph_update_post)
+    handlers.undo_post.remove(on_undo_redo_or_file_load)
+    handlers.redo_post.remove(on_undo_redo_or_file_load)
+    handlers.load_post.remove(on_undo_redo_or_file_load)
+
+    clear()
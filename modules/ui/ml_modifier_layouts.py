@@ -10,13 +10,20 @@ if hasattr(properties_data_modifier.DATA_PT_modifiers, "ARRAY"):
 else:
     from .properties_data_modifier import DATA_PT_modifiers
 
-from..utils import get_gizmo_object_from_modifier
+from ..modifier_categories import ALL_MODIFIERS_NAMES_ICONS_TYPES
+from ..utils import get_gizmo_object_from_modifier
+
+
+# The instance of DATA_PT_modifiers whose layouts are used, created in
+# register
+_data_pt_modifiers = None
+
+# {modifier type: layout function}, see build_layout_dispatcher
+_layout_per_type = {}
 
 
 def BOOLEAN(layout, ob, md):
-    context = bpy.context
-    mp = DATA_PT_modifiers(context)
-    mp.BOOLEAN(layout, ob, md)
+    _data_pt_modifiers.BOOLEAN(layout, ob, md)
 
     if ((md.operand_type == 'OBJECT' and not md.object)
             or (md.operand_type == 'COLLECTION' and not md.collection)):
@@ -136,5 +143,47 @@ def LATTICE(layout, ob, md):
 
         layout.separator()
 
-    mp = DATA_PT_modifiers(context)
-    mp.LATTICE(layout, ob, md)
+    _data_pt_modifiers.LATTICE(layout, ob, md)
+
+
+# Dispatcher
+# ======================================================================
+
+# Some modifiers have an improved layout with additional settings.
+_custom_layout_per_type = {
+    'BOOLEAN': BOOLEAN,
+    'LATTICE': LATTICE,
+}
+
+
+def build_layout_dispatcher():
+    """Maps every modifier type to its layout function: the custom
+    layout from this module or the bound DATA_PT_modifiers method.
+    """
+    global _data_pt_modifiers
+
+    # The default DATA_PT_modifiers expects context as an argument
+    _data_pt_modifiers = DATA_PT_modifiers(bpy.context)
+    _layout_per_type.clear()
+
+    for _, _, mod in ALL_MODIFIERS_NAMES_ICONS_TYPES:
+        layout_func = _custom_layout_per_type.get(mod, getattr(_data_pt_modifiers, mod, None))
+        if layout_func is not None:
+            _layout_per_type[mod] = layout_func
+
+
+def draw_modifier_layout(layout, ob, md):
+    """Draws the modifier specific settings of the given modifier."""
+    layout_func = _layout_per_type.get(md.type)
+    if layout_func is not None:
+        layout_func(layout, ob, md)
+
+
+def register():
+    build_layout_dispatcher()
+
+
+def unregister():
+    global _data_pt_modifiers
+    _data_pt_modifiers = None
+    _layout_per_type.clear()
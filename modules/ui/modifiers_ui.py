@@ -4,31 +4,27 @@ import bpy
 from bpy.props import *
 from bpy.types import Menu, Panel, UIList
 
-# Check if the modifier layouts can be imported from Blender. If not,
-# import the layouts included in this addon. This is needed for 2.90 and
-# later because the modifier layouts have been moved from Python into C
-# in Blender 2.90 since 5.6.2020.
-from bl_ui import properties_data_modifier
-if hasattr(properties_data_modifier.DATA_PT_modifiers, "ARRAY"):
-    from bl_ui.properties_data_modifier import DATA_PT_modifiers
-else:
-    from .properties_data_modifier import DATA_PT_modifiers
-
-from . import ml_modifier_layouts
+from . import draw_profiler, ml_modifier_layouts
+from .draw_context import build_draw_context
 from .ui_common import box_with_header
-from ..icons import get_icons
 from .. import modifier_categories
+from ..modifier_status_cache import is_modifier_disabled_cached
 from ..utils import (
-    favourite_modifiers_names_icons_types,
+    get_favourite_modifiers_grid,
     get_gizmo_object_from_modifier,
     get_ml_active_object,
-    is_modifier_disabled,
+    get_show_on_cage_states,
     is_modifier_local
 )
 
 
 BLENDER_VERSION_MAJOR_POINT_MINOR = float(bpy.app.version_string[0:4].strip("."))
 
+# The draw context of the list currently being drawn. Set by
+# modifiers_ui_with_list for the duration of template_list, so every row
+# drawn by OBJECT_UL_ml_modifier_list can use the same snapshot.
+_list_draw_context = None
+
 
 # UI elements
 # =======================================================================
@@ -37,41 +33,16 @@ def _favourite_modifier_buttons(layout):
     """Adds 2 or 3 buttons per row according to addon preferences.
 
     Empty rows in preferences are skipped."""
+    for favourites in get_favourite_modifiers_grid():
+        row = layout.row(align=True)
 
-    prefs = bpy.context.preferences.addons["modifier_list"].preferences
-    fav_names_icons_types_iter = favourite_modifiers_names_icons_types()
-
-    place_three_per_row = prefs.favourites_per_row == '3'
-
-    for name, icon, mod in fav_names_icons_types_iter:
-        next_mod_1 = next(fav_names_icons_types_iter)
-        if place_three_per_row:
-            next_mod_2 = next(fav_names_icons_types_iter)
-
-        if name or next_mod_1[0] or (place_three_per_row and next_mod_2[0]):
-            row = layout.row(align=True)
-
-            if name:
-                icon = icon if prefs.use_icons_in_favourites else 'NONE'
+        for favourite in favourites:
+            if favourite:
+                name, icon, mod = favourite
                 row.operator("object.ml_modifier_add", text=name, icon=icon).modifier_type = mod
             else:
                 row.label(text="")
 
-            if next_mod_1[0]:
-                icon = next_mod_1[1] if prefs.use_icons_in_favourites else 'NONE'
-                row.operator("object.ml_modifier_add", text=next_mod_1[0],
-                                icon=icon).modifier_type = next_mod_1[2]
-            else:
-                row.label(text="")
-
-            if place_three_per_row:
-                if next_mod_2[0]:
-                    icon = next_mod_2[1] if prefs.use_icons_in_favourites else 'NONE'
-                    row.operator("object.ml_modifier_add", text=next_mod_2[0],
-                                icon=icon).modifier_type = next_mod_2[2]
-                else:
-                    row.label(text="")
-
 
 def _modifier_search_and_menu(layout, object):
     """Creates the modifier search and menu row.
@@ -167,38 +138,31 @@ def _use_apply_on_spline_button(modifier, layout, pcoll, use_in_list):
     row.prop(modifier, "use_apply_on_spline", text="", icon_value=icon, emboss=not use_in_list)
 
 
-def _show_on_cage_button(object, modifier, layout, pcoll, use_in_list):
-    support_show_on_cage = modifier_categories.SUPPORT_SHOW_ON_CAGE
-
-    if modifier.type not in support_show_on_cage:
+def _show_on_cage_button(modifier, modifier_index, layout, draw_context, use_in_list):
+    if modifier.type not in modifier_categories.SUPPORT_SHOW_ON_CAGE:
         return False
 
-    mods = object.modifiers
-    mod_index = mods.find(modifier.name)
+    mods = draw_context.object.modifiers
+    states = draw_context.show_on_cage_states
 
-    # Check if some modifier before this has show_in_editmode on
-    # and doesn't have show_on_cage setting.
-    is_before_show_in_editmode_on = False
-    end_index = np.clip(mod_index, 1, 99)
+    if states is None:
+        states = get_show_on_cage_states(mods)
 
-    for mod in mods[0:end_index]:
-        if mod.show_in_editmode and mod.type not in support_show_on_cage:
-            is_before_show_in_editmode_on = True
-            break
-
-    if is_before_show_in_editmode_on:
-        return False
+    if modifier_index is None:
+        modifier_index = mods.find(modifier.name)
 
-    # Check if some modifier after this has show_in_editmode and
-    # show_on_cage both on and also is visible in the viewport.
-    is_after_show_on_cage_on = False
+    # can_show_on_cage is False if some modifier before this has
+    # show_in_editmode on and doesn't have show_on_cage setting.
+    # is_after_show_on_cage_on is True if some modifier after this has
+    # show_in_editmode and show_on_cage both on and also is visible in
+    # the viewport.
+    can_show_on_cage, is_after_show_on_cage_on = states[modifier_index]
 
-    for mod in mods[(mod_index + 1):(len(mods))]:
-        if (mod.show_viewport and mod.show_in_editmode and mod.show_on_cage):
-            is_after_show_on_cage_on = True
-            break
+    if not can_show_on_cage:
+        return False
 
     # Button
+    pcoll = draw_context.pcoll
     row = layout.row(align=True)
     show_on_cage_on = pcoll['SHOW_ON_CAGE_ON']
     show_on_cage_off = pcoll['SHOW_ON_CAGE_OFF']
@@ -265,7 +229,8 @@ def _mesh_properties_context_change_button(modifier, layout, use_in_list):
     return False
 
 
-def _modifier_visibility_buttons(modifier, layout, pcoll, use_in_list=False):
+def _modifier_visibility_buttons(modifier, layout, draw_context, use_in_list=False,
+                                 modifier_index=None):
     """This handles the modifier visibility buttons (and also the
     properties_context_change button) to match the behaviour of the
     regular UI .
@@ -279,7 +244,11 @@ def _modifier_visibility_buttons(modifier, layout, pcoll, use_in_list=False):
     order to show the button. This function doesn't take that into
     account but instead shows the button always in those cases. It's
     easier to achieve and hardly makes a difference.
+
+    modifier_index is used for looking up the show_on_cage state. If
+    it's not given, it's searched from the stack.
     """
+    pcoll = draw_context.pcoll
     empy_icon = pcoll['EMPTY_SPACE']
 
     # Main layout
@@ -302,14 +271,12 @@ def _modifier_visibility_buttons(modifier, layout, pcoll, use_in_list=False):
     # show_in_editmode
     _show_in_editmode_button(modifier, row, pcoll, use_in_list)
 
-    ob = get_ml_active_object()
-
     # No use_apply_on_spline or show_on_cage for lattices
-    if ob.type == 'LATTICE':
+    if draw_context.is_lattice:
         return
 
     # use_apply_on_spline or properties_context_change
-    if ob.type != 'MESH':
+    if not draw_context.is_mesh:
         if modifier.type == 'SOFT_BODY':
             _curve_properties_context_change_button(row, pcoll, use_in_list)
         else:
@@ -317,7 +284,8 @@ def _modifier_visibility_buttons(modifier, layout, pcoll, use_in_list=False):
         return
 
     # show_on_cage or properties_context_change
-    show_on_cage_added = _show_on_cage_button(ob, modifier, row, pcoll, use_in_list)
+    show_on_cage_added = _show_on_cage_button(modifier, modifier_index, row, draw_context,
+                                              use_in_list)
     context_change_added = False
     if not show_on_cage_added:
         context_change_added = _mesh_properties_context_change_button(modifier, row, use_in_list)
@@ -329,10 +297,9 @@ def _modifier_visibility_buttons(modifier, layout, pcoll, use_in_list=False):
         sub.label(text="", translate=False, icon_value=empy_icon.icon_id)
 
 
-def _gizmo_object_settings(layout):
-    ob = get_ml_active_object()
-    active_mod_index = ob.ml_modifier_active_index
-    active_mod = ob.modifiers[active_mod_index]
+def _gizmo_object_settings(layout, draw_context):
+    ob = draw_context.object
+    active_mod = draw_context.active_modifier
     gizmo_ob = get_gizmo_object_from_modifier(active_mod)
 
     # Avoid an error when the gizmo is deleted when using the popup
@@ -571,18 +538,69 @@ class OBJECT_MT_ml_add_modifier_menu(Menu):
             _modifier_menu_volume(row)
 
 
-class OBJECT_UL_ml_modifier_list(UIList):
+_filter_type_items = [('ALL', "All Types", "Show modifiers of all types", 'NONE', 0)] + [
+    (mod, name, "", icon, i)
+    for i, (name, icon, mod) in enumerate(modifier_categories.ALL_MODIFIERS_NAMES_ICONS_TYPES,
+                                          start=1)
+]
 
-    def draw_item(self, context, layout, data, item, icon, active_data, active_propname):
+_modifier_types_per_filter_category = {
+    category: sorted(types)
+    for category, types in modifier_categories.MODIFIER_REGISTRY.types_per_category.items()
+}
+
+
+class OBJECT_UL_ml_modifier_list(UIList):
+    filter_type: EnumProperty(
+        items=_filter_type_items,
+        name="Type",
+        description="Show only modifiers of this type")
+
+    filter_category: EnumProperty(
+        items=[
+            ('ALL', "All Categories", "Show modifiers of all categories"),
+            ('MODIFY', "Modify", "Show only Modify modifiers"),
+            ('GENERATE', "Generate", "Show only Generate modifiers"),
+            ('DEFORM', "Deform", "Show only Deform modifiers"),
+            ('PHYSICS', "Physics", "Show only Physics modifiers"),
+        ],
+        name="Category",
+        description="Show only modifiers of this category")
+
+    filter_visibility: EnumProperty(
+        items=[
+            ('ALL', "All", "Show all modifiers"),
+            ('VISIBLE', "Visible", "Show only modifiers visible in the viewport"),
+            ('HIDDEN', "Hidden", "Show only modifiers hidden in the viewport"),
+        ],
+        name="Visibility",
+        description="Filter modifiers by their viewport visibility")
+
+    filter_disabled_only: BoolProperty(
+        name="Disabled Only",
+        description="Show only disabled modifiers, e.g. ones missing a required object")
+
+    sort_by: EnumProperty(
+        items=[
+            ('STACK', "Stack", "Keep the stack order"),
+            ('NAME', "Name", "Sort by name"),
+            ('TYPE', "Type", "Sort by type, keeping the stack order within a type"),
+        ],
+        name="Sort By",
+        description="Sort the modifiers by")
+
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname,
+                  index):
         mod = item
 
         if self.layout_type in {'DEFAULT', 'COMPACT'}:
             if mod:
                 row = layout.row()
-                row.alert = is_modifier_disabled(mod)
+                row.alert = is_modifier_disabled_cached(data, mod)
                 row.label(text="", translate=False, icon_value=layout.icon(mod))
                 layout.prop(mod, "name", text="", emboss=False)
-                _modifier_visibility_buttons(mod, layout, get_icons(), use_in_list=True)
+                _modifier_visibility_buttons(mod, layout, self._get_draw_context(data),
+                                             use_in_list=True, modifier_index=index)
             else:
                 layout.label(text="", translate=False, icon_value=icon)
 
@@ -590,6 +608,97 @@ class OBJECT_UL_ml_modifier_list(UIList):
             layout.alignment = 'CENTER'
             layout.label(text="", icon_value=icon)
 
+    def draw_filter(self, context, layout):
+        row = layout.row(align=True)
+        row.prop(self, "filter_name", text="")
+        row.prop(self, "use_filter_invert", text="", icon='ARROW_LEFTRIGHT')
+
+        row = layout.row(align=True)
+        row.prop(self, "filter_type", text="")
+        row.prop(self, "filter_category", text="")
+
+        row = layout.row(align=True)
+        row.prop(self, "filter_visibility", expand=True)
+        row.prop(self, "filter_disabled_only", text="", icon='ERROR')
+
+        row = layout.row(align=True)
+        row.label(text="Sort By:")
+        row.prop(self, "sort_by", expand=True)
+
+    def filter_items(self, context, data, propname):
+        """Builds the filter flags and the new order in bulk with NumPy.
+
+        Reversing the list (reverse_list preference) and inverting the
+        filter are handled by Blender after this.
+        """
+        mods = getattr(data, propname)
+        mod_count = len(mods)
+        flt_flags = []
+        flt_neworder = []
+
+        if not mod_count:
+            return flt_flags, flt_neworder
+
+        filter_name = self.filter_name.lower()
+        use_type_filter = self.filter_type != 'ALL' or self.filter_category != 'ALL'
+        is_filtered = (filter_name or use_type_filter or self.filter_visibility != 'ALL'
+                       or self.filter_disabled_only)
+
+        # Strings (and enums) can't be read with foreach_get, so names
+        # and types are read once into arrays, and only when needed.
+        names = None
+        types = None
+
+        if filter_name or self.sort_by == 'NAME':
+            names = np.char.lower(np.array([mod.name for mod in mods], dtype=str))
+
+        if use_type_filter or self.sort_by == 'TYPE':
+            types = np.array([mod.type for mod in mods], dtype=str)
+
+        if is_filtered:
+            shown = np.ones(mod_count, dtype=bool)
+
+            if filter_name:
+                shown &= np.char.find(names, filter_name) >= 0
+
+            if self.filter_type != 'ALL':
+                shown &= types == self.filter_type
+
+            if self.filter_category != 'ALL':
+                shown &= np.isin(types, _modifier_types_per_filter_category[self.filter_category])
+
+            if self.filter_visibility != 'ALL':
+                show_viewport = np.empty(mod_count, dtype=bool)
+                mods.foreach_get("show_viewport", show_viewport)
+                shown &= show_viewport if self.filter_visibility == 'VISIBLE' else ~show_viewport
+
+            if self.filter_disabled_only:
+                shown &= np.fromiter((is_modifier_disabled_cached(data, mod) for mod in mods),
+                                     dtype=bool, count=mod_count)
+
+            flt_flags = np.where(shown, self.bitflag_filter_item, 0).tolist()
+
+        if self.sort_by != 'STACK':
+            sort_keys = names if self.sort_by == 'NAME' else types
+            order = np.argsort(sort_keys, kind='stable')
+            # flt_neworder maps the original index of each item to its
+            # new index, i.e. it's the inverse of the sorting order.
+            neworder = np.empty(mod_count, dtype=int)
+            neworder[order] = np.arange(mod_count)
+            flt_neworder = neworder.tolist()
+
+        return flt_flags, flt_neworder
+
+    @staticmethod
+    def _get_draw_context(object):
+        """Returns the draw context of the list being drawn or, if the
+        list is drawn from somewhere else, builds a new one.
+        """
+        if _list_draw_context is not None and _list_draw_context.object == object:
+            return _list_draw_context
+
+        return build_draw_context(object, analyze_stack=True)
+
 
 class ModifierExtrasBase:
     bl_label = "Modifier Extras"
@@ -597,11 +706,12 @@ class ModifierExtrasBase:
     bl_region_type = 'WINDOW'
 
     def draw(self, context):
-        prefs = bpy.context.preferences.addons["modifier_list"].preferences
+        draw_context = build_draw_context()
+        prefs = draw_context.prefs
         ml_props = context.window_manager.modifier_list
-        pcoll = get_icons()
-        ob = get_ml_active_object()
-        active_mod = ob.modifiers[ob.ml_modifier_active_index] if ob.modifiers else None
+        pcoll = draw_context.pcoll
+        ob = draw_context.object
+        active_mod = draw_context.active_modifier
 
         class_name = type(self).__name__
         layout_style_is_stack = any((
@@ -620,7 +730,7 @@ class ModifierExtrasBase:
                 _batch_operators(row, pcoll, use_with_stack=layout_style_is_stack)
                 layout.separator()
 
-            if ob.type in {'CURVE', 'FONT', 'LATTICE', 'MESH', 'SURFACE'} and active_mod:
+            if draw_context.supports_gizmos and active_mod:
                 if (active_mod.type in modifier_categories.HAVE_GIZMO_PROPERTY
                         or active_mod.type == 'UV_PROJECT'):
                     row, box = box_with_header(layout, "Gizmo", ml_props,
@@ -642,7 +752,7 @@ class ModifierExtrasBase:
                                      icon='EMPTY_ARROWS', depress=depress)
 
                     if ml_props.gizmo_object_settings_expand:
-                        _gizmo_object_settings(box)
+                        _gizmo_object_settings(box, draw_context)
 
                     layout.separator()
         else:
@@ -662,6 +772,24 @@ class ModifierExtrasBase:
 
         layout.separator()
 
+        layout.operator("object.ml_modifier_apply_up_to_active")
+        layout.operator("object.ml_save_modifiers_as_shape_keys")
+        layout.operator("view3d.ml_apply_all_modifiers_modal")
+        layout.operator("view3d.ml_apply_all_modifiers_in_background")
+
+        layout.separator()
+
+        layout.label(text="Toggle All Modifiers:")
+        row = layout.row(align=True)
+        for visibility_property, icon in (("show_viewport", 'RESTRICT_VIEW_OFF'),
+                                          ("show_render", 'RESTRICT_RENDER_OFF'),
+                                          ("show_in_editmode", 'EDITMODE_HLT'),
+                                          ("show_on_cage", 'MESH_DATA')):
+            op = row.operator("view3d.ml_toggle_all_modifiers", text="", icon=icon)
+            op.visibility_property = visibility_property
+
+        layout.separator()
+
         layout.label(text="Syncronize Modifiers Between Instances:")
         layout.operator("object.ml_sync_active_modifier_between_instances", text="Active Only")
         layout.operator("object.ml_sync_all_modifiers_between_instances", text="All")
@@ -705,35 +833,44 @@ class OBJECT_PT_ml_gizmo_object_settings(Panel):
         if not ob.modifiers:
             return
 
-        _gizmo_object_settings(layout)
+        _gizmo_object_settings(layout, build_draw_context(ob))
 
 
 # UI
 # =======================================================================
 
 def modifiers_ui_with_list(context, layout, num_of_rows=False, use_in_popup=False):
-    ob = get_ml_active_object()
-    active_mod_index = ob.ml_modifier_active_index
-    prefs = bpy.context.preferences.addons["modifier_list"].preferences
-    pcoll = get_icons()
+    draw_context = build_draw_context(analyze_stack=True)
+    ob = draw_context.object
+    prefs = draw_context.prefs
+    pcoll = draw_context.pcoll
 
     if ob.modifiers:
         # This makes operators work without passing the active modifier
         # to them manually as an argument.
-        layout.context_pointer_set("modifier", ob.modifiers[ob.ml_modifier_active_index])
+        layout.context_pointer_set("modifier", draw_context.active_modifier)
 
     # === Favourite modifiers ===
-    col = layout.column(align=True)
-    _favourite_modifier_buttons(col)
+    with draw_profiler.section("FAVOURITES"):
+        col = layout.column(align=True)
+        _favourite_modifier_buttons(col)
 
     # === Modifier search and menu ===
-    col = layout.column()
-    _modifier_search_and_menu(col, ob)
+    with draw_profiler.section("SEARCH"):
+        col = layout.column()
+        _modifier_search_and_menu(col, ob)
 
     # === Modifier list ===
-    layout.template_list("OBJECT_UL_ml_modifier_list", "", ob, "modifiers",
-                         ob, "ml_modifier_active_index", rows=num_of_rows,
-                         sort_reverse=prefs.reverse_list)
+    global _list_draw_context
+    _list_draw_context = draw_context
+
+    with draw_profiler.section("LIST"):
+        try:
+            layout.template_list("OBJECT_UL_ml_modifier_list", "", ob, "modifiers",
+                                 ob, "ml_modifier_active_index", rows=num_of_rows,
+                                 sort_reverse=prefs.reverse_list)
+        finally:
+            _list_draw_context = None
 
     # When sub.scale_x is 1.5 and the area/region is narrow, the buttons
     # don't align properly, so some manual work is needed.
@@ -777,116 +914,112 @@ def modifiers_ui_with_list(context, layout, num_of_rows=False, use_in_popup=Fals
     if not ob.modifiers:
         return
 
-    active_mod = ob.modifiers[active_mod_index]
-    all_mods = modifier_categories.ALL_MODIFIERS_NAMES_ICONS_TYPES
-    active_mod_icon = next(icon for _, icon, mod in all_mods if mod == active_mod.type)
+    active_mod = draw_context.active_modifier
+    active_mod_icon = modifier_categories.MODIFIER_REGISTRY.info_per_type[active_mod.type].icon
 
     col = layout.column(align=True)
 
     # === General settings ===
-    box = col.box()
+    with draw_profiler.section("GENERAL_SETTINGS"):
+        box = col.box()
 
-    if not prefs.hide_general_settings_region:
-        row = box.row()
+        if not prefs.hide_general_settings_region:
+            row = box.row()
 
-        sub = row.row()
-        sub.alert = is_modifier_disabled(active_mod)
-        sub.label(text="", icon=active_mod_icon)
-        sub.prop(active_mod, "name", text="")
+            sub = row.row()
+            sub.alert = is_modifier_disabled_cached(ob, active_mod)
+            sub.label(text="", icon=active_mod_icon)
+            sub.prop(active_mod, "name", text="")
 
-        _modifier_visibility_buttons(active_mod, row, pcoll)
+            _modifier_visibility_buttons(active_mod, row, draw_context,
+                                         modifier_index=draw_context.active_modifier_index)
 
-    row = box.row()
+        row = box.row()
 
-    sub = row.row(align=True)
+        sub = row.row(align=True)
 
-    if active_mod.type == 'PARTICLE_SYSTEM':
-        ps = active_mod.particle_system
-        if ps.settings.render_type in {'COLLECTION', 'OBJECT'}:
-            sub.operator("object.duplicates_make_real", text="Convert")
-        elif ps.settings.render_type == 'PATH':
-            sub.operator("object.modifier_convert", text="Convert").modifier = active_mod.name
-    else:
-        sub.scale_x = 5
-        icon = pcoll['APPLY_MODIFIER']
-        sub.operator("object.ml_modifier_apply", text="", icon_value=icon.icon_id)
-
-        if active_mod.type in modifier_categories.SUPPORT_APPLY_AS_SHAPE_KEY:
-            icon = pcoll['APPLY_MODIFIER_AS_SHAPEKEY']
-            sub.operator("object.ml_modifier_apply_as_shapekey", text="",
-                        icon_value=icon.icon_id)
-            icon = pcoll['SAVE_MODIFIER_AS_SHAPEKEY']
-            sub.operator("object.ml_modifier_save_as_shapekey", text="",
+        if active_mod.type == 'PARTICLE_SYSTEM':
+            ps = active_mod.particle_system
+            if ps.settings.render_type in {'COLLECTION', 'OBJECT'}:
+                sub.operator("object.duplicates_make_real", text="Convert")
+            elif ps.settings.render_type == 'PATH':
+                sub.operator("object.modifier_convert", text="Convert").modifier = active_mod.name
+        else:
+            sub.scale_x = 5
+            icon = pcoll['APPLY_MODIFIER']
+            sub.operator("object.ml_modifier_apply", text="", icon_value=icon.icon_id)
+
+            if active_mod.type in modifier_categories.SUPPORT_APPLY_AS_SHAPE_KEY:
+                icon = pcoll['APPLY_MODIFIER_AS_SHAPEKEY']
+                sub.operator("object.ml_modifier_apply_as_shapekey", text="",
                             icon_value=icon.icon_id)
+                icon = pcoll['SAVE_MODIFIER_AS_SHAPEKEY']
+                sub.operator("object.ml_modifier_save_as_shapekey", text="",
+                                icon_value=icon.icon_id)
 
-        if active_mod.type not in modifier_categories.DONT_SUPPORT_COPY:
-            sub.operator("object.ml_modifier_copy", text="", icon='DUPLICATE')
+            if active_mod.type not in modifier_categories.DONT_SUPPORT_COPY:
+                sub.operator("object.ml_modifier_copy", text="", icon='DUPLICATE')
 
     # === Gizmo object settings ===
-    if ob.type in {'CURVE', 'FONT', 'LATTICE', 'MESH', 'SURFACE'}:
-        if (active_mod.type in modifier_categories.HAVE_GIZMO_PROPERTY
-                or active_mod.type == 'UV_PROJECT'):
-            gizmo_ob = get_gizmo_object_from_modifier(active_mod)
-
-            sub = row.row(align=True)
-            sub.alignment = 'RIGHT'
-            sub.enabled = ob.library is None
-
-            if not gizmo_ob:
-                sub_sub = sub.row()
-                sub_sub.scale_x = 4
-                icon = pcoll['ADD_GIZMO']
-                sub_sub.operator("object.ml_gizmo_object_add", text="", icon_value=icon.icon_id
-                            ).modifier = active_mod.name
-            else:
-                sub_sub = sub.row(align=True)
-                sub_sub.scale_x = 1.2
-                depress = not gizmo_ob.hide_viewport
-                sub_sub.operator("object.ml_gizmo_object_toggle_visibility", text="",
-                                icon='EMPTY_ARROWS', depress=depress)
-                sub.popover("OBJECT_PT_ml_gizmo_object_settings", text="")
+    with draw_profiler.section("GIZMO_SETTINGS"):
+        if draw_context.supports_gizmos:
+            if (active_mod.type in modifier_categories.HAVE_GIZMO_PROPERTY
+                    or active_mod.type == 'UV_PROJECT'):
+                gizmo_ob = get_gizmo_object_from_modifier(active_mod)
+
+                sub = row.row(align=True)
+                sub.alignment = 'RIGHT'
+                sub.enabled = ob.library is None
+
+                if not gizmo_ob:
+                    sub_sub = sub.row()
+                    sub_sub.scale_x = 4
+                    icon = pcoll['ADD_GIZMO']
+                    sub_sub.operator("object.ml_gizmo_object_add", text="", icon_value=icon.icon_id
+                                ).modifier = active_mod.name
+                else:
+                    sub_sub = sub.row(align=True)
+                    sub_sub.scale_x = 1.2
+                    depress = not gizmo_ob.hide_viewport
+                    sub_sub.operator("object.ml_gizmo_object_toggle_visibility", text="",
+                                    icon='EMPTY_ARROWS', depress=depress)
+                    sub.popover("OBJECT_PT_ml_gizmo_object_settings", text="")
 
     # === Modifier specific settings ===
-    box = col.box()
-    # Disable layout for linked modifiers here manually so in custom
-    # layouts all operators/settings are greyed out.
-    box.enabled = ob.library is None
-
-    # A column is needed here to keep the layout more compact,
-    # because in a box separators give an unnecessarily big space.
-    col = box.column()
-
-    # Some modifiers have an improved layout with additional settings.
-    have_custom_layout = (
-        'BOOLEAN',
-        'LATTICE'
-    )
-
-    if active_mod.type in have_custom_layout:
-        getattr(ml_modifier_layouts, active_mod.type)(col, ob, active_mod)
-    else:
-        mp = DATA_PT_modifiers(context)
-        getattr(mp, active_mod.type)(col, ob, active_mod)
+    with draw_profiler.section("MODIFIER_LAYOUT"):
+        box = col.box()
+        # Disable layout for linked modifiers here manually so in custom
+        # layouts all operators/settings are greyed out.
+        box.enabled = ob.library is None
+
+        # A column is needed here to keep the layout more compact,
+        # because in a box separators give an unnecessarily big space.
+        col = box.column()
+
+        ml_modifier_layouts.draw_modifier_layout(col, ob, active_mod)
 
 
 def modifiers_ui_with_stack(context, layout, use_in_popup=False):
-    ob = get_ml_active_object()
-    prefs = bpy.context.preferences.addons["modifier_list"].preferences
-    pcoll = get_icons()
+    draw_context = build_draw_context()
+    ob = draw_context.object
+    prefs = draw_context.prefs
+    pcoll = draw_context.pcoll
 
     if ob.modifiers:
         # This makes operators work without passing the active modifier
         # to them manually as an argument.
-        layout.context_pointer_set("modifier", ob.modifiers[ob.ml_modifier_active_index])
+        layout.context_pointer_set("modifier", draw_context.active_modifier)
 
     # === Favourite modifiers ===
-    col = layout.column(align=True)
-    _favourite_modifier_buttons(col)
+    with draw_profiler.section("FAVOURITES"):
+        col = layout.column(align=True)
+        _favourite_modifier_buttons(col)
 
     # === Modifier search and menu and modifier extras menu ===
-    col = layout.column()
-    row = _modifier_search_and_menu(col, ob)
-    _modifier_extras_button(context, row, use_in_popup=use_in_popup)
+    with draw_profiler.section("SEARCH"):
+        col = layout.column()
+        row = _modifier_search_and_menu(col, ob)
+        _modifier_extras_button(context, row, use_in_popup=use_in_popup)
 
     # === Modifier batch operators ===
     if prefs.show_batch_ops_in_main_layout_with_stack_style:
@@ -895,4 +1028,5 @@ def modifiers_ui_with_stack(context, layout, use_in_popup=False):
         _batch_operators(row, pcoll, use_with_stack=True)
 
     # === Modifier stack ===
-    layout.template_modifiers()
+    with draw_profiler.section("STACK"):
+        layout.template_modifiers()
@@ -2,6 +2,7 @@ import bpy
 from bpy.props import *
 from bpy.types import Operator
 
+from . import draw_profiler
 from .modifiers_ui import modifiers_ui_with_list, modifiers_ui_with_stack
 from .ui_common import pin_object_button
 from .vertex_groups_ui import vertex_groups_ui
@@ -61,11 +62,15 @@ class VIEW3D_OT_ml_modifier_popup(Operator):
         # === Content ===
         col = split.column()
         if popup_tab == 'MODIFIERS':
-            if prefs.popup_style == 'LIST':
-                num_of_rows = prefs.mod_list_def_len
-                modifiers_ui_with_list(context, col, num_of_rows=num_of_rows, use_in_popup=True)
-            else:
-                modifiers_ui_with_stack(context, col, use_in_popup=True)
+            with draw_profiler.panel("POPUP"):
+                if prefs.popup_style == 'LIST':
+                    num_of_rows = prefs.mod_list_def_len
+                    modifiers_ui_with_list(context, col, num_of_rows=num_of_rows,
+                                           use_in_popup=True)
+                else:
+                    modifiers_ui_with_stack(context, col, use_in_popup=True)
+
+            draw_profiler.draw_results(col, "POPUP")
         elif popup_tab == 'OBJECT_DATA':
             vertex_groups_ui(context, col, num_of_rows=7)
 
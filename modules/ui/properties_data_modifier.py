@@ -30,6 +30,8 @@ Some parts in here have been altered / will be altered.
 import bpy
 from bpy.app.translations import pgettext_iface as iface_
 
+from .geometry_nodes_inputs_cache import get_input_infos
+
 
 BLENDER_VERSION_MAJOR_POINT_MINOR = float(bpy.app.version_string[0:4].strip("."))
 
@@ -327,11 +329,11 @@ class DATA_PT_modifiers:
         box.label(text="Override:")
         box.template_cache_file_layers(md, "cache_file")
 
-    def MESH_SEQUENCE_CACHE(self, layout, ob, md):
-        if BLENDER_VERSION_MAJOR_POINT_MINOR <= 3.0:
-            self._mesh_sequence_cache_3_0(layout, ob, md)
-        else:
-            self._mesh_sequence_cache_3_1(layout, ob, md)
+    # Resolve the version once instead of checking it on every draw
+    if BLENDER_VERSION_MAJOR_POINT_MINOR <= 3.0:
+        MESH_SEQUENCE_CACHE = _mesh_sequence_cache_3_0
+    else:
+        MESH_SEQUENCE_CACHE = _mesh_sequence_cache_3_1
 
     def CAST(self, layout, ob, md):
         layout.row().prop(md, "cast_type", expand=True)
@@ -2059,45 +2061,7 @@ class DATA_PT_modifiers:
         if not node_group:
             return
 
-        # Find an input node because md.node_group.inputs contains
-        # NodeSocketInterfaces that don't have enough info. Currently,
-        # the only way to find out if an input accepts an attribute
-        # (i.e. is a field input) is to check the shape of a socket.
-        # Nodes have that info.
-        input_node = next((node for node in node_group.nodes if node.type == 'GROUP_INPUT'),
-                          None)
-
-        if not input_node:
-            return
-
-        info_per_input = []
-
-        # Skip the last output because it's a placeholder.
-        for node_output in input_node.outputs[:-1]:
-            if node_output.type == 'GEOMETRY':
-                continue
-
-            info_per_input.append(
-                {
-                    "name": node_output.name,
-                    "type": node_output.type,
-                    "accepts_attribute": node_output.display_shape in {'DIAMOND', 'DIAMOND_DOT'},
-                }
-            )
-
-        input_prop_ids = [prop_id for prop_id in md.keys()
-                          if (prop_id.startswith("Input_") and prop_id[-1].isdigit())]
-
-        for i, prop_id in enumerate(input_prop_ids):
-            info_per_input[i]["prop_id"] = prop_id
-
-        if BLENDER_VERSION_MAJOR_POINT_MINOR >= 3.5:
-            inputs_hide_in_modifier = [group_input.hide_in_modifier for group_input
-                                       in node_group.inputs
-                                       if group_input.type != 'GEOMETRY']
-
-            for i, hide_in_mod in enumerate(inputs_hide_in_modifier):
-                info_per_input[i]["hide_in_modifier"] = hide_in_mod
+        info_per_input = get_input_infos(node_group)
 
         datablock_input_info_per_type = {
             "COLLECTION": {"data_collection": "collections", "icon": "OUTLINER_COLLECTION"},
@@ -2108,14 +2072,14 @@ class DATA_PT_modifiers:
         }
 
         for input_info in info_per_input:
-            prop_id = input_info["prop_id"]
-            input_type = input_info["type"]
+            prop_id = input_info.prop_id
+            input_type = input_info.type
 
-            if BLENDER_VERSION_MAJOR_POINT_MINOR >= 3.5 and input_info["hide_in_modifier"]:
+            if input_info.hide_in_modifier:
                 continue
 
             split = layout.split(factor=split_facor)
-            split.label(text=input_info["name"] + ":")
+            split.label(text=input_info.name + ":")
 
             row = split.row(align=True)
             prop_row = row.row(align=True)
@@ -2128,7 +2092,7 @@ class DATA_PT_modifiers:
                 row.label(text="", icon='BLANK1')
 
             else:
-                if input_info["accepts_attribute"]:
+                if input_info.accepts_attribute:
                     if md[f"{prop_id}_use_attribute"] == 1:
                         attr_prop_name = f'["{prop_id}_attribute_name"]'
                         prop_row.prop(md, attr_prop_name, text="")
@@ -2196,8 +2160,7 @@ class DATA_PT_modifiers:
 
         self._nodes_3_0_outputs(layout, ob, md, split_factor)
 
-    def NODES(self, layout, ob, md):
-        if BLENDER_VERSION_MAJOR_POINT_MINOR < 3.0:
-            self._nodes_2_93(layout, ob, md)
-        else:
-            self._nodes_3_0(layout, ob, md)
+    if BLENDER_VERSION_MAJOR_POINT_MINOR < 3.0:
+        NODES = _nodes_2_93
+    else:
+        NODES = _nodes_3_0
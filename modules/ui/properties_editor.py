@@ -2,6 +2,7 @@ import bpy
 from bpy.types import Panel
 from bl_ui.properties_data_modifier import DATA_PT_modifiers as original_DATA_PT_modifiers
 
+from . import draw_profiler
 from .modifiers_ui import modifiers_ui_with_list, modifiers_ui_with_stack
 from ..utils import get_ml_active_object, object_type_has_modifiers
 
@@ -25,10 +26,13 @@ class DATA_PT_modifiers(Panel):
 
         prefs = bpy.context.preferences.addons["modifier_list"].preferences
 
-        if prefs.properties_editor_style == 'LIST':
-            modifiers_ui_with_list(context, layout)
-        else:
-            modifiers_ui_with_stack(context, layout)
+        with draw_profiler.panel("PROPERTIES_EDITOR"):
+            if prefs.properties_editor_style == 'LIST':
+                modifiers_ui_with_list(context, layout)
+            else:
+                modifiers_ui_with_stack(context, layout)
+
+        draw_profiler.draw_results(layout, "PROPERTIES_EDITOR")
 
 
 def register_DATA_PT_modifiers(self, context):
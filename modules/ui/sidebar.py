@@ -1,6 +1,7 @@
 import bpy
 from bpy.types import Panel
 
+from . import draw_profiler
 from .modifiers_ui import modifiers_ui_with_list, modifiers_ui_with_stack
 from .ui_common import pin_object_button
 from .vertex_groups_ui import vertex_groups_ui
@@ -49,10 +50,13 @@ class VIEW3D_PT_ml_modifiers(Panel, BasePanel):
         elif not object_type_has_modifiers(ob):
             layout.label(text="Wrong object type")
         else:
-            if prefs.sidebar_style == 'LIST':
-                modifiers_ui_with_list(context, layout)
-            else:
-                modifiers_ui_with_stack(context, layout)
+            with draw_profiler.panel("SIDEBAR"):
+                if prefs.sidebar_style == 'LIST':
+                    modifiers_ui_with_list(context, layout)
+                else:
+                    modifiers_ui_with_stack(context, layout)
+
+            draw_profiler.draw_results(layout, "SIDEBAR")
 
 
 class VIEW3D_PT_ml_vertex_groups(Panel, BasePanel):
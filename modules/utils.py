@@ -1,23 +1,215 @@
+from collections import namedtuple
+
+import numpy as np
+
 import bpy
 from mathutils import Matrix, Vector
 from mathutils.geometry import distance_point_to_plane
 
-from .modifier_categories import ALL_MODIFIERS_NAMES_ICONS_TYPES, HAVE_GIZMO_PROPERTY
+from .modifier_categories import (
+    HAVE_GIZMO_PROPERTY,
+    MODIFIER_REGISTRY,
+    SUPPORT_SHOW_ON_CAGE
+)
 
 
 # Generic utils
 # ======================================================================
 
-def get_editable_bpy_object_props(bpy_object, props_to_ignore={}):
-    props = [getattr(bpy_object, p.identifier) for p in bpy_object.bl_rna.properties
-             if not p.is_readonly and p.identifier not in props_to_ignore]
-    return [p[:] if type(p).__name__ == "bpy_prop_array" else p for p in props]
+RnaSchema = namedtuple(
+    "RnaSchema",
+    ("identifiers", "array_identifiers", "float_identifiers", "pointer_identifiers",
+     "enum_flag_identifiers")
+)
+
+# {RNA struct identifier: RnaSchema}
+_rna_schema_per_struct = {}
+
+
+def get_rna_schema(bpy_object):
+    """Returns the RnaSchema of the RNA struct type of the given object:
+    the identifiers of its writable properties and which of them are
+    arrays, floats, pointers and enum flags.
+
+    The schema is computed once per struct type.
+    """
+    bl_rna = bpy_object.bl_rna
+    schema = _rna_schema_per_struct.get(bl_rna.identifier)
+
+    if schema is None:
+        props = [p for p in bl_rna.properties if not p.is_readonly]
+        schema = RnaSchema(
+            identifiers=tuple(p.identifier for p in props),
+            array_identifiers=frozenset(p.identifier for p in props
+                                        if getattr(p, "array_length", 0)),
+            float_identifiers=frozenset(p.identifier for p in props if p.type == 'FLOAT'),
+            pointer_identifiers=frozenset(p.identifier for p in props if p.type == 'POINTER'),
+            enum_flag_identifiers=frozenset(p.identifier for p in props
+                                            if p.type == 'ENUM' and p.is_enum_flag)
+        )
+        _rna_schema_per_struct[bl_rna.identifier] = schema
+
+    return schema
+
+
+def get_editable_bpy_object_props(bpy_object, props_to_ignore=frozenset()):
+    schema = get_rna_schema(bpy_object)
+    array_identifiers = schema.array_identifiers
+    return [getattr(bpy_object, p)[:] if p in array_identifiers else getattr(bpy_object, p)
+            for p in schema.identifiers if p not in props_to_ignore]
 
 
 def sync_bpy_object_props(source, dest):
-    for p in source.bl_rna.properties:
-        if not p.is_readonly:
-            setattr(dest, p.identifier, getattr(source, p.identifier))
+    for p in get_rna_schema(source).identifiers:
+        setattr(dest, p, getattr(source, p))
+
+
+PropertyChange = namedtuple("PropertyChange", ("object", "modifier", "property", "old", "new"))
+
+# Floats closer than this are considered equal when syncing
+FLOAT_TOLERANCE = 1e-6
+
+
+def _float_values_equal(a, b, is_array):
+    if is_array:
+        # Also handles matrices
+        return np.allclose(np.asarray(a, dtype=float), np.asarray(b, dtype=float),
+                           rtol=0, atol=FLOAT_TOLERANCE)
+    return abs(a - b) <= FLOAT_TOLERANCE
+
+
+def sync_changed_bpy_object_props(source, dest, object=None, props_to_ignore=frozenset(),
+                                  dry_run=False):
+    """Writes only the writable properties of dest whose values differ
+    from the ones of source, so that unchanged properties don't tag
+    updates. Floats are compared with FLOAT_TOLERANCE.
+
+    object is only used for the returned change set, e.g. the object
+    the dest modifier belongs to. With dry_run, nothing is written.
+
+    Returns a list of PropertyChanges in the RNA property order.
+    """
+    schema = get_rna_schema(source)
+    array_identifiers = schema.array_identifiers
+    float_identifiers = schema.float_identifiers
+    changes = []
+
+    for p in schema.identifiers:
+        if p in props_to_ignore:
+            continue
+
+        source_value = getattr(source, p)
+        dest_value = getattr(dest, p)
+        is_array = p in array_identifiers
+
+        if p in float_identifiers:
+            if _float_values_equal(source_value, dest_value, is_array):
+                continue
+        elif is_array:
+            if source_value[:] == dest_value[:]:
+                continue
+        elif source_value == dest_value:
+            continue
+
+        # Copy arrays, so the change set doesn't change with the
+        # properties.
+        changes.append(PropertyChange(
+            object, dest, p,
+            dest_value[:] if is_array else dest_value,
+            source_value[:] if is_array else source_value))
+
+        if not dry_run:
+            setattr(dest, p, source_value)
+
+    # The inputs of Geometry Nodes modifiers are ID properties. Sync
+    # them after the RNA properties, so they are compared against the
+    # inputs of the synced node group.
+    if source.bl_rna.identifier == "NodesModifier":
+        changes.extend(sync_changed_id_props(source, dest, object=object,
+                                             props_to_ignore=props_to_ignore, dry_run=dry_run))
+
+    return changes
+
+
+def get_id_props(bpy_object):
+    """Returns the ID properties of the object as a dict. Groups are
+    converted into dicts and arrays into lists, data-blocks are kept as
+    they are.
+
+    Uses keys() instead of id_properties_ensure(), which doesn't exist
+    before Blender 3.0 and would create the group if it's missing.
+    """
+    props = {}
+
+    for key in bpy_object.keys():
+        value = bpy_object[key]
+        if hasattr(value, "to_dict"):
+            value = value.to_dict()
+        elif hasattr(value, "to_list"):
+            value = value.to_list()
+        props[key] = value
+
+    return props
+
+
+def _id_prop_values_equal(a, b):
+    if isinstance(a, float) and isinstance(b, float):
+        return abs(a - b) <= FLOAT_TOLERANCE
+    if isinstance(a, list) and isinstance(b, list):
+        if len(a) != len(b):
+            return False
+        if any(isinstance(v, float) for v in a):
+            return _float_values_equal(a, b, True)
+    return a == b
+
+
+def sync_changed_id_props(source, dest, object=None, props_to_ignore=frozenset(),
+                          dry_run=False):
+    """Writes the ID properties of source (e.g. the inputs, attribute
+    names and data-block inputs of a Geometry Nodes modifier) whose
+    values differ into dest. Properties that only dest has are kept.
+
+    The whole groups are compared as dicts first, so in the usual case
+    of no changes the properties aren't diffed one by one.
+
+    Returns a list of PropertyChanges. Their property is the
+    ["key"] path of the ID property and old is None for the properties
+    dest doesn't have.
+    """
+    source_props = get_id_props(source)
+    dest_props = get_id_props(dest)
+
+    if source_props == dest_props:
+        return []
+
+    changes = []
+
+    for key, source_value in source_props.items():
+        if key in props_to_ignore:
+            continue
+
+        dest_value = dest_props.get(key)
+
+        if key in dest_props and _id_prop_values_equal(source_value, dest_value):
+            continue
+
+        changes.append(PropertyChange(object, dest, f'["{key}"]', dest_value, source_value))
+
+        if not dry_run:
+            dest[key] = source_value
+
+    # Writing ID properties doesn't tag the owner for an update
+    if changes and not dry_run:
+        dest.id_data.update_tag()
+
+    return changes
+
+
+def print_property_changes(changes):
+    for change in changes:
+        separator = "" if change.property.startswith("[") else "."
+        print(f"{change.object.name}: {change.modifier.name}{separator}{change.property}: "
+              f"{change.old!r} -> {change.new!r}")
 
 
 # ======================================================================
@@ -46,9 +238,44 @@ def favourite_modifiers_names_icons_types():
     """Iterator of tuples of the names, icons and types of the favourite
     modifiers.
     """
-    all_mods_dict = {mod[0]: mod for mod in ALL_MODIFIERS_NAMES_ICONS_TYPES}
+    info_per_name = MODIFIER_REGISTRY.info_per_name
     favorite_mods = get_favourite_modifiers().values()
-    return (all_mods_dict[mod] if mod else (None, None, None) for mod in favorite_mods)
+    return (info_per_name[mod][:3] if mod else (None, None, None) for mod in favorite_mods)
+
+
+# Rows of the favourite modifier buttons, see get_favourite_modifiers_grid
+_favourite_modifiers_grid = None
+
+
+def get_favourite_modifiers_grid():
+    """Returns the favourite modifiers arranged into rows according to
+    favourites_per_row. Each row is a tuple of (name, icon, type) tuples
+    or None for empty slots. Rows with only empty slots are dropped and
+    the icon is already 'NONE' if icons aren't used in favourites.
+
+    The grid is cached until invalidate_favourite_modifiers_grid is
+    called.
+    """
+    global _favourite_modifiers_grid
+
+    if _favourite_modifiers_grid is not None:
+        return _favourite_modifiers_grid
+
+    prefs = bpy.context.preferences.addons["modifier_list"].preferences
+    per_row = int(prefs.favourites_per_row)
+    use_icons = prefs.use_icons_in_favourites
+
+    cells = [(name, icon if use_icons else 'NONE', mod) if name else None
+             for name, icon, mod in favourite_modifiers_names_icons_types()]
+    rows = (tuple(cells[i:i + per_row]) for i in range(0, len(cells), per_row))
+
+    _favourite_modifiers_grid = tuple(row for row in rows if any(row))
+    return _favourite_modifiers_grid
+
+
+def invalidate_favourite_modifiers_grid():
+    global _favourite_modifiers_grid
+    _favourite_modifiers_grid = None
 
 
 def get_ml_active_object():
@@ -75,6 +302,87 @@ def is_modifier_local(object, modifier):
     return True
 
 
+def get_show_on_cage_states(modifiers):
+    """Returns a tuple of (can_show_on_cage, is_later_show_on_cage_on)
+    pairs, one per modifier in the given modifier stack.
+
+    can_show_on_cage is False if the modifier doesn't support
+    show_on_cage or if some earlier modifier has show_in_editmode on but
+    doesn't support show_on_cage.
+
+    is_later_show_on_cage_on is True if some later modifier is visible
+    in the viewport and has both show_in_editmode and show_on_cage on.
+
+    The states of the whole stack are computed with one forward and one
+    backward sweep, so looking them up per modifier is O(1).
+    """
+    mods = list(modifiers)
+    supported = [mod.type in SUPPORT_SHOW_ON_CAGE for mod in mods]
+
+    can_show_on_cage = []
+    is_earlier_show_in_editmode_on = False
+
+    for mod, is_supported in zip(mods, supported):
+        can_show_on_cage.append(is_supported and not is_earlier_show_in_editmode_on)
+        if mod.show_in_editmode and not is_supported:
+            is_earlier_show_in_editmode_on = True
+
+    is_later_show_on_cage_on = [False] * len(mods)
+    is_on = False
+
+    for i in range(len(mods) - 1, -1, -1):
+        is_later_show_on_cage_on[i] = is_on
+        mod = mods[i]
+        if mod.show_viewport and mod.show_in_editmode and mod.show_on_cage:
+            is_on = True
+
+    return tuple(zip(can_show_on_cage, is_later_show_on_cage_on))
+
+
+def replace_mesh_with_evaluated_mesh(context, objects):
+    """Assigns the evaluated mesh of the first of the given objects,
+    which need to share their mesh, to all of them. The modifiers are
+    left untouched.
+
+    The old mesh is removed if no other object uses it, in which case
+    the new mesh gets its name.
+
+    Like with modifier_apply, the custom properties and the fake user of
+    the old mesh are kept. Animation data isn't copied, so meshes with
+    it should be applied with modifier_apply instead.
+
+    Returns False if the first object isn't evaluated (e.g. it's hidden
+    in the viewport), in which case nothing is changed.
+    """
+    depsgraph = context.evaluated_depsgraph_get()
+    ob_eval = objects[0].evaluated_get(depsgraph)
+
+    if not ob_eval.is_evaluated:
+        return False
+
+    old_mesh = objects[0].data
+    new_mesh = bpy.data.meshes.new_from_object(ob_eval, preserve_all_data_layers=True,
+                                               depsgraph=depsgraph)
+
+    for key, value in get_id_props(old_mesh).items():
+        new_mesh[key] = value
+
+    new_mesh.use_fake_user = old_mesh.use_fake_user
+
+    for ob in objects:
+        ob.data = new_mesh
+
+    mesh_name = old_mesh.name
+
+    # The fake user moved to the new mesh
+    if old_mesh.users == int(old_mesh.use_fake_user):
+        bpy.data.meshes.remove(old_mesh)
+
+    new_mesh.name = mesh_name
+
+    return True
+
+
 def is_modifier_disabled(mod):
     """Checks if the name of the modifier should be diplayed with a red
     background.
@@ -0,0 +1,77 @@
+import bpy
+
+from ...modules.background_apply_utils import (
+    can_apply_in_background,
+    cleanup,
+    import_results,
+    split_into_shards,
+    start_workers
+)
+
+
+def test_shards_are_balanced_by_vertex_count():
+    meshes = []
+    obs = []
+    for i, vert_count in enumerate((100, 60, 50, 10)):
+        mesh = bpy.data.meshes.new(f"mesh_{i}")
+        mesh.vertices.add(vert_count)
+        meshes.append(mesh)
+        obs.append(bpy.data.objects.new(f"ob_{i}", mesh))
+
+    shards = split_into_shards(obs, 2)
+
+    assert sorted(sorted(ob.name for ob in shard) for shard in shards) == [
+        ["ob_0", "ob_3"], ["ob_1", "ob_2"]]
+    assert len(split_into_shards(obs, 8)) == 4
+
+    for ob in obs:
+        bpy.data.objects.remove(ob)
+    for mesh in meshes:
+        bpy.data.meshes.remove(mesh)
+
+
+def test_objects_with_multi_user_data_are_not_applied_in_background():
+    mesh = bpy.data.meshes.new("mesh")
+    obs = [bpy.data.objects.new(f"ob_{i}", mesh) for i in range(2)]
+    for ob in obs:
+        ob.modifiers.new("Subdivision", 'SUBSURF')
+
+    assert not can_apply_in_background(obs[0])
+
+    bpy.data.objects.remove(obs[1])
+
+    assert can_apply_in_background(obs[0])
+
+    bpy.data.objects.remove(obs[0])
+    bpy.data.meshes.remove(mesh)
+
+
+def test_modifiers_are_applied_in_a_worker():
+    mesh = bpy.data.meshes.new("cube")
+    mesh.from_pydata(
+        [(x, y, z) for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)], [],
+        [(0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1), (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3)])
+    material = bpy.data.materials.new("Material")
+    mesh.materials.append(material)
+    ob = bpy.data.objects.new("cube", mesh)
+    ob.modifiers.new("Subdivision", 'SUBSURF').levels = 1
+
+    temp_dir, jobs = start_workers([ob], 1, bpy.context.scene.frame_current, False)
+
+    try:
+        jobs[0].process.wait()
+        assert import_results(jobs[0]) == (1, [])
+    finally:
+        cleanup(temp_dir)
+
+    new_mesh = ob.data
+    assert not ob.modifiers
+    assert len(new_mesh.vertices) == 26
+    assert new_mesh.name == "cube"
+    # The slot gets the original material, not a copy or another
+    # material with the same name
+    assert new_mesh.materials[0] == material
+
+    bpy.data.objects.remove(ob)
+    bpy.data.meshes.remove(new_mesh)
+    bpy.data.materials.remove(material)
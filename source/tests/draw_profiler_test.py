@@ -0,0 +1,40 @@
+import pytest
+
+from ...modules.ui import draw_profiler
+
+
+@pytest.fixture
+def profiler():
+    draw_profiler.set_enabled(True)
+    yield draw_profiler
+    draw_profiler.set_enabled(False)
+
+
+def test_disabled_profiler_records_nothing():
+    draw_profiler.set_enabled(False)
+
+    with draw_profiler.panel("POPUP"):
+        with draw_profiler.section("LIST"):
+            pass
+
+    assert draw_profiler.get_results() == {}
+
+
+def test_sections_are_recorded_per_panel(profiler):
+    with profiler.panel("POPUP"):
+        with profiler.section("LIST"):
+            pass
+
+    results = profiler.get_results()
+
+    assert set(results) == {"POPUP"}
+    assert set(results["POPUP"]) == {"LIST", "TOTAL"}
+    assert results["POPUP"]["LIST"]["samples"] == 1
+
+
+def test_samples_are_kept_in_ring_buffer(profiler):
+    for _ in range(profiler.SAMPLE_COUNT + 10):
+        with profiler.panel("SIDEBAR"):
+            pass
+
+    assert profiler.get_results()["SIDEBAR"]["TOTAL"]["samples"] == profiler.SAMPLE_COUNT
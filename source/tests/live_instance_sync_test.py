@@ -0,0 +1,49 @@
+import pytest
+
+import bpy
+
+from ...modules import live_instance_sync
+
+
+@pytest.fixture
+def instances():
+    mesh = bpy.data.meshes.new("mesh")
+    obs = [bpy.data.objects.new(f"ob_{i}", mesh) for i in range(2)]
+    for ob in obs:
+        bpy.context.scene.collection.objects.link(ob)
+    yield obs
+
+    live_instance_sync._enabled = False
+    live_instance_sync._clear()
+    for ob in bpy.data.objects[:]:
+        if ob.data == mesh:
+            bpy.data.objects.remove(ob)
+    bpy.data.meshes.remove(mesh)
+
+
+def test_instances_cache_is_renewed_when_users_change(instances):
+    source_ob, other_ob = instances
+
+    assert live_instance_sync._get_instances(source_ob) == [other_ob]
+
+    new_ob = bpy.data.objects.new("ob_2", source_ob.data)
+
+    assert set(live_instance_sync._get_instances(source_ob)) == {other_ob, new_ob}
+
+
+def test_only_edited_properties_are_pushed(instances):
+    source_ob, dest_ob = instances
+    source_mod = source_ob.modifiers.new("Bevel", 'BEVEL')
+    dest_mod = dest_ob.modifiers.new("Bevel", 'BEVEL')
+    source_mod.width = 0.5
+    source_mod.segments = 3
+    bpy.context.view_layer.objects.active = source_ob
+
+    live_instance_sync._enabled = True
+    live_instance_sync._edited_props_per_modifier["Bevel"] = {"width"}
+    live_instance_sync._push_edits()
+
+    assert dest_mod.width == pytest.approx(0.5)
+    # Not edited, so the local difference is kept
+    assert dest_mod.segments == 1
+    assert not live_instance_sync._edited_props_per_modifier
@@ -0,0 +1,32 @@
+from ...modules import modifier_categories
+from ...modules.modifier_categories import MODIFIER_REGISTRY
+
+
+def test_registry_covers_all_modifiers():
+    all_mods = modifier_categories.ALL_MODIFIERS_NAMES_ICONS_TYPES
+
+    assert len(MODIFIER_REGISTRY.info_per_type) == len(all_mods)
+    for name, icon, mod in all_mods:
+        info = MODIFIER_REGISTRY.info_per_type[mod]
+        assert (info.name, info.icon, info.type) == (name, icon, mod)
+        assert MODIFIER_REGISTRY.info_per_name[name] is info
+
+
+def test_registry_categories_match_lists():
+    types_per_category = MODIFIER_REGISTRY.types_per_category
+
+    assert types_per_category['MODIFY'] == {
+        mod for _, _, mod in modifier_categories.ALL_MODIFY_NAMES_ICONS_TYPES}
+    assert types_per_category['GENERATE'] == {
+        mod for _, _, mod in modifier_categories.ALL_GENERATE_NAMES_ICONS_TYPES}
+    assert types_per_category['DEFORM'] == {
+        mod for _, _, mod in modifier_categories.ALL_DEFORM_NAMES_ICONS_TYPES}
+    assert types_per_category['PHYSICS'] == {
+        mod for _, _, mod in modifier_categories.ALL_SIMULATE_NAMES_ICONS_TYPES}
+
+
+def test_registry_search_items_are_sorted():
+    search_items = MODIFIER_REGISTRY.search_items_per_object_type['MESH']
+
+    assert list(search_items) == sorted(modifier_categories.MESH_ALL_NAMES_ICONS_TYPES,
+                                        key=lambda mod: mod[0])
@@ -0,0 +1,54 @@
+import bpy
+
+from ...modules import modifier_status_cache
+from ...modules.modifier_status_cache import (
+    invalidate_object,
+    is_modifier_disabled_cached,
+    scan_disabled
+)
+
+
+def test_particle_instance_status_is_invalidated_with_the_emitter():
+    meshes = bpy.data.meshes
+    obs = bpy.data.objects
+    emitter = obs.new("emitter", meshes.new("emitter"))
+    ob = obs.new("ob", meshes.new("ob"))
+    particle_system_mod = emitter.modifiers.new("ParticleSystem", 'PARTICLE_SYSTEM')
+    mod = ob.modifiers.new("ParticleInstance", 'PARTICLE_INSTANCE')
+    mod.object = emitter
+
+    assert not is_modifier_disabled_cached(ob, mod)
+
+    # Hiding the particle system disables the modifier, but the cached
+    # status stays until the emitter is invalidated.
+    particle_system_mod.show_viewport = False
+    assert not is_modifier_disabled_cached(ob, mod)
+
+    invalidate_object(emitter.as_pointer())
+    assert is_modifier_disabled_cached(ob, mod)
+
+    modifier_status_cache.clear()
+    for ob in (emitter, ob):
+        mesh = ob.data
+        obs.remove(ob)
+        meshes.remove(mesh)
+
+
+def test_scan_disabled_returns_disabled_modifiers_of_all_objects():
+    meshes = bpy.data.meshes
+    obs = bpy.data.objects
+    ob_1 = obs.new("ob_1", meshes.new("ob_1"))
+    ob_2 = obs.new("ob_2", meshes.new("ob_2"))
+    ob_1.modifiers.new("Subdivision", 'SUBSURF')
+    # Shrinkwrap and Boolean are disabled without a target
+    shrinkwrap = ob_1.modifiers.new("Shrinkwrap", 'SHRINKWRAP')
+    boolean = ob_2.modifiers.new("Boolean", 'BOOLEAN')
+    ob_2.modifiers.new("Bevel", 'BEVEL')
+
+    assert scan_disabled([ob_1, ob_2]) == [(ob_1, shrinkwrap), (ob_2, boolean)]
+
+    modifier_status_cache.clear()
+    for ob in (ob_1, ob_2):
+        mesh = ob.data
+        obs.remove(ob)
+        meshes.remove(mesh)
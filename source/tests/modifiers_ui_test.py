@@ -0,0 +1,76 @@
+from types import SimpleNamespace
+
+import pytest
+
+import bpy
+
+from ...modules import modifier_status_cache
+from ...modules.ui.modifiers_ui import OBJECT_UL_ml_modifier_list
+
+
+BITFLAG_FILTER_ITEM = 1 << 30
+
+
+@pytest.fixture
+def mesh_object():
+    mesh = bpy.data.meshes.new("mesh")
+    ob = bpy.data.objects.new("mesh", mesh)
+    mods = ob.modifiers
+    mods.new("Bevel", 'BEVEL')
+    mods.new("mirror", 'MIRROR').show_viewport = False
+    mods.new("Displace", 'DISPLACE')
+    # Disabled without a target
+    mods.new("Shrinkwrap", 'SHRINKWRAP')
+    mods.new("Another Bevel", 'BEVEL')
+    modifier_status_cache.clear()
+    yield ob
+
+    modifier_status_cache.clear()
+    bpy.data.objects.remove(ob)
+    bpy.data.meshes.remove(mesh)
+
+
+def filter_items(object, **settings):
+    """Calls filter_items with a stand-in for the list, using the
+    default filter settings apart from the given ones.
+    """
+    ui_list = SimpleNamespace(
+        filter_name="",
+        filter_type='ALL',
+        filter_category='ALL',
+        filter_visibility='ALL',
+        filter_disabled_only=False,
+        sort_by='STACK',
+        bitflag_filter_item=BITFLAG_FILTER_ITEM)
+    for key, value in settings.items():
+        setattr(ui_list, key, value)
+
+    return OBJECT_UL_ml_modifier_list.filter_items(ui_list, bpy.context, object, "modifiers")
+
+
+def shown_indices(object, **settings):
+    flt_flags, _ = filter_items(object, **settings)
+    return [i for i, flag in enumerate(flt_flags) if flag & BITFLAG_FILTER_ITEM]
+
+
+def test_no_filtering_or_sorting_by_default(mesh_object):
+    assert filter_items(mesh_object) == ([], [])
+
+
+def test_filter_flags(mesh_object):
+    assert shown_indices(mesh_object, filter_name="BEVEL") == [0, 4]
+    assert shown_indices(mesh_object, filter_type='BEVEL') == [0, 4]
+    assert shown_indices(mesh_object, filter_category='DEFORM') == [2, 3]
+    assert shown_indices(mesh_object, filter_visibility='VISIBLE') == [0, 2, 3, 4]
+    assert shown_indices(mesh_object, filter_visibility='HIDDEN') == [1]
+    assert shown_indices(mesh_object, filter_disabled_only=True) == [3]
+    assert shown_indices(mesh_object, filter_name="bevel", filter_visibility='HIDDEN') == []
+
+
+def test_sort_order(mesh_object):
+    # flt_neworder maps the stack index of each modifier to its new
+    # index. By name: Another Bevel, Bevel, Displace, mirror, Shrinkwrap
+    assert filter_items(mesh_object, sort_by='NAME')[1] == [1, 3, 2, 4, 0]
+    # By type, keeping the stack order within a type: Bevel, Another
+    # Bevel, Displace, mirror, Shrinkwrap
+    assert filter_items(mesh_object, sort_by='TYPE')[1] == [0, 3, 2, 4, 1]
@@ -0,0 +1,29 @@
+import bpy
+
+from ...modules.multiuser_data_modifier_apply_utils import LinkedObjectDataChanger
+
+
+def test_other_instances_get_new_data():
+    mesh = bpy.data.meshes.new("mesh")
+    obs = [bpy.data.objects.new(f"ob_{i}", mesh) for i in range(3)]
+    # An object not using the data
+    other_mesh = bpy.data.meshes.new("other_mesh")
+    other_ob = bpy.data.objects.new("other_ob", other_mesh)
+
+    changer = LinkedObjectDataChanger(obs[0])
+    changer.make_active_instance_data_unique()
+
+    assert set(changer.other_instances) == set(obs[1:])
+    new_mesh = obs[0].data
+    assert new_mesh != mesh
+
+    changer.assign_new_data_to_other_instances()
+
+    assert all(ob.data == new_mesh for ob in obs)
+    assert "mesh" not in bpy.data.meshes
+    assert other_ob.data == other_mesh
+
+    for ob in obs + [other_ob]:
+        bpy.data.objects.remove(ob)
+    bpy.data.meshes.remove(new_mesh)
+    bpy.data.meshes.remove(other_mesh)
@@ -0,0 +1,119 @@
+import pytest
+
+import bpy
+
+from ...modules.operators.object_apply_all_modifiers import (
+    apply_all_modifiers_of_group,
+    group_objects_by_data_and_modifier_stack
+)
+
+
+@pytest.fixture
+def shared_mesh_objects():
+    mesh = bpy.data.meshes.new("mesh")
+    mesh.from_pydata([(0, 0, 0), (1, 0, 0), (0, 1, 0)], [], [(0, 1, 2)])
+    obs = [bpy.data.objects.new(f"ob_{i}", mesh) for i in range(3)]
+    for ob in obs:
+        bpy.context.scene.collection.objects.link(ob)
+    yield obs
+
+    for ob in obs:
+        data = ob.data
+        bpy.data.objects.remove(ob)
+        if not data.users:
+            bpy.data.meshes.remove(data)
+
+
+def test_objects_with_identical_stacks_are_grouped(shared_mesh_objects):
+    for ob in shared_mesh_objects:
+        ob.modifiers.new("Solidify", 'SOLIDIFY')
+
+    groups = group_objects_by_data_and_modifier_stack(shared_mesh_objects)
+
+    assert groups == [shared_mesh_objects]
+
+
+def test_groups_are_split_by_stack(shared_mesh_objects):
+    for ob in shared_mesh_objects:
+        ob.modifiers.new("Solidify", 'SOLIDIFY')
+    shared_mesh_objects[2].modifiers["Solidify"].thickness = 0.5
+
+    groups = group_objects_by_data_and_modifier_stack(shared_mesh_objects)
+
+    assert groups == [shared_mesh_objects[:2], shared_mesh_objects[2:]]
+
+
+def test_group_shares_applied_mesh(shared_mesh_objects):
+    for ob in shared_mesh_objects:
+        ob.modifiers.new("Solidify", 'SOLIDIFY')
+    group = shared_mesh_objects[:2]
+
+    assert apply_all_modifiers_of_group(bpy.context, group)
+
+    assert group[0].data == group[1].data
+    assert len(group[0].data.vertices) == 6
+    assert not group[0].modifiers and not group[1].modifiers
+    # The object outside the group keeps the original mesh
+    assert len(shared_mesh_objects[2].data.vertices) == 3
+
+
+def test_applied_mesh_keeps_custom_properties_and_fake_user(shared_mesh_objects):
+    mesh = shared_mesh_objects[0].data
+    mesh["weight"] = 0.5
+    mesh["axis"] = (1, 0, 0)
+    mesh.use_fake_user = True
+    for ob in shared_mesh_objects:
+        ob.modifiers.new("Solidify", 'SOLIDIFY')
+
+    assert apply_all_modifiers_of_group(bpy.context, shared_mesh_objects)
+
+    new_mesh = shared_mesh_objects[0].data
+    assert len(new_mesh.vertices) == 6
+    # The old mesh is removed despite its fake user
+    assert new_mesh.name == "mesh"
+    assert new_mesh["weight"] == pytest.approx(0.5)
+    assert new_mesh["axis"].to_list() == [1, 0, 0]
+    assert new_mesh.use_fake_user
+
+    new_mesh.use_fake_user = False
+
+
+def test_groups_are_split_by_geometry_nodes_inputs(shared_mesh_objects):
+    for ob in shared_mesh_objects:
+        ob.modifiers.new("GeometryNodes", 'NODES')["Input_2"] = 1.0
+    shared_mesh_objects[2].modifiers["GeometryNodes"]["Input_2"] = 2.0
+
+    groups = group_objects_by_data_and_modifier_stack(shared_mesh_objects)
+
+    assert groups == [shared_mesh_objects[:2], shared_mesh_objects[2:]]
+
+
+def test_groups_are_split_by_transform_with_global_texture_coords(shared_mesh_objects):
+    for ob in shared_mesh_objects:
+        ob.modifiers.new("Displace", 'DISPLACE').texture_coords = 'GLOBAL'
+    shared_mesh_objects[2].location.x = 1
+    bpy.context.view_layer.update()
+
+    groups = group_objects_by_data_and_modifier_stack(shared_mesh_objects)
+
+    assert groups == [shared_mesh_objects[:2], shared_mesh_objects[2:]]
+
+
+def test_interruptible_apply_all_modifiers_operator(shared_mesh_objects):
+    op = bpy.ops.view3d.ml_apply_all_modifiers_modal
+    # The properties of the shared base class are registered
+    assert "multi_user_data_apply_method" in op.get_rna_type().properties
+
+    for ob in shared_mesh_objects:
+        ob.modifiers.new("Solidify", 'SOLIDIFY')
+        ob.select_set(True)
+    shared_mesh_objects[2].modifiers["Solidify"].thickness = 0.5
+    bpy.context.view_layer.objects.active = shared_mesh_objects[0]
+
+    # Like a redo after stopping when the first group was applied
+    assert op(applied_group_count=1) == {'FINISHED'}
+    assert sorted(bool(ob.modifiers) for ob in shared_mesh_objects) in (
+        [False, False, True], [False, True, True])
+
+    assert op() == {'FINISHED'}
+    assert not any(ob.modifiers for ob in shared_mesh_objects)
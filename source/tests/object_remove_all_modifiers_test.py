@@ -0,0 +1,18 @@
+import bpy
+
+from ...modules.operators.object_remove_all_modifiers import remove_local_modifiers
+
+
+def test_all_modifiers_of_local_object_are_removed():
+    mesh = bpy.data.meshes.new("mesh")
+    ob = bpy.data.objects.new("ob", mesh)
+    for mod_type in ('BEVEL', 'SUBSURF', 'DISPLACE'):
+        ob.modifiers.new(mod_type, mod_type)
+
+    assert remove_local_modifiers(ob) == (3, 0)
+    assert not ob.modifiers
+
+    assert remove_local_modifiers(ob) == (0, 0)
+
+    bpy.data.objects.remove(ob)
+    bpy.data.meshes.remove(mesh)
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+import bpy
+
+from ...modules.operators.object_save_modifiers_as_shape_keys import (
+    save_modifiers_as_shape_keys
+)
+
+
+@pytest.fixture
+def triangle_object():
+    mesh = bpy.data.meshes.new("mesh")
+    mesh.from_pydata([(0, 0, 0), (1, 0, 0), (0, 1, 0)], [], [(0, 1, 2)])
+    ob = bpy.data.objects.new("ob", mesh)
+    bpy.context.scene.collection.objects.link(ob)
+    yield ob
+
+    bpy.data.objects.remove(ob)
+    bpy.data.meshes.remove(mesh)
+
+
+def test_each_modifier_is_saved_in_isolation(triangle_object):
+    ob = triangle_object
+    displace_1 = ob.modifiers.new("Displace 1", 'DISPLACE')
+    displace_2 = ob.modifiers.new("Displace 2", 'DISPLACE')
+
+    saved = save_modifiers_as_shape_keys(bpy.context, {ob: [displace_1, displace_2]})
+
+    assert saved == {ob: ["Displace 1", "Displace 2"]}
+    key_blocks = ob.data.shape_keys.key_blocks
+    assert [key.name for key in key_blocks] == ["Basis", "Displace 1", "Displace 2"]
+
+    for key in key_blocks[1:]:
+        coords = np.empty(len(key.data) * 3, dtype=np.float32)
+        key.data.foreach_get("co", coords)
+        # Only the modifier's own displacement along the normal
+        assert np.allclose(np.abs(coords[2::3]), 0.5)
+
+    assert displace_1.show_viewport and displace_2.show_viewport
+
+
+def test_modifiers_changing_vertex_count_are_skipped(triangle_object):
+    ob = triangle_object
+    # Not a deform modifier, but doesn't matter for the function
+    solidify = ob.modifiers.new("Solidify", 'SOLIDIFY')
+
+    saved = save_modifiers_as_shape_keys(bpy.context, {ob: [solidify]})
+
+    assert saved == {ob: []}
+    assert ob.data.shape_keys is None
@@ -0,0 +1,54 @@
+import bpy
+
+from ...modules.operators.object_sync_all_modifiers_between_instances import (
+    modifier_stack_edit_script,
+    sync_modifier_stack_structure
+)
+
+
+def test_edit_script_keeps_common_modifiers():
+    source_keys = [('BEVEL', "Bevel"), ('SURFACE_DEFORM', "SurfaceDeform"),
+                   ('SUBSURF', "Subdivision")]
+    dest_keys = [('SURFACE_DEFORM', "SurfaceDeform"), ('ARRAY', "Array"),
+                 ('SUBSURF', "Subdivision")]
+
+    matches, deletes, inserts = modifier_stack_edit_script(source_keys, dest_keys)
+
+    assert matches == [(1, 0), (2, 2)]
+    assert deletes == [1]
+    assert inserts == [0]
+
+
+def test_edit_script_of_identical_stacks_is_empty():
+    keys = [('BEVEL', "Bevel"), ('SUBSURF', "Subdivision")]
+
+    assert modifier_stack_edit_script(keys, list(keys)) == ([(0, 0), (1, 1)], [], [])
+
+
+def test_stack_structure_sync_keeps_matched_modifiers():
+    mesh = bpy.data.meshes.new("mesh")
+    source_ob = bpy.data.objects.new("source", mesh)
+    dest_ob = bpy.data.objects.new("dest", mesh)
+
+    for name, mod_type in (("Bevel", 'BEVEL'), ("SurfaceDeform", 'SURFACE_DEFORM'),
+                           ("Subdivision", 'SUBSURF')):
+        source_ob.modifiers.new(name, mod_type)
+    for name, mod_type in (("SurfaceDeform", 'SURFACE_DEFORM'), ("Array", 'ARRAY'),
+                           ("Subdivision", 'SUBSURF')):
+        dest_ob.modifiers.new(name, mod_type)
+
+    source_ob.modifiers["Subdivision"].levels = 3
+    surface_deform_pointer = dest_ob.modifiers["SurfaceDeform"].as_pointer()
+
+    changes, removed_count, added_count = sync_modifier_stack_structure(source_ob, dest_ob)
+
+    assert (removed_count, added_count) == (1, 1)
+    assert [c.property for c in changes] == ["levels"]
+    assert [mod.name for mod in dest_ob.modifiers] == ["Bevel", "SurfaceDeform", "Subdivision"]
+    # The matched modifier isn't recreated, so e.g. its bind data is kept
+    assert dest_ob.modifiers["SurfaceDeform"].as_pointer() == surface_deform_pointer
+    assert dest_ob.modifiers["Subdivision"].levels == 3
+
+    bpy.data.objects.remove(source_ob)
+    bpy.data.objects.remove(dest_ob)
+    bpy.data.meshes.remove(mesh)
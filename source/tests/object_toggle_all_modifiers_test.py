@@ -0,0 +1,33 @@
+import pytest
+
+import bpy
+
+from ...modules.operators.object_toggle_all_modifiers import set_modifiers_visibility
+
+
+@pytest.fixture
+def mesh_object():
+    mesh = bpy.data.meshes.new("mesh")
+    ob = bpy.data.objects.new("ob", mesh)
+    for mod_type in ('SUBSURF', 'BEVEL', 'DISPLACE', 'COLLISION'):
+        ob.modifiers.new(mod_type, mod_type)
+    yield ob
+
+    bpy.data.objects.remove(ob)
+    bpy.data.meshes.remove(mesh)
+
+
+def test_collision_modifiers_are_not_toggled(mesh_object):
+    assert set_modifiers_visibility([mesh_object], "show_viewport", False) == 1
+
+    assert [mod.show_viewport for mod in mesh_object.modifiers] == [False, False, False, True]
+
+
+def test_only_given_types_are_toggled(mesh_object):
+    set_modifiers_visibility([mesh_object], "show_render", False, {'SUBSURF', 'BEVEL'})
+
+    assert [mod.show_render for mod in mesh_object.modifiers] == [False, False, True, True]
+
+
+def test_unchanged_objects_are_not_counted(mesh_object):
+    assert set_modifiers_visibility([mesh_object], "show_viewport", True) == 0
@@ -0,0 +1,133 @@
+import pytest
+
+import bpy
+
+from ...modules.utils import (
+    get_editable_bpy_object_props,
+    get_rna_schema,
+    get_show_on_cage_states,
+    sync_bpy_object_props,
+    sync_changed_bpy_object_props
+)
+
+
+@pytest.fixture
+def mesh_object():
+    meshes = bpy.data.meshes
+    obs = bpy.data.objects
+    mesh = meshes.new(name="mesh")
+    ob = obs.new("mesh", mesh)
+    yield ob
+
+    obs.remove(ob)
+    meshes.remove(mesh)
+
+
+def test_show_on_cage_states_empty_stack(mesh_object):
+    assert get_show_on_cage_states(mesh_object.modifiers) == ()
+
+
+def test_show_on_cage_states_blocked_by_earlier_unsupported_modifier(mesh_object):
+    mods = mesh_object.modifiers
+    mods.new("Subdivision", 'SUBSURF')
+    mods.new("Bevel", 'BEVEL')
+    mods.new("Mirror", 'MIRROR')
+
+    # Bevel doesn't support show_on_cage, so when it's shown in edit
+    # mode, the modifiers after it can't be shown on cage.
+    mods["Bevel"].show_in_editmode = True
+    states = get_show_on_cage_states(mods)
+    assert [can_show for can_show, _ in states] == [True, False, False]
+
+    mods["Bevel"].show_in_editmode = False
+    states = get_show_on_cage_states(mods)
+    assert [can_show for can_show, _ in states] == [True, False, True]
+
+
+def test_show_on_cage_states_later_show_on_cage_on(mesh_object):
+    mods = mesh_object.modifiers
+    for i in range(3):
+        mod = mods.new(f"Mirror {i}", 'MIRROR')
+        mod.show_in_editmode = True
+        mod.show_on_cage = False
+
+    mods[2].show_on_cage = True
+    states = get_show_on_cage_states(mods)
+    assert [is_later_on for _, is_later_on in states] == [True, True, False]
+
+    mods[2].show_viewport = False
+    states = get_show_on_cage_states(mods)
+    assert [is_later_on for _, is_later_on in states] == [False, False, False]
+
+
+def test_rna_schema_flags_property_kinds(mesh_object):
+    mod = mesh_object.modifiers.new("Displace", 'DISPLACE')
+    schema = get_rna_schema(mod)
+
+    assert "strength" in schema.identifiers
+    assert "rna_type" not in schema.identifiers
+    assert "texture" in schema.pointer_identifiers
+    assert get_rna_schema(mesh_object.modifiers.new("Displace.001", 'DISPLACE')) is schema
+
+    mirror_schema = get_rna_schema(mesh_object.modifiers.new("Mirror", 'MIRROR'))
+    assert "use_axis" in mirror_schema.array_identifiers
+
+
+def test_sync_bpy_object_props(mesh_object):
+    source = mesh_object.modifiers.new("Mirror", 'MIRROR')
+    dest = mesh_object.modifiers.new("Mirror.001", 'MIRROR')
+    source.use_axis = (True, True, False)
+    source.merge_threshold = 0.5
+
+    assert get_editable_bpy_object_props(source, {"name"}) != get_editable_bpy_object_props(
+        dest, {"name"})
+
+    sync_bpy_object_props(source, dest)
+
+    assert tuple(dest.use_axis) == (True, True, False)
+    # The names stay unique on the same object
+    assert get_editable_bpy_object_props(source, {"name"}) == get_editable_bpy_object_props(
+        dest, {"name"})
+
+
+def test_sync_changed_bpy_object_props_writes_only_changes(mesh_object):
+    source = mesh_object.modifiers.new("Bevel", 'BEVEL')
+    dest = mesh_object.modifiers.new("Bevel.001", 'BEVEL')
+    source.width = 0.5
+    # Within the tolerance
+    dest.angle_limit = source.angle_limit + 1e-8
+
+    changes = sync_changed_bpy_object_props(source, dest, object=mesh_object, dry_run=True,
+                                            props_to_ignore={"name"})
+
+    assert [(c.object, c.modifier, c.property, c.new) for c in changes] == [
+        (mesh_object, dest, "width", pytest.approx(0.5))]
+    assert dest.width != pytest.approx(0.5)
+
+    sync_changed_bpy_object_props(source, dest, props_to_ignore={"name"})
+
+    assert dest.width == pytest.approx(0.5)
+    assert not sync_changed_bpy_object_props(source, dest, props_to_ignore={"name"})
+
+
+def test_sync_changed_bpy_object_props_syncs_geometry_nodes_inputs(mesh_object):
+    source = mesh_object.modifiers.new("GeometryNodes", 'NODES')
+    dest = mesh_object.modifiers.new("GeometryNodes.001", 'NODES')
+    source["Input_2"] = 0.5
+    source["Input_3"] = mesh_object
+    source["Output_4_attribute_name"] = "weight"
+    # Within the tolerance
+    dest["Input_2"] = 0.5 + 1e-8
+
+    changes = sync_changed_bpy_object_props(source, dest, object=mesh_object, dry_run=True,
+                                            props_to_ignore={"name"})
+
+    assert [(c.property, c.old, c.new) for c in changes] == [
+        ('["Input_3"]', None, mesh_object), ('["Output_4_attribute_name"]', None, "weight")]
+    assert "Input_3" not in dest
+
+    sync_changed_bpy_object_props(source, dest, props_to_ignore={"name"})
+
+    assert dest["Input_3"] == mesh_object
+    assert dest["Output_4_attribute_name"] == "weight"
+    assert not sync_changed_bpy_object_props(source, dest, props_to_ignore={"name"})